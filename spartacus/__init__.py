@@ -18,8 +18,29 @@ from .src.checks import (
 )
 
 from .src.row_data import RowData
+from .src.dataset_root import DatasetRoot
+from .src.study_registry import StudyRegistry, write_manifest
 from .src.load import load, Spartacus, load_subdataset
-from .src.utils import compute_rotation_matrix_from_axes, flip_rotations
+from .src.kinematic_chain import derive_joint_series
+from .src.scapulohumeral_rhythm import scapulohumeral_rhythm
+from .src.corridor import compute_corridors
+from .src.bootstrap import bootstrap_ci
+from .src.rotation_average import average_rotations
+from .src.reexpression import reexpress_rotation_series
+from .src.quality import sample_quality, quality_summary
+from .src.confidence import confidence_table
+from .src.sensitivity import coefficient_grid, sensitivity_sweep
+from .src.monte_carlo import propagate_correction_uncertainty
+from .src.synthetic import generate_synthetic_dataset
+from .src.watch import DatasetWatcher
+from .src.utils import (
+    compute_rotation_matrix_from_axes,
+    flip_rotations,
+    flip_rotations_batch,
+    continuous_rotations_batch,
+    unwrap_batch,
+    gradient_batch,
+)
 from .src.joint import Joint
 from .src.biomech_system import BiomechCoordinateSystem
 from .src.checks import check_same_orientation
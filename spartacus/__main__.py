@@ -0,0 +1,128 @@
+"""
+The command line of the dataset, e.g.
+
+    spartacus build --root /path/to/dataset_root --output /path/to/exports --jobs 4 --format parquet
+    spartacus watch --root /path/to/dataset_root --gui
+
+or python -m spartacus build ...
+
+The build exits with 1 if the validation of the rows fails, see build_exports, and with 2 on wrong arguments.
+"""
+
+import argparse
+import cProfile
+import os
+import pstats
+import sys
+import webbrowser
+
+from .src.dataset_root import DATASET_ROOT_ENVIRONMENT_VARIABLE
+from .src.incremental import FILE_FORMATS
+
+
+def watch(arguments: argparse.Namespace) -> int:
+    """Rebuild the series of the rows whose files change, and show them in the GUI if requested"""
+    if arguments.root is not None:
+        # the root of the whole session, including the GUI reading the exports of the default root
+        os.environ[DATASET_ROOT_ENVIRONMENT_VARIABLE] = str(arguments.root)
+
+    from .src.watch import DatasetWatcher
+
+    dataset_watcher = DatasetWatcher()
+    if not arguments.gui:
+        try:
+            dataset_watcher.run(interval=arguments.interval)
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    from .plots import gui
+
+    gui.watch_app(dataset_watcher, watch_interval=arguments.interval)
+    webbrowser.open(f"http://127.0.0.1:{arguments.port}/")
+    gui.app.run(port=arguments.port)
+    return 0
+
+
+def build(arguments: argparse.Namespace) -> int:
+    """Build the exports of the dataset root, 1 if the validation fails"""
+    from .src.build import build_exports
+
+    profiler = cProfile.Profile() if arguments.profile is not None else None
+    kwargs = dict(
+        dataset_root=arguments.root,
+        export_folder=arguments.output,
+        file_format=arguments.format,
+        n_jobs=arguments.jobs,
+        incremental=arguments.incremental,
+        studies=arguments.studies,
+        joints=arguments.joints,
+        skip_uncorrected=arguments.skip_uncorrected,
+    )
+    try:
+        report = build_exports(**kwargs) if profiler is None else profiler.runcall(build_exports, **kwargs)
+    except ValueError as error:
+        print(f"spartacus build: error: {error}", file=sys.stderr)
+        return 2
+
+    if profiler is not None:
+        if arguments.profile == "-":
+            pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(30)
+        else:
+            profiler.dump_stats(arguments.profile)
+
+    for failure in report.itertuples():
+        print(f"{failure.severity}: {failure.check}: {failure.dataset_authors}: {failure.message}", file=sys.stderr)
+    nb_errors = int((report["severity"] == "error").sum())
+    print(f"spartacus build: {nb_errors} errors, {report.shape[0] - nb_errors} warnings", file=sys.stderr)
+    return 1 if nb_errors else 0
+
+
+def parser() -> argparse.ArgumentParser:
+    """The parser of the command line, one sub-command per action"""
+    main_parser = argparse.ArgumentParser(prog="spartacus", description="The shoulder kinematics dataset.")
+    subparsers = main_parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="Build the exported series of the dataset root.")
+    build_parser.add_argument("--root", default=None, help="The dataset root, see DatasetRoot for the default one.")
+    build_parser.add_argument(
+        "--output", default=None, help="The folder to export in, the dataset folder of the root by default."
+    )
+    build_parser.add_argument("--jobs", type=int, default=1, help="The number of processes importing the rows.")
+    build_parser.add_argument(
+        "--incremental", action="store_true", help="Import only the rows added or changed since the last build."
+    )
+    build_parser.add_argument("--format", choices=FILE_FORMATS, default="csv", help="The file format of the series.")
+    build_parser.add_argument("--studies", nargs="+", default=None, help="The dataset authors or folders to build.")
+    build_parser.add_argument("--joints", nargs="+", default=None, help="The joints to build, e.g. glenohumeral.")
+    build_parser.add_argument(
+        "--skip-uncorrected", action="store_true", help="Compute and export the corrected series only."
+    )
+    build_parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="-",
+        default=None,
+        help="Profile the build, the statistics are written in the given file or printed.",
+    )
+    build_parser.set_defaults(action=build)
+
+    watch_parser = subparsers.add_parser(
+        "watch", help="Rebuild the series of the rows whose csv files or dataset table change."
+    )
+    watch_parser.add_argument("--root", default=None, help="The dataset root, see DatasetRoot for the default one.")
+    watch_parser.add_argument("--interval", type=float, default=1.0, help="The time between two polls, in s.")
+    watch_parser.add_argument("--gui", action="store_true", help="Show the series in the GUI, refreshed on change.")
+    watch_parser.add_argument("--port", type=int, default=8050, help="The port of the GUI.")
+    watch_parser.set_defaults(action=watch)
+
+    return main_parser
+
+
+def main(argv: list[str] = None) -> int:
+    arguments = parser().parse_args(argv)
+    return arguments.action(arguments)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -29,11 +29,11 @@ class DataFrameInterface:
 
     @property
     def rotational_interface(self):
-        return DataFrameInterface(self.df[self.df["unit"] == "angle"])
+        return DataFrameInterface(self.df[self.df["unit"] == "rad"])
 
     @property
     def translational_interface(self):
-        return DataFrameInterface(self.df[self.df["unit"] == "angle"])
+        return DataFrameInterface(self.df[self.df["unit"] == "mm"])
 
     @property
     def motions(self) -> list[str]:
@@ -3,7 +3,7 @@ import io
 import pandas as pd
 import plotly.express as px
 import webbrowser
-from dash import Dash, dcc, html, Input, Output, State, callback
+from dash import Dash, dcc, html, Input, Output, State, callback, no_update
 
 from spartacus.plots.quick_load import import_data
 
@@ -18,6 +18,8 @@ app = Dash(__name__)
 
 
 extracted_data = import_data()
+# the DatasetWatcher whose rebuilt series replace extracted_data, see watch_app
+watcher = None
 
 
 # Import data
@@ -41,6 +43,26 @@ def update_output(contents):
     return extracted_data.size
 
 
+# Refresh the data rebuilt by the watcher, the uploaded data are dropped
+@callback(
+    Output("data-version", "data"),
+    Input("watch-interval", "n_intervals"),
+    State("data-version", "data"),
+    prevent_initial_call=True,
+)
+def refresh_data(n_intervals, version):
+    global extracted_data
+
+    if watcher is None:
+        return no_update
+    watcher.step()
+    if watcher.version == version:
+        return no_update
+
+    extracted_data = watcher.spartacus.corrected_confident_data_values
+    return watcher.version
+
+
 # Export data
 # TODO : what should be exported when the user ask it (only what is visible or everything)
 @callback(
@@ -69,8 +91,9 @@ def export_data(humeral_motion, joint, unit, n_clicks):
     Input("humeral_motion", "value"),
     Input("joint", "value"),
     Input("unit", "value"),
+    Input("data-version", "data"),
 )
-def update_line_chart(humeral_motion, joint, unit):
+def update_line_chart(humeral_motion, joint, unit, version):
     df = extracted_data  # replace with your own data source
     mask_joint = df.joint.isin(joint)
     mask_mvt = df.humeral_motion.isin([humeral_motion])
@@ -124,7 +147,17 @@ def update_line_chart(humeral_motion, joint, unit):
     return fig
 
 
-def launch_app(data):
+def launch_app(data, watch_interval: float = None):
+    """
+    Set the layout of the app.
+
+    Parameters
+    ----------
+    data: pd.DataFrame
+        The angle series in the long layout
+    watch_interval: float
+        The time between two polls of the watcher, in s, no polling by default
+    """
 
     app.layout = html.Div(
         [  # Global Title of the graph
@@ -167,10 +200,35 @@ def launch_app(data):
                 multiple=True,
             ),
             html.Div(id="output"),
+            # Poll the watcher, if any, and redraw the graph when the data are rebuilt
+            dcc.Interval(
+                id="watch-interval",
+                interval=1000 * (watch_interval or 1),
+                disabled=watch_interval is None,
+            ),
+            dcc.Store(id="data-version", data=0),
         ]
     )
 
 
+def watch_app(dataset_watcher, watch_interval: float = 1.0):
+    """
+    Set the layout of the app on the series of a watcher, refreshed when its files change.
+
+    Parameters
+    ----------
+    dataset_watcher: DatasetWatcher
+        The watcher of the dataset root
+    watch_interval: float
+        The time between two polls of the watcher, in s
+    """
+    global extracted_data, watcher
+
+    watcher = dataset_watcher
+    extracted_data = watcher.spartacus.corrected_confident_data_values
+    launch_app(extracted_data, watch_interval=watch_interval)
+
+
 def main():
     extracted_data = import_data()
     launch_app(extracted_data)
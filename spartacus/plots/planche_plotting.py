@@ -1,5 +1,6 @@
 import numpy as np
 import plotly.graph_objs as go
+from pandas import DataFrame
 from plotly.subplots import make_subplots
 
 from .constants import (
@@ -190,6 +191,55 @@ class DataPlanchePlotting:
         self.fig.update_yaxes(gridcolor=grid_color, row=row + 1, col=col + 1, showgrid=True, nticks=n_ticks)
         self.showlegend = False
 
+    def plot_corridor(self, corridor: DataFrame, band: str = "sd", name: str = "Corridor", color: str = None):
+        """
+        Draw corridors, see Spartacus.corridors, as one filled trace per joint and degree of freedom.
+
+        Parameters
+        ----------
+        corridor: DataFrame
+            The corridors of a single humeral motion
+        band: str
+            "sd" for mean +/- one standard deviation, "p5-p95" or "p25-p75" for percentiles
+        name: str
+            The name of the trace in the legend
+        color: str
+            The fill color, translucent grey by default
+        """
+        bands = {"sd": ("mean", "sd"), "p5-p95": ("p5", "p95"), "p25-p75": ("p25", "p75")}
+        if band not in bands:
+            raise ValueError(f"band must be one of {list(bands.keys())}, got {band}.")
+        color = "rgba(0, 0, 0, 0.2)" if color is None else color
+
+        showlegend = True
+        for (joint, dof), df in corridor.groupby(["joint", "degree_of_freedom"], sort=False):
+            if joint not in self.joints:
+                continue
+            df = df[df["mean"].notna()]
+            if band == "sd":
+                lower, upper = df["mean"] - df["sd"], df["mean"] + df["sd"]
+            else:
+                lower, upper = df[bands[band][0]], df[bands[band][1]]
+
+            row, col = self.joint_row_col_index(joint)[dof - 1]
+            self.fig.add_trace(
+                go.Scatter(
+                    # the upper bound forth and the lower bound back, closed in a single polygon
+                    x=np.concatenate((df["humerothoracic_angle"], df["humerothoracic_angle"][::-1])),
+                    y=np.concatenate((upper, lower[::-1])),
+                    fill="toself",
+                    fillcolor=color,
+                    line=dict(width=0),
+                    hoverinfo="skip",
+                    name=name,
+                    legendgroup="_corridor",
+                    showlegend=showlegend,
+                ),
+                row=row + 1,
+                col=col + 1,
+            )
+            showlegend = False
+
     def update_style(self):
         self.fig.update_layout(
             # If we fix only the height the width will be adapted to the size of the screen
@@ -1,16 +1,25 @@
-import os
 import pandas as pd
 from pathlib import Path
 
-from spartacus.src.enums import DatasetCSV
+from spartacus.src.dataset_root import DatasetRoot
 from ..src.load import load
 
 
-def import_data(correction: bool = True):
-    """Import the data from the confident_data.csv file if it exists, otherwise it's computed from the raw data."""
+def import_data(correction: bool = True, translation: bool = False, dataset_root: DatasetRoot | str | Path = None):
+    """
+    Import the data from the corrected_confident_data.csv file, or confident_data.csv if correction is False.
+    The translations, in mm, are imported from the confident_translation_data.csv file if translation is True.
+    The files are the exports of the dataset root, see DatasetRoot for the default one, a ValueError is raised if the
+    file to import was not exported.
+    """
+    dataset_root = dataset_root if isinstance(dataset_root, DatasetRoot) else DatasetRoot(dataset_root)
     file = "corrected_confident_data.csv" if correction else "confident_data.csv"
+    if translation:
+        file = file.replace("_data.csv", "_translation_data.csv")
 
-    if "confident_data.csv" in os.listdir(str(Path(DatasetCSV.CLEAN.value).parent)):
-        return pd.read_csv(Path(DatasetCSV.CLEAN.value).parent / file)
+    if (dataset_root.export_folder / file).is_file():
+        return pd.read_csv(dataset_root.export_folder / file)
     else:
-        raise ValueError("The confident_data.csv file does not exist. You must run the correction first.")
+        raise ValueError(
+            f"The {file} file does not exist in {dataset_root.export_folder}. You must run the correction first."
+        )
@@ -0,0 +1,132 @@
+"""
+This module describes the wide layout of the angle series, one line per sample with the three degrees of freedom
+side by side, and how to melt it into the long layout, one line per sample and per degree of freedom.
+"""
+
+import numpy as np
+import pandas as pd
+
+VALUE_COLUMNS = ["value_dof1", "value_dof2", "value_dof3"]
+LEGEND_COLUMNS = ["biomechanical_dof1", "biomechanical_dof2", "biomechanical_dof3"]
+
+WIDE_COLUMNS = [
+    "article",  # string
+    "joint",  # string
+    "humeral_motion",  # string
+    "humerothoracic_angle",  # float
+    "value_dof1",  # float
+    "value_dof2",  # float
+    "value_dof3",  # float
+    "unit",  # string "rad" or "mm"
+    "confidence",  # float
+    "shoulder_id",  # int
+    "in_vivo",  # bool
+    "xp_mean",  # string
+    "biomechanical_dof1",  # string
+    "biomechanical_dof2",  # string
+    "biomechanical_dof3",  # string
+    "transform",  # string, see CorrectionPlan, "identity" when no transform was applied
+    "row_id",  # int, the row of the dataset the series comes from
+]
+
+LONG_COLUMNS = [
+    "article",
+    "joint",
+    "degree_of_freedom",
+    "biomechanical_dof",
+    "humeral_motion",
+    "humerothoracic_angle",
+    "value",
+    "unit",
+    "confidence",
+    "shoulder_id",
+    "in_vivo",
+    "xp_mean",
+    "transform",
+]
+
+
+def to_long_format(wide_dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Melt a wide angle series dataframe into the long layout.
+
+    Each series, i.e. consecutive lines sharing the same row_id, is unrolled as the samples of the first degree of
+    freedom, then the ones of the second, then the ones of the third. Everything is done with index arithmetic,
+    no merge with the legend is involved as it is already held by each line.
+
+    Parameters
+    ----------
+    wide_dataframe: pd.DataFrame
+        The angle series in the wide layout, see WIDE_COLUMNS
+
+    Returns
+    -------
+    pd.DataFrame
+        The angle series in the long layout, see LONG_COLUMNS
+    """
+    nb_samples = wide_dataframe.shape[0]
+    if nb_samples == 0:
+        return pd.DataFrame(columns=LONG_COLUMNS)
+
+    row_id = wide_dataframe["row_id"].to_numpy()
+    starts = np.flatnonzero(np.concatenate(([True], row_id[1:] != row_id[:-1])))
+    lengths = np.diff(np.append(starts, nb_samples))
+
+    # for each line of the long layout, find the line and the degree of freedom of the wide layout
+    long_lengths = np.repeat(lengths, 3 * lengths)
+    offsets = np.arange(3 * nb_samples) - np.repeat(3 * starts, 3 * lengths)
+    dof_index = offsets // long_lengths
+    wide_index = np.repeat(starts, 3 * lengths) + offsets % long_lengths
+
+    metadata_columns = [column for column in LONG_COLUMNS if column in wide_dataframe.columns]
+    long_dataframe = wide_dataframe[metadata_columns].iloc[wide_index].reset_index(drop=True)
+    long_dataframe["degree_of_freedom"] = dof_index + 1
+    long_dataframe["biomechanical_dof"] = wide_dataframe[LEGEND_COLUMNS].to_numpy()[wide_index, dof_index]
+    long_dataframe["value"] = wide_dataframe[VALUE_COLUMNS].to_numpy(dtype=float)[wide_index, dof_index]
+
+    return long_dataframe[[column for column in LONG_COLUMNS if column in long_dataframe.columns]]
+
+
+def from_long_format(long_dataframe: pd.DataFrame, lengths: np.ndarray, row_ids: np.ndarray) -> pd.DataFrame:
+    """
+    Pivot a long angle series dataframe back into the wide layout, the inverse of to_long_format.
+
+    The long layout holds no row_id, so the series are given by their number of samples, each series being the
+    samples of the first degree of freedom, then the ones of the second, then the ones of the third.
+
+    Parameters
+    ----------
+    long_dataframe: pd.DataFrame
+        The angle series in the long layout, see LONG_COLUMNS, 3 * sum(lengths) lines
+    lengths: np.ndarray
+        The number of samples of each series, shape (S,)
+    row_ids: np.ndarray
+        The row of the dataset each series comes from, shape (S,)
+
+    Returns
+    -------
+    pd.DataFrame
+        The angle series in the wide layout, see WIDE_COLUMNS
+    """
+    lengths = np.asarray(lengths, dtype=int)
+    nb_samples = lengths.sum()
+    if long_dataframe.shape[0] != 3 * nb_samples:
+        raise ValueError(f"The series have {3 * nb_samples} lines in the long layout, got {long_dataframe.shape[0]}.")
+    if nb_samples == 0:
+        return pd.DataFrame(columns=WIDE_COLUMNS)
+
+    # for each line of the wide layout, find the line of its first degree of freedom in the long layout
+    long_starts = np.repeat(3 * (np.cumsum(lengths) - lengths), lengths)
+    samples = np.arange(nb_samples) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    first_dof_index = long_starts + samples
+    series_lengths = np.repeat(lengths, lengths)
+
+    metadata_columns = [column for column in WIDE_COLUMNS if column in long_dataframe.columns]
+    wide_dataframe = long_dataframe[metadata_columns].iloc[first_dof_index].reset_index(drop=True)
+    for dof, (value_column, legend_column) in enumerate(zip(VALUE_COLUMNS, LEGEND_COLUMNS)):
+        long_index = first_dof_index + dof * series_lengths
+        wide_dataframe[value_column] = long_dataframe["value"].to_numpy(dtype=float)[long_index]
+        wide_dataframe[legend_column] = long_dataframe["biomechanical_dof"].to_numpy()[long_index]
+    wide_dataframe["row_id"] = np.repeat(row_ids, lengths)
+
+    return wide_dataframe[WIDE_COLUMNS]
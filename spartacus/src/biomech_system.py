@@ -1,9 +1,27 @@
-import collections
 import numpy as np
 
 from .enums import CartesianAxis, BiomechDirection, BiomechOrigin, Segment
 from .utils import compute_rotation_matrix_from_axes
 
+ISB_ORIGINS = {
+    Segment.THORAX: BiomechOrigin.Thorax.IJ,
+    Segment.CLAVICLE: BiomechOrigin.Clavicle.STERNOCLAVICULAR_JOINT_CENTER,
+    Segment.SCAPULA: BiomechOrigin.Scapula.ANGULAR_ACROMIALIS,
+    Segment.HUMERUS: BiomechOrigin.Humerus.GLENOHUMERAL_HEAD,
+}
+
+SEGMENT_TYPES = ("proximal", "distal")
+RISK_TYPES = ("rotation", "displacement")
+RISK_KINDS = ("label", "sens", "origin")
+
+# shape (segment types, risk types, risk kinds), the factor applied to the confidence when the risk is present
+DEFAULT_RISK_COEFFICIENTS = np.array(
+    [
+        [[0.9, 0.9, 0.9], [0.9, 0.9, 0.5]],  # proximal: rotation, displacement
+        [[0.9, 0.9, 0.9], [0.9, 0.9, 0.5]],  # distal: rotation, displacement
+    ]
+)
+
 
 class BiomechCoordinateSystem:
     def __init__(
@@ -84,14 +102,7 @@ class BiomechCoordinateSystem:
         return cls(**my_arg)
 
     def is_isb_origin(self) -> bool:
-        segment_origin_mapping = {
-            Segment.THORAX: BiomechOrigin.Thorax.IJ,
-            Segment.CLAVICLE: BiomechOrigin.Clavicle.STERNOCLAVICULAR_JOINT_CENTER,
-            Segment.SCAPULA: BiomechOrigin.Scapula.ANGULAR_ACROMIALIS,
-            Segment.HUMERUS: BiomechOrigin.Humerus.GLENOHUMERAL_HEAD,
-        }
-
-        return segment_origin_mapping.get(self.segment) == self.origin
+        return ISB_ORIGINS.get(self.segment) == self.origin
 
     def is_origin_on_an_isb_axis(self) -> bool:
         """
@@ -177,43 +188,26 @@ class BiomechCoordinateSystem:
 
         return is_ant_post_wrong_sens or is_med_lat_wrong_sens or is_inf_sup_wrong_sens
 
-    def get_segment_risk_quantification(self, type_segment, type_risk):
+    def get_segment_risk_quantification(self, type_segment, type_risk, coefficients: np.ndarray = None):
         """
-        Return the risk quantification of the segment which is the product of the risk of each type of risk described in the dictionnary dict_coeff.
+        Return the risk quantification of the segment which is the product of the coefficients of each type of risk
+        the segment is subject to, see DEFAULT_RISK_COEFFICIENTS.
+
+        Parameters
+        ----------
+        type_segment: str
+            "proximal" or "distal"
+        type_risk: str
+            "rotation" or "displacement"
+        coefficients: np.ndarray
+            The risk coefficients, shape (segment types, risk types, risk kinds), DEFAULT_RISK_COEFFICIENTS by default
         """
-        nested_dict = lambda: collections.defaultdict(nested_dict)
-        dict_coeff = nested_dict()
-        dict_coeff["proximal"]["rotation"]["label"] = 0.9
-        dict_coeff["proximal"]["rotation"]["sens"] = 0.9
-        dict_coeff["proximal"]["rotation"]["origin"] = 0.9
-        dict_coeff["proximal"]["rotation"]["direction"] = 0.5
-
-        dict_coeff["proximal"]["displacement"]["label"] = 0.9
-        dict_coeff["proximal"]["displacement"]["sens"] = 0.9
-        dict_coeff["proximal"]["displacement"]["origin"] = 0.5
-        dict_coeff["proximal"]["displacement"]["direction"] = 0.5
-
-        dict_coeff["distal"]["rotation"]["label"] = 0.9
-        dict_coeff["distal"]["rotation"]["sens"] = 0.9
-        dict_coeff["distal"]["rotation"]["origin"] = 0.9
-        dict_coeff["distal"]["rotation"]["direction"] = 0.5
-
-        dict_coeff["distal"]["displacement"]["label"] = 0.9
-        dict_coeff["distal"]["displacement"]["sens"] = 0.9
-        dict_coeff["distal"]["displacement"]["origin"] = 0.5
-        dict_coeff["distal"]["displacement"]["direction"] = 0.9
-
-        risk = 1
-        if self.is_mislabeled():
-            risk = risk * dict_coeff[type_segment][type_risk]["label"]
-
-        if not self.is_isb_origin():
-            risk = risk * dict_coeff[type_segment][type_risk]["origin"]
-
-        if self.is_any_axis_wrong_sens():
-            risk = risk * dict_coeff[type_segment][type_risk]["sens"]
-
-        return risk
+        coefficients = DEFAULT_RISK_COEFFICIENTS if coefficients is None else coefficients
+        # in the order of RISK_KINDS: label, sens, origin
+        is_at_risk = np.array([self.is_mislabeled(), self.is_any_axis_wrong_sens(), not self.is_isb_origin()])
+        segment_coefficients = coefficients[SEGMENT_TYPES.index(type_segment), RISK_TYPES.index(type_risk)]
+
+        return float(np.prod(segment_coefficients[is_at_risk]))
 
     def __print__(self):
         print(f"Segment: {self.segment}")
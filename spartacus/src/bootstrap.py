@@ -0,0 +1,272 @@
+"""
+This module computes hierarchical bootstrap confidence intervals of the corridor means: the studies are resampled
+within the corpus, then the series, i.e. the shoulders, are resampled within each drawn study.
+
+The series are resampled once on the humerothoracic grid, each bootstrap replicate is a vector of counts per series,
+so that a block of replicates is a single matrix product. The replicates are never stored, they are accumulated
+in a histogram per grid point and degree of freedom from which the percentiles are read.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .angle_series import LEGEND_COLUMNS
+from .corridor import CORRIDOR_KEYS, DEFAULT_GRID, resample_on_grid
+
+NB_BINS = 1024
+BLOCK_SIZE = 250
+BACKENDS = ("threads", "processes")
+
+BOOTSTRAP_COLUMNS = [
+    "joint",  # string
+    "humeral_motion",  # string
+    "degree_of_freedom",  # int
+    "biomechanical_dof",  # string
+    "humerothoracic_angle",  # float, the grid
+    "unit",  # string "rad" or "mm"
+    "mean",  # float, the mean of the series
+    "se",  # float, the standard deviation of the bootstrap means
+    "ci_lower",  # float
+    "ci_upper",  # float
+    "nb_series",  # int
+    "nb_studies",  # int
+]
+
+
+def sample_counts(rng: np.random.Generator, study_sizes: np.ndarray, nb_replicates: int) -> np.ndarray:
+    """
+    Draw hierarchical bootstrap replicates, the studies with replacement then the series of each drawn study with
+    replacement, as the number of times each series is drawn.
+
+    Parameters
+    ----------
+    rng: np.random.Generator
+        The random generator
+    study_sizes: np.ndarray
+        The number of series of each study, the series being sorted by study, shape (K,)
+    nb_replicates: int
+        The number of replicates B
+
+    Returns
+    -------
+    np.ndarray
+        The number of times each series is drawn in each replicate, shape (B, S)
+    """
+    nb_studies = study_sizes.shape[0]
+    nb_series = study_sizes.sum()
+    study_offsets = np.concatenate(([0], np.cumsum(study_sizes)[:-1]))
+
+    studies = rng.integers(0, nb_studies, size=(nb_replicates, nb_studies))
+    sizes = study_sizes[studies]
+    # as many draws as the largest study, the draws beyond the size of the drawn study are discarded
+    draws = np.floor(rng.random((nb_replicates, nb_studies, study_sizes.max())) * sizes[..., np.newaxis]).astype(int)
+    is_drawn = np.arange(study_sizes.max()) < sizes[..., np.newaxis]
+    series = draws + study_offsets[studies][..., np.newaxis]
+
+    replicate = np.broadcast_to(np.arange(nb_replicates)[:, np.newaxis, np.newaxis], series.shape)
+    flat_index = (replicate * nb_series + series)[is_drawn]
+    return np.bincount(flat_index, minlength=nb_replicates * nb_series).reshape(nb_replicates, nb_series)
+
+
+def _bootstrap_block(
+    seed: np.random.SeedSequence,
+    nb_replicates: int,
+    study_sizes: np.ndarray,
+    values: np.ndarray,
+    weights: np.ndarray,
+    lower: np.ndarray,
+    width: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Run a block of replicates and return their histogram, sum and sum of squares per grid point and dof"""
+    rng = np.random.default_rng(seed)
+    counts = sample_counts(rng, study_sizes, nb_replicates) * weights[np.newaxis, :]
+
+    is_valid = ~np.isnan(values)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        means = (counts @ np.where(is_valid, values, 0.0)) / (counts @ is_valid)
+
+    is_finite = np.isfinite(means)
+    bins = np.clip(np.floor((means - lower) / width), 0, NB_BINS - 1)
+    cell = np.broadcast_to(np.arange(means.shape[1]), means.shape)
+    histogram = np.bincount(
+        (cell * NB_BINS + np.where(is_finite, bins, 0).astype(int))[is_finite], minlength=means.shape[1] * NB_BINS
+    ).reshape(means.shape[1], NB_BINS)
+
+    means = np.where(is_finite, means, 0.0)
+    return histogram, means.sum(axis=0), (means**2).sum(axis=0)
+
+
+def _histogram_quantile(
+    histogram: np.ndarray, lower: np.ndarray, upper: np.ndarray, width: np.ndarray, quantile: float
+) -> np.ndarray:
+    """Read a quantile from histograms, linearly within the bin, shape (M, NB_BINS) -> (M,)"""
+    cumulated = np.cumsum(histogram, axis=1)
+    total = cumulated[:, -1]
+    target = quantile * total
+    bins = np.minimum((cumulated < target[:, np.newaxis]).sum(axis=1), NB_BINS - 1)
+    cells = np.arange(histogram.shape[0])
+    previous = np.where(bins > 0, cumulated[cells, np.maximum(bins - 1, 0)], 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        within = np.clip((target - previous) / histogram[cells, bins], 0, 1)
+    within = np.where(histogram[cells, bins] > 0, within, 0.0)
+    return np.where(total > 0, np.minimum(lower + width * (bins + within), upper), np.nan)
+
+
+def bootstrap_means(
+    values: np.ndarray,
+    studies: np.ndarray,
+    weights: np.ndarray = None,
+    n_boot: int = 10000,
+    confidence_level: float = 0.95,
+    n_jobs: int = 1,
+    backend: str = "threads",
+    seed: int = 0,
+) -> dict[str, np.ndarray]:
+    """
+    Hierarchical bootstrap of the mean of stacked series resampled on the same grid.
+
+    The replicates are drawn by blocks of BLOCK_SIZE, each block has its own random generator spawned from the seed,
+    so the result does not depend on n_jobs. The percentiles are read from histograms of NB_BINS bins spanning the
+    range of the series at each grid point, which bounds the memory whatever n_boot.
+
+    Parameters
+    ----------
+    values: np.ndarray
+        The series, shape (S, G, 3)
+    studies: np.ndarray
+        The study of each series, shape (S,)
+    weights: np.ndarray
+        The weight of each series, e.g. its confidence, all ones by default
+    n_boot: int
+        The number of bootstrap replicates
+    confidence_level: float
+        The coverage of the confidence interval
+    n_jobs: int
+        The number of workers
+    backend: str
+        "threads" or "processes"
+    seed: int
+        The seed of the random generators
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        "se", "ci_lower" and "ci_upper", each of shape (G, 3)
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}, got {backend}.")
+    if not 0 < confidence_level < 1:
+        raise ValueError(f"confidence_level must be between 0 and 1, got {confidence_level}.")
+
+    shape = values.shape[1:]
+    order = np.argsort(studies, kind="stable")
+    _, study_sizes = np.unique(np.asarray(studies)[order], return_counts=True)
+    values = values[order].reshape(values.shape[0], -1)
+    weights = np.ones(values.shape[0]) if weights is None else np.asarray(weights, dtype=float)[order]
+
+    with np.errstate(invalid="ignore"):
+        lower = np.nanmin(np.where(np.isnan(values).all(axis=0), 0.0, values), axis=0)
+        upper = np.nanmax(np.where(np.isnan(values).all(axis=0), 0.0, values), axis=0)
+    width = np.where(upper > lower, (upper - lower) / NB_BINS, 1.0)
+
+    block_sizes = [min(BLOCK_SIZE, n_boot - start) for start in range(0, n_boot, BLOCK_SIZE)]
+    seeds = np.random.SeedSequence(seed).spawn(len(block_sizes))
+    arguments = [(seeds[i], block_sizes[i], study_sizes, values, weights, lower, width) for i in range(len(seeds))]
+
+    if n_jobs == 1:
+        results = [_bootstrap_block(*argument) for argument in arguments]
+    else:
+        executor = ThreadPoolExecutor if backend == "threads" else ProcessPoolExecutor
+        with executor(max_workers=n_jobs) as pool:
+            results = list(pool.map(_bootstrap_block, *zip(*arguments)))
+
+    histogram = sum(result[0] for result in results)
+    total = histogram.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = sum(result[1] for result in results) / total
+        se = np.sqrt(np.maximum(sum(result[2] for result in results) / total - mean**2, 0))
+
+    alpha = (1 - confidence_level) / 2
+    return {
+        "se": se.reshape(shape),
+        "ci_lower": _histogram_quantile(histogram, lower, upper, width, alpha).reshape(shape),
+        "ci_upper": _histogram_quantile(histogram, lower, upper, width, 1 - alpha).reshape(shape),
+    }
+
+
+def bootstrap_ci(
+    wide_dataframe: pd.DataFrame,
+    grid: np.ndarray = None,
+    n_boot: int = 10000,
+    confidence_level: float = 0.95,
+    weighted: bool = False,
+    n_jobs: int = 1,
+    backend: str = "threads",
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Bootstrap confidence intervals of the corridor means of every joint and humeral motion, the series being
+    resampled on the grid once, see bootstrap_means.
+
+    Parameters
+    ----------
+    wide_dataframe: pd.DataFrame
+        The series in the wide layout, see WIDE_COLUMNS, either angles or translations
+    grid: np.ndarray
+        The humerothoracic angles of the corridors, DEFAULT_GRID by default
+    n_boot: int
+        The number of bootstrap replicates
+    confidence_level: float
+        The coverage of the confidence interval
+    weighted: bool
+        If True, each series is weighted by its confidence
+    n_jobs: int
+        The number of workers
+    backend: str
+        "threads" or "processes"
+    seed: int
+        The seed of the random generators
+
+    Returns
+    -------
+    pd.DataFrame
+        One line per joint, humeral motion, degree of freedom and grid point, see BOOTSTRAP_COLUMNS
+    """
+    grid = DEFAULT_GRID if grid is None else np.asarray(grid, dtype=float)
+    series, values = resample_on_grid(wide_dataframe, grid)
+
+    intervals = [pd.DataFrame(columns=BOOTSTRAP_COLUMNS)]
+    for key, group in series.reset_index(drop=True).groupby(CORRIDOR_KEYS, sort=False):
+        group_values = values[group.index.to_numpy()]
+        weights = group["confidence"].to_numpy(dtype=float) if weighted else np.ones(group.shape[0])
+        statistics = bootstrap_means(
+            group_values,
+            group["article"].to_numpy(),
+            weights=weights,
+            n_boot=n_boot,
+            confidence_level=confidence_level,
+            n_jobs=n_jobs,
+            backend=backend,
+            seed=seed,
+        )
+        is_valid = ~np.isnan(group_values)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            statistics["mean"] = (weights[:, np.newaxis, np.newaxis] * np.where(is_valid, group_values, 0)).sum(
+                axis=0
+            ) / (weights[:, np.newaxis, np.newaxis] * is_valid).sum(axis=0)
+
+        for dof in range(3):
+            interval = pd.DataFrame({"humerothoracic_angle": grid})
+            interval["joint"], interval["humeral_motion"] = key
+            interval["degree_of_freedom"] = dof + 1
+            interval["biomechanical_dof"] = group[LEGEND_COLUMNS[dof]].iloc[0]
+            interval["unit"] = group["unit"].iloc[0]
+            for name in ("mean", "se", "ci_lower", "ci_upper"):
+                interval[name] = statistics[name][:, dof]
+            interval["nb_series"] = is_valid[:, :, dof].sum(axis=0)
+            interval["nb_studies"] = group["article"].nunique()
+            intervals.append(interval[BOOTSTRAP_COLUMNS])
+
+    return pd.concat(intervals, ignore_index=True)
@@ -0,0 +1,205 @@
+"""
+This module builds the exports of a dataset root in one call, the series of a selection of studies and joints in a
+file format, with a validation report, for the command line, see spartacus build, and batch jobs.
+
+The validation report lists, one line per failure, the rows that could not be exported, see VALIDATION_COLUMNS:
+    errors:     the angle csv files missing, the csv files not matching the manifest of their study, the rows without
+                any series
+    warnings:   the translation csv files missing, whose translations are dropped, and the rows rejected by the checks
+                of the segments and the joint, as when loading the dataset
+"""
+
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .dataset_root import DatasetRoot
+from .incremental import CSV_FIELDS, check_file_format
+from .load import Spartacus
+
+VALIDATION_FILENAME = "build_validation.csv"
+
+VALIDATION_COLUMNS = [
+    "severity",  # string, "error" or "warning", the build fails if any error
+    "check",  # string, "missing_file", "manifest", "no_series" or "rejected"
+    "dataset_authors",  # string
+    "folder",  # string
+    "message",  # string
+]
+
+
+def select_rows(dataframe: pd.DataFrame, studies: list[str] = None, joints: list[str] = None) -> pd.DataFrame:
+    """
+    The rows of some studies and joints.
+
+    Parameters
+    ----------
+    dataframe: pd.DataFrame
+        The rows of the dataset
+    studies: list[str]
+        The dataset authors, e.g. "Begon et al.", or the folders, e.g. "#1_Begon_et_al", all of them by default
+    joints: list[str]
+        The joints, e.g. "glenohumeral", all of them by default
+    """
+    mask = np.ones(dataframe.shape[0], dtype=bool)
+    for column_values, names, kind in (
+        ((dataframe["dataset_authors"], dataframe["folder"]), studies, "study"),
+        ((dataframe["joint"],), joints, "joint"),
+    ):
+        if names is None:
+            continue
+        unknown = [name for name in names if not any((values == name).any() for values in column_values)]
+        if unknown:
+            raise ValueError(f"Unknown {kind}: {unknown}.")
+        mask &= np.any([values.isin(names).to_numpy() for values in column_values], axis=0)
+
+    return dataframe[mask]
+
+
+def validate_files(dataframe: pd.DataFrame, dataset_root: DatasetRoot) -> tuple[list[dict], np.ndarray]:
+    """
+    The csv files of the rows missing or not matching the manifest of their study.
+
+    Returns
+    -------
+    tuple[list[dict], np.ndarray]
+        The failures, see VALIDATION_COLUMNS, and the mask of the rows whose angle csv files are all there
+    """
+    failures = []
+    mismatches = {}
+    has_files = np.ones(dataframe.shape[0], dtype=bool)
+    for i, (_, row) in enumerate(dataframe.iterrows()):
+        try:
+            folder_path = dataset_root.folder_path(row["folder"])
+        except (ValueError, TypeError) as error:
+            failures.append(_failure("error", "missing_file", row, str(error)))
+            has_files[i] = False
+            continue
+
+        if row["folder"] not in mismatches and not Path(row["folder"]).is_absolute():
+            mismatches[row["folder"]] = dataset_root.registry.verify(row["folder"])
+            for name in mismatches[row["folder"]]:
+                failures.append(_failure("error", "manifest", row, f"{name} does not match the manifest."))
+
+        for field in CSV_FIELDS:
+            if row[field] is None or (Path(folder_path) / row[field]).is_file():
+                continue
+            # the rows missing translation files are imported without translations
+            translation = field.startswith("dof_translation")
+            failures.append(
+                _failure("warning" if translation else "error", "missing_file", row, f"{row[field]} is missing.")
+            )
+            has_files[i] = has_files[i] and translation
+
+    return failures, has_files
+
+
+def validate_rejected_rows(dataframe: pd.DataFrame, confident_dataframe: pd.DataFrame) -> list[dict]:
+    """The rows rejected by the checks of the segments and the joint, the ones missing in confident_dataframe"""
+    confident_keys = Counter(_row_key(row) for _, row in confident_dataframe[dataframe.columns].iterrows())
+    failures = []
+    for _, row in dataframe.iterrows():
+        key = _row_key(row)
+        if confident_keys[key] > 0:
+            confident_keys[key] -= 1
+        else:
+            failures.append(_failure("warning", "rejected", row, f"{row['joint']} rejected by the checks."))
+    return failures
+
+
+def validate_series(spartacus: Spartacus, correction: bool = True) -> list[dict]:
+    """The confident rows without any angle or translation series"""
+    angle_wide = spartacus.corrected_confident_data_wide if correction else spartacus.confident_data_wide
+    translation_wide = (
+        spartacus.corrected_confident_translation_data_wide if correction else spartacus.confident_translation_data_wide
+    )
+    row_ids = set(angle_wide["row_id"]) | set(translation_wide["row_id"])
+    return [
+        _failure("error", "no_series", row, f"{row['joint']} has no series.")
+        for row_id, row in spartacus.confident_dataframe.iterrows()
+        if row_id not in row_ids
+    ]
+
+
+def _row_key(row: pd.Series) -> tuple[str, ...]:
+    return tuple(str(value) for value in row.to_numpy())
+
+
+def _failure(severity: str, check: str, row: pd.Series, message: str) -> dict:
+    return {
+        "severity": severity,
+        "check": check,
+        "dataset_authors": row["dataset_authors"],
+        "folder": row["folder"],
+        "message": message,
+    }
+
+
+def build_exports(
+    dataset_root: DatasetRoot | str | Path = None,
+    export_folder: str | Path = None,
+    file_format: str = "csv",
+    n_jobs: int = 1,
+    incremental: bool = False,
+    studies: list[str] = None,
+    joints: list[str] = None,
+    skip_uncorrected: bool = False,
+) -> pd.DataFrame:
+    """
+    Build the exports of a dataset root and write the validation report next to them.
+
+    Parameters
+    ----------
+    dataset_root: DatasetRoot | str | Path
+        The root holding the dataset table and the study folders, see DatasetRoot for the default one
+    export_folder: str | Path
+        The folder to export in, created if needed, the export folder of the dataset root by default. The builds of
+        different selections of the same root running in parallel need one folder each.
+    file_format: str
+        The file format of the series, see FILE_FORMATS
+    n_jobs: int
+        The number of processes importing the rows
+    incremental: bool
+        If True, only the rows added or changed since the last build in export_folder are imported
+    studies: list[str]
+        The dataset authors or the folders of the studies to build, all of them by default
+    joints: list[str]
+        The joints to build, all of them by default
+    skip_uncorrected: bool
+        If True, only the corrected series are computed and exported
+
+    Returns
+    -------
+    pd.DataFrame
+        The validation report, see VALIDATION_COLUMNS
+    """
+    check_file_format(file_format)
+    dataset_root = dataset_root if isinstance(dataset_root, DatasetRoot) else DatasetRoot(dataset_root)
+    export_folder = dataset_root.export_folder if export_folder is None else Path(export_folder)
+    export_folder.mkdir(parents=True, exist_ok=True)
+    outputs = ("corrected",) if skip_uncorrected else ("both",)
+
+    spartacus = Spartacus(
+        dataframe=select_rows(pd.read_csv(dataset_root.clean_csv), studies, joints), dataset_root=dataset_root
+    )
+    spartacus.remove_rows_not_ready_for_analysis()
+    failures, has_files = validate_files(spartacus.dataframe, dataset_root)
+    # the rows missing some files cannot be imported
+    spartacus.dataframe = spartacus.dataframe[has_files]
+    spartacus.set_correction_callbacks_from_segment_joint_validity(print_warnings=False)
+    failures += validate_rejected_rows(spartacus.dataframe, spartacus.confident_dataframe)
+
+    if incremental:
+        spartacus.import_confident_data_incrementally(
+            outputs=outputs, export_folder=export_folder, file_format=file_format, n_jobs=n_jobs
+        )
+    else:
+        spartacus.import_confident_series(outputs=outputs, n_jobs=n_jobs)
+    failures += validate_series(spartacus)
+
+    spartacus.export(outputs=outputs, file_format=file_format, export_folder=export_folder)
+    report = pd.DataFrame(failures, columns=VALIDATION_COLUMNS)
+    report.to_csv(export_folder / VALIDATION_FILENAME, index=False)
+    return report
@@ -0,0 +1,184 @@
+"""
+This module scores the confidence of all the rows of the dataset table at once, as Deviation does row by row.
+The risk flags of the proximal and distal segments are boolean columns computed from the segment definitions,
+and the coefficients are held in an array indexed by (segment type, risk type, risk kind), so that the confidence
+of every row is a single product and other coefficient sets cost nothing more than another product.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .biomech_system import DEFAULT_RISK_COEFFICIENTS, ISB_ORIGINS, RISK_KINDS, RISK_TYPES, SEGMENT_TYPES
+from .enums import BiomechOrigin, EulerSequence, JointType, Segment
+from .utils import get_segment_columns
+
+# the factor applied to the confidence of the rotations when the euler sequence is not the ISB one adapted to the axes
+NON_ISB_SEQUENCE_COEFFICIENT = 0.5
+
+# the anatomical direction each ISB axis stands for
+ISB_AXIS_DIRECTIONS = {"x": "posteroanterior", "y": "inferosuperior", "z": "mediolateral"}
+
+FLAG_COLUMNS = [
+    "proximal_mislabeled",  # bool, the axes are not along the ISB ones, whatever their sense
+    "proximal_wrong_sens",  # bool, any axis points in the negative direction
+    "proximal_not_isb_origin",  # bool
+    "distal_mislabeled",  # bool
+    "distal_wrong_sens",  # bool
+    "distal_not_isb_origin",  # bool
+    "is_euler_sequence_isb",  # bool, the euler sequence is the ISB one adapted to the axes of the segments
+]
+
+CONFIDENCE_COLUMNS = FLAG_COLUMNS + [
+    "rotation_confidence",  # float
+    "displacement_confidence",  # float
+]
+
+
+def risk_coefficient_index(type_segment: str, type_risk: str, kind: str) -> tuple[int, int, int]:
+    """The index of a coefficient in the coefficient array, e.g. ("proximal", "rotation", "label") -> (0, 0, 0)"""
+    return SEGMENT_TYPES.index(type_segment), RISK_TYPES.index(type_risk), RISK_KINDS.index(kind)
+
+
+def _map_unique(values: pd.Series, function) -> np.ndarray:
+    """Apply a function once per unique value of a column"""
+    uniques = pd.unique(values)
+    mapping = {value: function(value) for value in uniques}
+    return values.map(mapping).to_numpy(dtype=object)
+
+
+def _segment_axes(dataframe: pd.DataFrame, segment_column: str) -> dict[str, np.ndarray]:
+    """
+    The cartesian axis, e.g. "x" or "-y", along which each anatomical direction lies, and the origin, of the parent
+    or child segment of each row, as CartesianAxis.value[0] and BiomechOrigin would give.
+    """
+    nb_rows = dataframe.shape[0]
+    axes = {direction: np.full(nb_rows, "", dtype=object) for direction in ISB_AXIS_DIRECTIONS.values()}
+    origin = np.full(nb_rows, None, dtype=object)
+    is_isb_origin = np.zeros(nb_rows, dtype=bool)
+
+    segments = dataframe[segment_column].to_numpy(dtype=object)
+    for segment_name in pd.unique(segments):
+        is_segment = segments == segment_name
+        segment = Segment.from_string(segment_name)
+        columns = get_segment_columns(segment)
+        rows = dataframe[is_segment]
+
+        for axis, column in zip("xyz", columns[:3]):
+            directions = rows[column].to_numpy(dtype=object).astype(str)
+            for direction in ISB_AXIS_DIRECTIONS.values():
+                axes[direction][np.flatnonzero(is_segment)[directions == f"+{direction}"]] = axis
+                axes[direction][np.flatnonzero(is_segment)[directions == f"-{direction}"]] = f"-{axis}"
+
+        origin[is_segment] = _map_unique(rows[columns[3]], BiomechOrigin.from_string)
+        is_isb_origin[is_segment] = origin[is_segment] == ISB_ORIGINS.get(segment)
+
+    return {**axes, "is_isb_origin": is_isb_origin}
+
+
+def risk_flags(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    The risk flags of all the rows of the dataset table at once, see FLAG_COLUMNS.
+
+    Parameters
+    ----------
+    dataframe: pd.DataFrame
+        The rows of the dataset, with valid parent and child segment definitions
+
+    Returns
+    -------
+    pd.DataFrame
+        The boolean flags, one line per row of dataframe, with the same index
+    """
+    flags = pd.DataFrame(index=dataframe.index)
+    segment_axes = {}
+    for type_segment, segment_column in zip(SEGMENT_TYPES, ("parent", "child")):
+        axes = _segment_axes(dataframe, segment_column)
+        segment_axes[type_segment] = axes
+
+        is_labeled = np.ones(dataframe.shape[0], dtype=bool)
+        is_wrong_sens = np.zeros(dataframe.shape[0], dtype=bool)
+        for isb_axis, direction in ISB_AXIS_DIRECTIONS.items():
+            is_labeled &= np.isin(axes[direction], [isb_axis, f"-{isb_axis}"])
+            is_wrong_sens |= np.char.startswith(axes[direction].astype(str), "-")
+
+        flags[f"{type_segment}_mislabeled"] = ~is_labeled
+        flags[f"{type_segment}_wrong_sens"] = is_wrong_sens
+        flags[f"{type_segment}_not_isb_origin"] = ~axes["is_isb_origin"]
+
+    # the ISB sequence of the joint written with the axes of the article, the first two rotations being about the
+    # axes of the parent segment and the last one about the axis of the child segment
+    isb_sequences = _map_unique(
+        dataframe["joint"], lambda joint: EulerSequence.isb_from_joint_type(JointType.from_string(joint)).value
+    )
+    adapted_sequences = np.full(dataframe.shape[0], "", dtype=object)
+    for position, type_segment in enumerate(("proximal", "proximal", "distal")):
+        letters = pd.Series(isb_sequences, dtype=object).str[position].to_numpy(dtype=object)
+        for isb_axis, direction in ISB_AXIS_DIRECTIONS.items():
+            is_axis = letters == isb_axis
+            adapted_sequences[is_axis] += segment_axes[type_segment][direction][is_axis]
+
+    flags["is_euler_sequence_isb"] = adapted_sequences == dataframe["euler_sequence"].to_numpy(dtype=object)
+
+    return flags[FLAG_COLUMNS]
+
+
+def score_confidence(flags: pd.DataFrame, type_risk: str = "rotation", coefficients: np.ndarray = None) -> np.ndarray:
+    """
+    The confidence of all the rows in one product, the same as Deviation.confidence_total for the rotations
+    and Deviation.confidence_segment for the displacements.
+
+    Parameters
+    ----------
+    flags: pd.DataFrame
+        The risk flags, see risk_flags
+    type_risk: str
+        "rotation" or "displacement"
+    coefficients: np.ndarray
+        The risk coefficients, shape (segment types, risk types, risk kinds), DEFAULT_RISK_COEFFICIENTS by default
+
+    Returns
+    -------
+    np.ndarray
+        The confidence of each row, shape (N,)
+    """
+    coefficients = DEFAULT_RISK_COEFFICIENTS if coefficients is None else np.asarray(coefficients, dtype=float)
+    if coefficients.shape != DEFAULT_RISK_COEFFICIENTS.shape:
+        raise ValueError(f"coefficients must be of shape {DEFAULT_RISK_COEFFICIENTS.shape}, got {coefficients.shape}.")
+
+    risk_index = RISK_TYPES.index(type_risk)
+    # shape (N, segment types, risk kinds), in the order of the coefficients
+    is_at_risk = np.stack(
+        [
+            flags[[f"{type_segment}_mislabeled", f"{type_segment}_wrong_sens", f"{type_segment}_not_isb_origin"]]
+            for type_segment in SEGMENT_TYPES
+        ],
+        axis=1,
+    ).astype(bool)
+
+    confidence = np.where(is_at_risk, coefficients[np.newaxis, :, risk_index, :], 1.0).prod(axis=(1, 2))
+    if type_risk == "rotation":
+        confidence *= np.where(flags["is_euler_sequence_isb"].to_numpy(dtype=bool), 1.0, NON_ISB_SEQUENCE_COEFFICIENT)
+
+    return confidence
+
+
+def confidence_table(dataframe: pd.DataFrame, coefficients: np.ndarray = None) -> pd.DataFrame:
+    """
+    The risk flags and the confidence of the rotations and displacements of all the rows of the dataset table.
+
+    Parameters
+    ----------
+    dataframe: pd.DataFrame
+        The rows of the dataset, with valid parent and child segment definitions
+    coefficients: np.ndarray
+        The risk coefficients, shape (segment types, risk types, risk kinds), DEFAULT_RISK_COEFFICIENTS by default
+
+    Returns
+    -------
+    pd.DataFrame
+        One line per row of dataframe, with the same index, see CONFIDENCE_COLUMNS
+    """
+    table = risk_flags(dataframe)
+    table["rotation_confidence"] = score_confidence(table, "rotation", coefficients)
+    table["displacement_confidence"] = score_confidence(table, "displacement", coefficients)
+    return table[CONFIDENCE_COLUMNS]
@@ -3,7 +3,10 @@ import numpy as np
 
 from ..biomech_system import BiomechCoordinateSystem
 from ..enums import EulerSequence
-from ..utils import mat_2_rotation
+from ..utils import mat_2_rotation, flip_rotations_batch, wrap_angles
+
+# below this value of the sine (or cosine) of the second angle, the first and third axes are considered aligned
+GIMBAL_LOCK_TOLERANCE = 1e-7
 
 
 def get_angle_conversion_callback_from_tuple(tuple_factors: tuple[int, int, int]) -> callable:
@@ -17,6 +20,127 @@ def get_angle_conversion_callback_from_tuple(tuple_factors: tuple[int, int, int]
     )
 
 
+def get_sign_factors_from_frame_matrices(
+    child_matrix: np.ndarray,
+    parent_matrix: np.ndarray,
+    previous_sequence_str: str,
+    new_sequence_str: str,
+) -> tuple[int, int, int] | None:
+    """
+    Find the factors (1 or -1) turning the euler angles of the previous sequence into the ones of the new sequence,
+    for a joint rotation matrix converted into child_matrix @ R @ parent_matrix.T.
+
+    When both matrices are the same signed permutation Q, each elementary rotation about the axis e of the previous
+    sequence becomes Q @ R_e(angle) @ Q.T = R_(det(Q) Q e)(angle), i.e. a rotation about a cartesian axis of the same
+    or of the opposite sense. If these axes are the ones of the new sequence, the angles only need a sign change.
+
+    Parameters
+    ----------
+    child_matrix: np.ndarray
+        The matrix applied on the left of the joint rotation matrix, shape (3, 3)
+    parent_matrix: np.ndarray
+        The matrix whose transpose is applied on the right of the joint rotation matrix, shape (3, 3)
+    previous_sequence_str: str
+        The euler sequence of the angles, e.g. "zxy"
+    new_sequence_str: str
+        The euler sequence wanted, e.g. "yxz"
+
+    Returns
+    -------
+    tuple[int, int, int] | None
+        The factors of each angle, None if the conversion needs the full rotation matrix
+    """
+    if not np.allclose(child_matrix, parent_matrix, rtol=0, atol=1e-12):
+        return None
+
+    signed_permutation = np.round(child_matrix)
+    is_signed_permutation = (
+        np.allclose(child_matrix, signed_permutation, rtol=0, atol=1e-12)
+        and np.all(np.abs(signed_permutation).sum(axis=0) == 1)
+        and np.all(np.abs(signed_permutation).sum(axis=1) == 1)
+    )
+    if not is_signed_permutation:
+        return None
+
+    determinant = np.round(np.linalg.det(signed_permutation))
+    factors = ()
+    for previous_axis, new_axis in zip(previous_sequence_str.lower(), new_sequence_str.lower()):
+        rotated_axis = determinant * signed_permutation[:, "xyz".index(previous_axis)]
+        factor = rotated_axis["xyz".index(new_axis)]
+        if factor == 0:
+            return None
+        factors += (int(factor),)
+
+    return factors
+
+
+def euler_conditioning(angles: np.ndarray, euler_sequence: EulerSequence) -> np.ndarray:
+    """
+    The conditioning of the decomposition of each sample into euler angles, |sin| of the second angle for Euler
+    sequences, e.g. yxy, and |cos| of the second angle for Tait-Bryan sequences, e.g. yxz. It goes from 1, far from
+    the gimbal lock, to 0 when the first and third axes are aligned and only their sum, or difference, is defined.
+
+    Parameters
+    ----------
+    angles: np.ndarray
+        The euler angles in radians, shape (N, 3)
+    euler_sequence: EulerSequence
+        The euler sequence of the angles
+
+    Returns
+    -------
+    np.ndarray
+        The conditioning of each sample, shape (N,)
+    """
+    sequence = euler_sequence.value.lower()
+    return np.abs(np.sin(angles[:, 1]) if sequence[0] == sequence[2] else np.cos(angles[:, 1]))
+
+
+def apply_sign_factors(angles: np.ndarray, tuple_factors: tuple[int, int, int], euler_sequence: EulerSequence):
+    """
+    Apply the factors (1 or -1) to a series of euler angles and return them on the same branch as
+    rotation_matrices_2_euler_angles, so that both ways give the same angles.
+
+    Parameters
+    ----------
+    angles: np.ndarray
+        The euler angles in radians, shape (N, 3)
+    tuple_factors: tuple[int, int, int]
+        The factor of each angle, see get_sign_factors_from_frame_matrices
+    euler_sequence: EulerSequence
+        The euler sequence of the angles once the factors are applied
+
+    Returns
+    -------
+    np.ndarray
+        The euler angles in radians, shape (N, 3)
+    """
+    if not all([x in [-1, 1] for x in tuple_factors]):
+        raise ValueError("tuple_factors must be a tuple of 1 and -1")
+
+    sequence = euler_sequence.value.lower()
+    angles = wrap_angles(angles * np.array(tuple_factors))
+
+    # get back to the principal branch of the second angle
+    if sequence[0] == sequence[2]:  # Euler angles
+        is_flipped = angles[:, 1] < 0
+    else:  # Tait-Bryan angles
+        is_flipped = np.abs(angles[:, 1]) > np.pi / 2
+    angles[is_flipped] = flip_rotations_batch(angles[is_flipped], sequence)
+
+    # the gimbal locked samples are split between the first and third angles as with rotation matrices
+    is_locked = euler_conditioning(angles, euler_sequence) < GIMBAL_LOCK_TOLERANCE
+    if np.any(is_locked):
+        angles[is_locked] = rotation_matrices_2_euler_angles(
+            from_euler_angles_to_rotation_matrices(sequence, angles[is_locked]), euler_sequence
+        )
+
+    # a missing angle makes the whole rotation unknown, as with rotation matrices
+    angles[np.isnan(angles).any(axis=1)] = np.nan
+
+    return angles
+
+
 def convert_euler_angles(previous_sequence_str: str, new_sequence_str: str, rot1, rot2, rot3) -> np.ndarray:
     """Convert Euler angles from one sequence to another"""
     r = biorbd.Rotation.fromEulerAngles(np.array([rot1, rot2, rot3]), seq=previous_sequence_str)
@@ -46,6 +170,215 @@ def from_euler_angles_to_rotation_matrix(
     return rotation_matrix
 
 
+def elementary_rotation_matrices(axis: str, angles: np.ndarray) -> np.ndarray:
+    """
+    Returns the rotation matrices about a cartesian axis for a series of angles
+
+    Parameters
+    ----------
+    axis: str
+        "x", "y" or "z"
+    angles: np.ndarray
+        The angles in radians, shape (N,)
+
+    Returns
+    -------
+    np.ndarray
+        The rotation matrices, shape (N, 3, 3)
+    """
+    i = "xyz".index(axis)
+    j, k = (i + 1) % 3, (i + 2) % 3
+
+    cos, sin = np.cos(angles), np.sin(angles)
+    matrices = np.zeros((angles.shape[0], 3, 3))
+    matrices[:, i, i] = 1
+    matrices[:, j, j] = cos
+    matrices[:, j, k] = -sin
+    matrices[:, k, j] = sin
+    matrices[:, k, k] = cos
+
+    return matrices
+
+
+def from_euler_angles_to_rotation_matrices(previous_sequence_str: str, angles: np.ndarray) -> np.ndarray:
+    """
+    Batch version of from_euler_angles_to_rotation_matrix, the rotations are applied about the moving axes,
+    e.g. R = Rx(rot1) @ Ry(rot2) @ Rz(rot3) for the sequence "xyz".
+
+    Parameters
+    ----------
+    previous_sequence_str: str
+        The euler sequence, e.g. "yxz"
+    angles: np.ndarray
+        The euler angles in radians, shape (N, 3)
+
+    Returns
+    -------
+    np.ndarray
+        The rotation matrices, shape (N, 3, 3)
+    """
+    sequence = previous_sequence_str.lower()
+    return (
+        elementary_rotation_matrices(sequence[0], angles[:, 0])
+        @ elementary_rotation_matrices(sequence[1], angles[:, 1])
+        @ elementary_rotation_matrices(sequence[2], angles[:, 2])
+    )
+
+
+def rotation_matrices_2_euler_angles(rotation_matrices: np.ndarray, euler_sequence: EulerSequence) -> np.ndarray:
+    """
+    Batch version of rotation_matrix_2_euler_angles, the angles are returned on the same branch as biorbd:
+
+    - First angle belongs to [-pi, pi]
+    - Second angle belongs to [-pi/2, pi/2] if all axes are different, e.g., xyz,
+      [0, pi] if first and third axes are the same, e.g., yxy
+    - Third angle belongs to [-pi, pi]
+
+    Parameters
+    ----------
+    rotation_matrices: np.ndarray
+        The rotation matrices, shape (N, 3, 3)
+    euler_sequence: EulerSequence
+        The euler sequence to decompose the rotation matrices into
+
+    Returns
+    -------
+    np.ndarray
+        The euler angles in radians, shape (N, 3)
+    """
+    sequence = euler_sequence.value.lower()
+    i, j = "xyz".index(sequence[0]), "xyz".index(sequence[1])
+    k = 3 - i - j
+    # +1 for a cyclic permutation of xyz, e.g., yzx, -1 otherwise, e.g., yxz
+    sign = 1 if (j - i) % 3 == 1 else -1
+
+    r = rotation_matrices
+    angles = np.zeros((r.shape[0], 3))
+    if sequence[0] == sequence[2]:  # Euler angles
+        angles[:, 0] = np.arctan2(r[:, j, i], -sign * r[:, k, i])
+        angles[:, 1] = np.arccos(np.clip(r[:, i, i], -1, 1))
+        angles[:, 2] = np.arctan2(r[:, i, j], sign * r[:, i, k])
+    else:  # Tait-Bryan angles
+        angles[:, 0] = np.arctan2(-sign * r[:, j, k], r[:, k, k])
+        angles[:, 1] = np.arcsin(np.clip(sign * r[:, i, k], -1, 1))
+        angles[:, 2] = np.arctan2(-sign * r[:, i, j], r[:, i, i])
+
+    is_locked = euler_conditioning(angles, euler_sequence) < GIMBAL_LOCK_TOLERANCE
+    if np.any(is_locked):
+        # the first and third rotations share the same axis, the third angle is set to zero
+        # and the first one is identified from R @ R_second.T = R_first
+        first_rotations = r[is_locked] @ elementary_rotation_matrices(sequence[1], angles[is_locked, 1]).transpose(
+            (0, 2, 1)
+        )
+        angles[is_locked, 0] = np.arctan2(
+            first_rotations[:, (i + 2) % 3, (i + 1) % 3], first_rotations[:, (i + 1) % 3, (i + 1) % 3]
+        )
+        angles[is_locked, 2] = 0
+
+    return angles
+
+
+def rotation_matrices_to_quaternions(rotation_matrices: np.ndarray) -> np.ndarray:
+    """
+    Convert rotation matrices into unit quaternions, scalar first, with a non-negative scalar part.
+    Each quaternion is computed from the largest of the trace and the diagonal terms to stay accurate
+    near the half turns.
+
+    Parameters
+    ----------
+    rotation_matrices: np.ndarray
+        The rotation matrices, shape (N, 3, 3)
+
+    Returns
+    -------
+    np.ndarray
+        The quaternions (w, x, y, z), shape (N, 4)
+    """
+    r = rotation_matrices
+    trace = r[:, 0, 0] + r[:, 1, 1] + r[:, 2, 2]
+
+    # 4 w^2, 4 x^2, 4 y^2 and 4 z^2
+    squares = 1 + np.stack([trace, 2 * r[:, 0, 0] - trace, 2 * r[:, 1, 1] - trace, 2 * r[:, 2, 2] - trace], axis=1)
+    s = 2 * np.sqrt(np.maximum(squares, 0))
+    # 4 wx, 4 wy, 4 wz, 4 xy, 4 xz and 4 yz
+    wx, wy, wz = r[:, 2, 1] - r[:, 1, 2], r[:, 0, 2] - r[:, 2, 0], r[:, 1, 0] - r[:, 0, 1]
+    xy, xz, yz = r[:, 0, 1] + r[:, 1, 0], r[:, 0, 2] + r[:, 2, 0], r[:, 1, 2] + r[:, 2, 1]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        candidates = np.stack(
+            [
+                np.stack([s[:, 0] ** 2 / 4, wx, wy, wz], axis=1) / s[:, 0:1],
+                np.stack([wx, s[:, 1] ** 2 / 4, xy, xz], axis=1) / s[:, 1:2],
+                np.stack([wy, xy, s[:, 2] ** 2 / 4, yz], axis=1) / s[:, 2:3],
+                np.stack([wz, xz, yz, s[:, 3] ** 2 / 4], axis=1) / s[:, 3:4],
+            ],
+            axis=1,
+        )
+
+    # NaN matrices give NaN quaternions
+    best = np.argmax(np.nan_to_num(s, nan=-1.0), axis=1)
+    quaternions = candidates[np.arange(r.shape[0]), best]
+    quaternions[np.isnan(r).any(axis=(1, 2))] = np.nan
+    quaternions /= np.linalg.norm(quaternions, axis=1, keepdims=True)
+
+    return np.where(quaternions[:, :1] < 0, -quaternions, quaternions)
+
+
+def quaternions_to_rotation_matrices(quaternions: np.ndarray) -> np.ndarray:
+    """
+    Convert quaternions, scalar first, into rotation matrices, the quaternions being normalized first.
+
+    Parameters
+    ----------
+    quaternions: np.ndarray
+        The quaternions (w, x, y, z), shape (N, 4)
+
+    Returns
+    -------
+    np.ndarray
+        The rotation matrices, shape (N, 3, 3)
+    """
+    w, x, y, z = (quaternions / np.linalg.norm(quaternions, axis=1, keepdims=True)).T
+
+    return np.stack(
+        [
+            np.stack([1 - 2 * (y**2 + z**2), 2 * (x * y - w * z), 2 * (x * z + w * y)], axis=1),
+            np.stack([2 * (x * y + w * z), 1 - 2 * (x**2 + z**2), 2 * (y * z - w * x)], axis=1),
+            np.stack([2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x**2 + y**2)], axis=1),
+        ],
+        axis=1,
+    )
+
+
+def isb_framed_rotation_matrices_from_euler_angles(
+    previous_sequence_str: str,
+    angles: np.ndarray,
+    bsys_parent: BiomechCoordinateSystem,
+    bsys_child: BiomechCoordinateSystem,
+) -> np.ndarray:
+    """
+    Batch version of isb_framed_rotation_matrix_from_euler_angles
+
+    Parameters
+    ----------
+    previous_sequence_str: str
+        The euler sequence of the angles, e.g. "yxz"
+    angles: np.ndarray
+        The euler angles in radians, shape (N, 3)
+    bsys_parent: BiomechCoordinateSystem
+        The parent segment coordinate system
+    bsys_child: BiomechCoordinateSystem
+        The child segment coordinate system
+
+    Returns
+    -------
+    np.ndarray
+        The joint rotation matrices in a ISB-like manner, shape (N, 3, 3)
+    """
+    rotation_matrices = from_euler_angles_to_rotation_matrices(previous_sequence_str, angles)
+    return bsys_child.get_rotation_matrix() @ rotation_matrices @ bsys_parent.get_rotation_matrix().T
+
+
 def isb_framed_rotation_matrix_from_euler_angles(
     previous_sequence_str: str,
     rot1,
@@ -91,7 +424,10 @@ def set_corrections_on_rotation_matrix(
     child_matrix_correction: np.ndarray,
     parent_matrix_correction: np.ndarray,
 ):
-    """Returns the rotation matrix with the child and parent correction applied"""
+    """
+    Returns the rotation matrix with the child and parent correction applied,
+    it also applies to a series of rotation matrices of shape (N, 3, 3)
+    """
     return child_matrix_correction @ matrix @ parent_matrix_correction.T
 
 
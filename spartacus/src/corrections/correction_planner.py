@@ -0,0 +1,78 @@
+"""
+This module decides, once per row, how the series have to be transformed to get the corrected ones,
+so that the identity and the permutations of axes don't go through rotation matrices.
+"""
+
+import numpy as np
+
+from .angle_conversion_callbacks import get_sign_factors_from_frame_matrices
+from ..enums import CorrectionPlan
+
+MIRROR_MATRIX = np.diag([1, 1, -1])
+
+
+def plan_rotation_correction(
+    child_matrix: np.ndarray,
+    parent_matrix: np.ndarray,
+    previous_sequence_str: str,
+    new_sequence_str: str,
+) -> tuple[CorrectionPlan, tuple[int, int, int] | None]:
+    """
+    Plan the correction of the euler angles of a row, the joint rotation matrix being converted into
+    child_matrix @ R @ parent_matrix.T
+
+    Parameters
+    ----------
+    child_matrix: np.ndarray
+        The matrix applied on the left of the joint rotation matrix, shape (3, 3)
+    parent_matrix: np.ndarray
+        The matrix whose transpose is applied on the right of the joint rotation matrix, shape (3, 3)
+    previous_sequence_str: str
+        The euler sequence of the angles, e.g. "zxy"
+    new_sequence_str: str
+        The euler sequence wanted, e.g. "yxz"
+
+    Returns
+    -------
+    tuple[CorrectionPlan, tuple[int, int, int] | None]
+        The plan and the sign factors to apply if the plan is not a rotation matrix round trip
+    """
+    sign_factors = get_sign_factors_from_frame_matrices(
+        child_matrix, parent_matrix, previous_sequence_str, new_sequence_str
+    )
+    if sign_factors is None:
+        return CorrectionPlan.ROTATION_MATRIX, None
+
+    if previous_sequence_str.lower() == new_sequence_str.lower():
+        if sign_factors == (1, 1, 1):
+            return CorrectionPlan.IDENTITY, sign_factors
+        if np.array_equal(child_matrix, MIRROR_MATRIX):
+            return CorrectionPlan.MIRROR, sign_factors
+
+    return CorrectionPlan.SIGN_FACTORS, sign_factors
+
+
+def plan_translation_correction(translation_matrix: np.ndarray) -> CorrectionPlan:
+    """
+    Plan the correction of the translations of a row, the translations being converted into translation_matrix @ t
+
+    Parameters
+    ----------
+    translation_matrix: np.ndarray
+        The matrix applied on the translations, shape (3, 3)
+
+    Returns
+    -------
+    CorrectionPlan
+        The plan of the correction
+    """
+    if np.array_equal(translation_matrix, np.eye(3)):
+        return CorrectionPlan.IDENTITY
+    if np.array_equal(translation_matrix, MIRROR_MATRIX):
+        return CorrectionPlan.MIRROR
+
+    signed_permutation = np.round(translation_matrix)
+    if np.array_equal(translation_matrix, signed_permutation) and np.all(np.abs(signed_permutation).sum(axis=0) == 1):
+        return CorrectionPlan.SIGN_FACTORS
+
+    return CorrectionPlan.ROTATION_MATRIX
@@ -0,0 +1,188 @@
+"""
+This module computes normative corridors, i.e. the mean, standard deviation and percentiles across studies of the
+series of each joint, degree of freedom and humeral motion, on a common humerothoracic grid.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .angle_series import LEGEND_COLUMNS, VALUE_COLUMNS
+
+DEFAULT_GRID = np.arange(0.0, 181.0, 1.0)
+PERCENTILES = (5, 25, 50, 75, 95)
+
+CORRIDOR_KEYS = ["joint", "humeral_motion"]
+
+CORRIDOR_COLUMNS = [
+    "joint",  # string
+    "humeral_motion",  # string
+    "degree_of_freedom",  # int
+    "biomechanical_dof",  # string
+    "humerothoracic_angle",  # float, the grid
+    "unit",  # string "rad" or "mm"
+    "mean",  # float
+    "sd",  # float
+    "p5",  # float
+    "p25",  # float
+    "p50",  # float
+    "p75",  # float
+    "p95",  # float
+    "nb_series",  # int, the number of series covering the humerothoracic angle
+]
+
+
+def resample_on_grid(wide_dataframe: pd.DataFrame, grid: np.ndarray) -> tuple[pd.DataFrame, np.ndarray]:
+    """
+    Resample all the series on the same humerothoracic grid with a single linear interpolation, each series being
+    shifted along the humerothoracic axis so that they can be stacked one after the other. The grid points outside
+    of the range of a series are NaN, no extrapolation is done.
+
+    Parameters
+    ----------
+    wide_dataframe: pd.DataFrame
+        The series in the wide layout, see WIDE_COLUMNS
+    grid: np.ndarray
+        The humerothoracic angles to resample the series on, shape (G,)
+
+    Returns
+    -------
+    tuple[pd.DataFrame, np.ndarray]
+        The first line of each series, and the resampled values, shape (S, G, 3)
+    """
+    wide_dataframe = wide_dataframe[wide_dataframe["humerothoracic_angle"].notna()]
+    # a stable sort keeps the order of the series
+    wide_dataframe = wide_dataframe.sort_values(["row_id", "humerothoracic_angle"], kind="stable")
+    grid = np.asarray(grid, dtype=float)
+
+    row_id = wide_dataframe["row_id"].to_numpy()
+    nb_samples = row_id.shape[0]
+    if nb_samples == 0:
+        return wide_dataframe, np.zeros((0, grid.shape[0], 3))
+
+    starts = np.flatnonzero(np.concatenate(([True], row_id[1:] != row_id[:-1])))
+    lengths = np.diff(np.append(starts, nb_samples))
+    nb_series = starts.shape[0]
+
+    angle = wide_dataframe["humerothoracic_angle"].to_numpy(dtype=float)
+    values = wide_dataframe[VALUE_COLUMNS].to_numpy(dtype=float)
+
+    # shift each series far enough from the previous one so that they never overlap
+    lowest = min(angle.min(), grid.min())
+    shift = max(angle.max(), grid.max()) - lowest + 1
+    series_shift = shift * np.arange(nb_series)
+    shifted_angle = angle - lowest + np.repeat(series_shift, lengths)
+    shifted_grid = (grid - lowest)[np.newaxis, :] + series_shift[:, np.newaxis]
+
+    resampled = np.stack(
+        [np.interp(shifted_grid.ravel(), shifted_angle, values[:, dof]).reshape(nb_series, -1) for dof in range(3)],
+        axis=2,
+    )
+
+    first_angle = angle[starts]
+    last_angle = angle[starts + lengths - 1]
+    is_outside = (grid[np.newaxis, :] < first_angle[:, np.newaxis]) | (grid[np.newaxis, :] > last_angle[:, np.newaxis])
+    resampled[is_outside] = np.nan
+
+    return wide_dataframe.iloc[starts], resampled
+
+
+def weighted_statistics(values: np.ndarray, weights: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Reduce stacked series into their weighted mean, standard deviation and percentiles, ignoring the NaN values.
+    The percentiles follow the weighted midpoint rule, the i-th sorted value being at the cumulated weight of the
+    previous values plus half of its own weight, which gives the "hazen" percentiles when all weights are equal.
+
+    Parameters
+    ----------
+    values: np.ndarray
+        The series, shape (S, ...)
+    weights: np.ndarray
+        The weight of each series, shape (S,)
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        "mean", "sd", "p5", ..., "p95" and "nb_series", each of shape (...)
+    """
+    weights = np.asarray(weights, dtype=float).reshape((-1,) + (1,) * (values.ndim - 1))
+    is_valid = ~np.isnan(values)
+    valid_weights = np.where(is_valid, weights, 0.0)
+    valid_values = np.where(is_valid, values, 0.0)
+
+    total_weight = valid_weights.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = (valid_weights * valid_values).sum(axis=0) / total_weight
+        sd = np.sqrt((valid_weights * (valid_values - mean) ** 2).sum(axis=0) / total_weight)
+
+    statistics = {"mean": mean, "sd": sd}
+
+    # NaN values are sorted last and weigh nothing
+    order = np.argsort(values, axis=0)
+    sorted_values = np.take_along_axis(values, order, axis=0)
+    sorted_weights = np.take_along_axis(valid_weights, order, axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        positions = (np.cumsum(sorted_weights, axis=0) - sorted_weights / 2) / total_weight
+    positions = np.where(sorted_weights > 0, positions, np.inf)
+    nb_valid = is_valid.sum(axis=0)
+
+    for percentile in PERCENTILES:
+        quantile = percentile / 100
+        upper = np.minimum((positions < quantile).sum(axis=0), np.maximum(nb_valid - 1, 0))
+        lower = np.maximum(upper - 1, 0)
+        lower_position = np.take_along_axis(positions, lower[np.newaxis], axis=0)[0]
+        upper_position = np.take_along_axis(positions, upper[np.newaxis], axis=0)[0]
+        lower_value = np.take_along_axis(sorted_values, lower[np.newaxis], axis=0)[0]
+        upper_value = np.take_along_axis(sorted_values, upper[np.newaxis], axis=0)[0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.clip((quantile - lower_position) / (upper_position - lower_position), 0, 1)
+        ratio = np.where(upper == lower, 0.0, ratio)
+        statistics[f"p{percentile}"] = np.where(nb_valid > 0, lower_value + ratio * (upper_value - lower_value), np.nan)
+
+    statistics["nb_series"] = nb_valid
+
+    return statistics
+
+
+def compute_corridors(
+    wide_dataframe: pd.DataFrame, grid: np.ndarray = None, weighted: bool = False, min_series: int = 1
+) -> pd.DataFrame:
+    """
+    Compute the corridors of every joint and humeral motion of the series, for the three degrees of freedom.
+
+    Parameters
+    ----------
+    wide_dataframe: pd.DataFrame
+        The series in the wide layout, see WIDE_COLUMNS, either angles or translations
+    grid: np.ndarray
+        The humerothoracic angles of the corridors, DEFAULT_GRID by default
+    weighted: bool
+        If True, each series is weighted by its confidence, otherwise all series weigh the same
+    min_series: int
+        The statistics of a grid point covered by fewer series are NaN
+
+    Returns
+    -------
+    pd.DataFrame
+        One line per joint, humeral motion, degree of freedom and grid point, see CORRIDOR_COLUMNS
+    """
+    grid = DEFAULT_GRID if grid is None else np.asarray(grid, dtype=float)
+    series, values = resample_on_grid(wide_dataframe, grid)
+
+    corridors = [pd.DataFrame(columns=CORRIDOR_COLUMNS)]
+    for key, group in series.reset_index(drop=True).groupby(CORRIDOR_KEYS, sort=False):
+        weights = group["confidence"].to_numpy(dtype=float) if weighted else np.ones(group.shape[0])
+        statistics = weighted_statistics(values[group.index.to_numpy()], weights)
+        is_scarce = statistics["nb_series"] < min_series
+
+        for dof in range(3):
+            corridor = pd.DataFrame({"humerothoracic_angle": grid})
+            corridor["joint"], corridor["humeral_motion"] = key
+            corridor["degree_of_freedom"] = dof + 1
+            corridor["biomechanical_dof"] = group[LEGEND_COLUMNS[dof]].iloc[0]
+            corridor["unit"] = group["unit"].iloc[0]
+            for name, statistic in statistics.items():
+                statistic = statistic[:, dof]
+                corridor[name] = statistic if name == "nb_series" else np.where(is_scarce[:, dof], np.nan, statistic)
+            corridors.append(corridor[CORRIDOR_COLUMNS])
+
+    return pd.concat(corridors, ignore_index=True)
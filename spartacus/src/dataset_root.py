@@ -0,0 +1,128 @@
+"""
+This module resolves the root of the dataset, the folder holding the dataset tables, the study folders and the
+exports, so that several versions or scratch copies of the corpus can be used side by side, e.g. on a fast local
+disk, and parallel jobs do not overwrite each other's exports.
+
+A root follows the layout of the package:
+
+    root/
+        dataset/    dataset_clean.csv, only_dataset_raw.csv and the exports
+        data/       one folder per study, e.g. "#1_Begon_et_al", with the csv files of the series
+        cache/      the files the library keeps between sessions
+
+The root is the one given explicitly, else the one of the SPARTACUS_DATASET_ROOT environment variable, else the
+package itself.
+"""
+
+import os
+from pathlib import Path
+
+from .enums import DatasetCSV
+from .study_registry import StudyRegistry, read_manifest_millimeters_factor
+
+DATASET_ROOT_ENVIRONMENT_VARIABLE = "SPARTACUS_DATASET_ROOT"
+PACKAGE_DATASET_ROOT = Path(DatasetCSV.CLEAN.value).parent.parent
+
+
+class DatasetRoot:
+    """
+    The folders and files of a dataset root.
+    """
+
+    def __init__(self, path: str | Path = None):
+        """
+        Parameters
+        ----------
+        path: str | Path
+            The root folder, the SPARTACUS_DATASET_ROOT environment variable or the package by default
+        """
+        if path is None:
+            path = os.environ.get(DATASET_ROOT_ENVIRONMENT_VARIABLE) or PACKAGE_DATASET_ROOT
+        self.path = Path(path).expanduser().absolute()
+        if not self.path.is_dir():
+            raise ValueError(f"The dataset root {self.path} is not a folder.")
+        self._registry = None
+
+    def __repr__(self):
+        return f"DatasetRoot({str(self.path)!r})"
+
+    def __eq__(self, other):
+        return isinstance(other, DatasetRoot) and self.path == other.path
+
+    def __hash__(self):
+        return hash(self.path)
+
+    @property
+    def is_package(self) -> bool:
+        """True if the root is the package itself"""
+        return self.path == PACKAGE_DATASET_ROOT.absolute()
+
+    @property
+    def dataset_folder(self) -> Path:
+        return self.path / "dataset"
+
+    @property
+    def data_folder(self) -> Path:
+        return self.path / "data"
+
+    @property
+    def clean_csv(self) -> Path:
+        return self.dataset_folder / Path(DatasetCSV.CLEAN.value).name
+
+    @property
+    def raw_csv(self) -> Path:
+        return self.dataset_folder / Path(DatasetCSV.RAW.value).name
+
+    @property
+    def export_folder(self) -> Path:
+        """The folder of the exported series, next to the clean dataset"""
+        return self.dataset_folder
+
+    @property
+    def cache_folder(self) -> Path:
+        """The folder of the files kept between sessions, created on first access"""
+        cache_folder = self.path / "cache"
+        cache_folder.mkdir(exist_ok=True)
+        return cache_folder
+
+    def discover_studies(self) -> dict[str, Path]:
+        """
+        The study folders of the root, the folders of data holding csv files, by folder name.
+
+        Returns
+        -------
+        dict[str, Path]
+            The path of each study folder, sorted by name
+        """
+        if not self.data_folder.is_dir():
+            return {}
+        return {
+            folder.name: folder
+            for folder in sorted(self.data_folder.iterdir())
+            if folder.is_dir() and any(file.suffix == ".csv" for file in folder.iterdir())
+        }
+
+    @property
+    def registry(self) -> StudyRegistry:
+        """The index of the study folders, built on first access, see StudyRegistry"""
+        if self._registry is None:
+            self._registry = StudyRegistry(self)
+        return self._registry
+
+    def folder_path(self, data_folder: str) -> Path:
+        """
+        The path of a study folder, given by its name as in the "folder" column, e.g. "#1_Begon_et_al",
+        or by an absolute path.
+        """
+        if Path(data_folder).is_absolute():
+            return Path(data_folder)
+        return self.registry.folder_path(data_folder)
+
+    def millimeters_factor(self, data_folder: str) -> float:
+        """
+        The factor to apply on the translations of the csv files of a study folder to get millimeters, given by the
+        manifest of the folders given by an absolute path, see StudyRegistry.millimeters_factor.
+        """
+        if Path(data_folder).is_absolute():
+            return read_manifest_millimeters_factor(data_folder)
+        return self.registry.millimeters_factor(data_folder)
@@ -1,3 +1,6 @@
+from .confidence import NON_ISB_SEQUENCE_COEFFICIENT
+
+
 class Deviation:
 
     @staticmethod
@@ -8,7 +11,7 @@ class Deviation:
         if row_data.is_joint_euler_angle_ISB_with_adaptation_from_segment():
             risk = 1.0
         else:
-            risk = 0.5
+            risk = NON_ISB_SEQUENCE_COEFFICIENT
         return risk
 
     @staticmethod
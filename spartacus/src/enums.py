@@ -41,71 +41,99 @@ class DataFolder(Enum):
 
     @classmethod
     def from_string(cls, data_folder: str):
-        folder_name_to_enum = {
-            "#1_Begon_et_al": cls.BEGON_2014,
-            "#2_Bourne_et_al": cls.BOURNE_2003,
-            "#3_Chu_et_al": cls.CHU_2012,  # "Chu et al 2012"
-            "#4_Fung_et_al": cls.FUNG_2001,  # "Fung et al 2001"
-            "#5_Gutierrez_Delgado_et_al": cls.GUTIERREZ_DELGADO_2017,  # "Gutierrez Delgado et al 2017"
-            "Kolz et al 2020": cls.KOLZ_2020,  # "Kolz et al 2020
-            "#7_Karduna_et_al": cls.MCCLURE_2001,
-            "#8_Kijima_et_al": cls.KIJIMA_2015,  # "Kijima et al 2015"
-            "#9_Kim_et_al": cls.KIM_2017,  # "Kim et al 2017"
-            "#10_Kozono_et_al": cls.KONOZO_2017,  # "Kozono et al 2017"
-            "#11_Ludewig_et_al": cls.LAWRENCE_2014,
-            "#12_Matsuki_et_al": cls.MATSUKI_2011,  # "Matsuki et al 2011"
-            # "Matsuki et al 2011": cls.MATSUKI_2011,
-            # "Matsuki et al 2012": cls.MATSUKI_2012,
-            # "Matsuki et al 2014": cls.MATSUKI_2014,
-            "#13_Matsumura_et_al": cls.MATSUMURA_2013,  # "Matsumura et al 2013"
-            "#14_Moissenet_et_al": cls.MOISSENET,  # "Moissenet et al"
-            "#15_Nishinaka_et_al": cls.NISHINAKA_2008,  # "Nishinaka et al 2008"
-            "#16_Oki_et_al": cls.OKI_2012,  # "Oki et al 2012"
-            "#17_Sahara_et_al": cls.SAHARA_2006,  # "Sahara et al 2006"
-            # "Sahara et al 2006": cls.SAHARA_2006,
-            # "Sahara et al 2007": cls.SAHARA_2007,
-            "#18_Sugi_et_al": cls.SUGI_2021,  # "Sugi et al 2021"
-            "#19_Teece_et_al": cls.TEECE_2008,  # "Teece et al 2008"
-            "#20_Yoshida_et_al": cls.YOSHIDA_2023,  # "Yoshida et al 2023"
-            # "#XX_Malberg": cls.MALBERG, TODO
-        }
-
-        the_enum = folder_name_to_enum.get(data_folder)
+        the_enum = FOLDER_NAME_TO_DATA_FOLDER.get(data_folder)
         if the_enum is None:
             raise ValueError(f"Unknown data folder: {data_folder}")
 
         return the_enum
 
-    def to_dataset_author(self):
-        enum_to_dataset_author = {
-            self.BEGON_2014: "Begon et al.",
-            self.BOURNE_2003: "Bourne et al.",
-            self.CHU_2012: "Chu et al.",
-            self.FUNG_2001: "Fung et al.",
-            self.GUTIERREZ_DELGADO_2017: "Gutierrez Delgado et al.",
-            self.KOLZ_2020: "Kolz et al.",
-            self.MCCLURE_2001: "McClure et al.",
-            self.KIJIMA_2015: "Kijima et al.",
-            self.KIM_2017: "Kim et al.",
-            self.KONOZO_2017: "Kozono et al.",
-            self.LAWRENCE_2014: "Lawrence et al.",
-            self.MATSUKI_2011: "Matsuki et al.",
-            self.MATSUMURA_2013: "Matsumura et al.",
-            self.MOISSENET: "Moissenet et al.",
-            self.NISHINAKA_2008: "Nishinaka et al.",
-            self.OKI_2012: "Oki et al.",
-            self.SAHARA_2006: "Sahara et al.",
-            self.SUGI_2021: "Sugi et al.",
-            self.TEECE_2008: "Teece et al.",
-            self.YOSHIDA_2023: "Yoshida et al.",
-        }
+    @classmethod
+    def folder_path(cls, data_folder: str) -> Path:
+        """
+        The path of a data folder, either the name of a folder of the package, e.g. "#1_Begon_et_al",
+        or the absolute path of a folder outside the package, e.g. the ones of a synthetic dataset.
+        """
+        if Path(data_folder).is_absolute():
+            return Path(data_folder)
+        return cls.from_string(data_folder).value
+
+    @classmethod
+    def translation_to_millimeters_factor_from_string(cls, data_folder: str) -> float:
+        """
+        The millimeters factor of a data folder of the package, a ValueError for the other folders, e.g. the ones of
+        another dataset root, whose factor is given by their manifest, see DatasetRoot.millimeters_factor.
+        """
+        return cls.from_string(data_folder).translation_to_millimeters_factor()
 
-        the_dataset_author = enum_to_dataset_author.get(self)
+    def to_dataset_author(self):
+        the_dataset_author = DATA_FOLDER_TO_DATASET_AUTHOR.get(self)
         if the_dataset_author is None:
             raise ValueError(f"Unknown data folder: {self}")
 
         return the_dataset_author
 
+    def translation_to_millimeters_factor(self) -> float:
+        """The factor to apply on the translations of the csv files of the folder to get them in millimeters"""
+        folders_in_meters = (
+            self.BEGON_2014,
+            self.KOLZ_2020,
+        )
+        return 1000.0 if self in folders_in_meters else 1.0
+
+
+# the data folders are looked up by folder name and give their dataset author, both mappings being built once
+FOLDER_NAME_TO_DATA_FOLDER = {
+    "#1_Begon_et_al": DataFolder.BEGON_2014,
+    "#2_Bourne_et_al": DataFolder.BOURNE_2003,
+    "#3_Chu_et_al": DataFolder.CHU_2012,  # "Chu et al 2012"
+    "#4_Fung_et_al": DataFolder.FUNG_2001,  # "Fung et al 2001"
+    "#5_Gutierrez_Delgado_et_al": DataFolder.GUTIERREZ_DELGADO_2017,  # "Gutierrez Delgado et al 2017"
+    "Kolz et al 2020": DataFolder.KOLZ_2020,  # "Kolz et al 2020
+    "#7_Karduna_et_al": DataFolder.MCCLURE_2001,
+    "#8_Kijima_et_al": DataFolder.KIJIMA_2015,  # "Kijima et al 2015"
+    "#9_Kim_et_al": DataFolder.KIM_2017,  # "Kim et al 2017"
+    "#10_Kozono_et_al": DataFolder.KONOZO_2017,  # "Kozono et al 2017"
+    "#11_Ludewig_et_al": DataFolder.LAWRENCE_2014,
+    "#12_Matsuki_et_al": DataFolder.MATSUKI_2011,  # "Matsuki et al 2011"
+    # "Matsuki et al 2011": DataFolder.MATSUKI_2011,
+    # "Matsuki et al 2012": DataFolder.MATSUKI_2012,
+    # "Matsuki et al 2014": DataFolder.MATSUKI_2014,
+    "#13_Matsumura_et_al": DataFolder.MATSUMURA_2013,  # "Matsumura et al 2013"
+    "#14_Moissenet_et_al": DataFolder.MOISSENET,  # "Moissenet et al"
+    "#15_Nishinaka_et_al": DataFolder.NISHINAKA_2008,  # "Nishinaka et al 2008"
+    "#16_Oki_et_al": DataFolder.OKI_2012,  # "Oki et al 2012"
+    "#17_Sahara_et_al": DataFolder.SAHARA_2006,  # "Sahara et al 2006"
+    # "Sahara et al 2006": DataFolder.SAHARA_2006,
+    # "Sahara et al 2007": DataFolder.SAHARA_2007,
+    "#18_Sugi_et_al": DataFolder.SUGI_2021,  # "Sugi et al 2021"
+    "#19_Teece_et_al": DataFolder.TEECE_2008,  # "Teece et al 2008"
+    "#20_Yoshida_et_al": DataFolder.YOSHIDA_2023,  # "Yoshida et al 2023"
+    # "#XX_Malberg": DataFolder.MALBERG, TODO
+}
+
+DATA_FOLDER_TO_DATASET_AUTHOR = {
+    DataFolder.BEGON_2014: "Begon et al.",
+    DataFolder.BOURNE_2003: "Bourne et al.",
+    DataFolder.CHU_2012: "Chu et al.",
+    DataFolder.FUNG_2001: "Fung et al.",
+    DataFolder.GUTIERREZ_DELGADO_2017: "Gutierrez Delgado et al.",
+    DataFolder.KOLZ_2020: "Kolz et al.",
+    DataFolder.MCCLURE_2001: "McClure et al.",
+    DataFolder.KIJIMA_2015: "Kijima et al.",
+    DataFolder.KIM_2017: "Kim et al.",
+    DataFolder.KONOZO_2017: "Kozono et al.",
+    DataFolder.LAWRENCE_2014: "Lawrence et al.",
+    DataFolder.MATSUKI_2011: "Matsuki et al.",
+    DataFolder.MATSUMURA_2013: "Matsumura et al.",
+    DataFolder.MOISSENET: "Moissenet et al.",
+    DataFolder.NISHINAKA_2008: "Nishinaka et al.",
+    DataFolder.OKI_2012: "Oki et al.",
+    DataFolder.SAHARA_2006: "Sahara et al.",
+    DataFolder.SUGI_2021: "Sugi et al.",
+    DataFolder.TEECE_2008: "Teece et al.",
+    DataFolder.YOSHIDA_2023: "Yoshida et al.",
+}
+
 
 class CartesianAxis(Enum):
     plusX = ("x", np.array([1, 0, 0]))
@@ -417,3 +445,13 @@ class Correction(Enum):
             raise ValueError(f"{correction} is not a valid correction method.")
 
         return the_enum
+
+
+class CorrectionPlan(Enum):
+    """Enum for the transform applied on the series of a row to get the corrected ones"""
+
+    IDENTITY = "identity"  # nothing to apply, the data are already ISB
+    MIRROR = "mirror"  # only the left side turned into the right side
+    SIGN_FACTORS = "sign_factors"  # permutation or sign change of the axes
+    ROTATION_MATRIX = "rotation_matrix"  # full rotation matrix round trip
+    COMPOSITION = "composition"  # rebuilt from the series of the two joints chaining the joint
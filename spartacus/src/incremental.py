@@ -0,0 +1,309 @@
+"""
+This module supports the incremental rebuild of the exported series. Each row of the dataset is identified by a hash
+of its columns and of the modification time and size of its csv files, the row manifest written next to the exports
+keeps the hash and the number of samples of each exported row, so that the next load only recomputes the rows added
+or changed since, reads the other ones back from the exports and drops the removed ones.
+
+The corrected and the uncorrected exports each have their own manifest, an export of one output only leaves the
+other ones and their manifest as they were. The hashes cover the code of the library too, see code_hash, all the
+rows are recomputed after it changed.
+The exports are csv files by default, or parquet or npz files, see FILE_FORMATS, each format with its own manifests.
+"""
+
+import functools
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .angle_series import from_long_format
+
+ROW_MANIFEST_FILENAME = "corrected_confident_data_manifest.csv"
+UNCORRECTED_ROW_MANIFEST_FILENAME = "confident_data_manifest.csv"
+# the folder of the code whose changes invalidate the exports
+CODE_FOLDER = Path(__file__).parent
+FILE_FORMATS = ("csv", "parquet", "npz")
+# the text of the npz files read back as None or booleans
+NPZ_TEXT_VALUES = {"": None, "True": True, "False": False}
+
+# the exported series, the attribute of Spartacus in the long layout, its file and its attribute in the wide layout
+EXPORTS = [
+    ("corrected_confident_data_values", "corrected_confident_data.csv", "_corrected_confident_data_wide"),
+    ("confident_data_values", "confident_data.csv", "_confident_data_wide"),
+    (
+        "corrected_confident_translation_data_values",
+        "corrected_confident_translation_data.csv",
+        "_corrected_confident_translation_data_wide",
+    ),
+    ("confident_translation_data_values", "confident_translation_data.csv", "_confident_translation_data_wide"),
+]
+CORRECTED_EXPORTS = [export for export in EXPORTS if export[0].startswith("corrected")]
+UNCORRECTED_EXPORTS = [export for export in EXPORTS if not export[0].startswith("corrected")]
+
+ROW_MANIFEST_COLUMNS = [
+    "row_hash",  # string, the sha256 of the columns of the row and of the stats of its csv files
+    "dataset_authors",  # string
+    "nb_samples",  # int, the number of samples of the angle series of the row, 0 if none
+    "nb_translation_samples",  # int, the number of samples of the translation series of the row, 0 if none
+]
+
+CSV_FIELDS = [
+    "dof_1st_euler",
+    "dof_2nd_euler",
+    "dof_3rd_euler",
+    "dof_translation_x",
+    "dof_translation_y",
+    "dof_translation_z",
+]
+
+# the columns added to the rows of the dataset when they are checked, not part of the dataset itself
+NON_DATASET_COLUMNS = ["callback_function"]
+
+
+def selected_exports(outputs: tuple[str, ...] = ("both",)) -> list[tuple[str, str, str]]:
+    """The exports of the requested outputs, among "raw", "corrected" and "both", see EXPORTS"""
+    corrected = "corrected" in outputs or "both" in outputs
+    uncorrected = "raw" in outputs or "both" in outputs
+    return [export for export in EXPORTS if (corrected if export in CORRECTED_EXPORTS else uncorrected)]
+
+
+def selected_corrections(outputs: tuple[str, ...] = ("both",)) -> list[bool]:
+    """The output sets of the requested outputs, True for the corrected exports and False for the uncorrected ones"""
+    corrections = []
+    if "corrected" in outputs or "both" in outputs:
+        corrections.append(True)
+    if "raw" in outputs or "both" in outputs:
+        corrections.append(False)
+    return corrections
+
+
+def check_file_format(file_format: str):
+    """Check the file format is among FILE_FORMATS"""
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f"file_format must be one of {FILE_FORMATS}, got {file_format}.")
+
+
+def export_path(export_folder: Path, file: str, file_format: str = "csv") -> Path:
+    """The path of an export in a file format, e.g. corrected_confident_data.parquet"""
+    return (Path(export_folder) / file).with_suffix(f".{file_format}")
+
+
+def row_manifest_path(export_folder: Path, file_format: str = "csv", correction: bool = True) -> Path:
+    """The path of the row manifest of the corrected or uncorrected exports in a file format, always a csv file"""
+    filename = ROW_MANIFEST_FILENAME if correction else UNCORRECTED_ROW_MANIFEST_FILENAME
+    if file_format == "csv":
+        return Path(export_folder) / filename
+    return Path(export_folder) / filename.replace(".csv", f"_{file_format}.csv")
+
+
+def write_export(dataframe: pd.DataFrame, file_path: Path, file_format: str = "csv"):
+    """
+    Write an exported series. Parquet requires pyarrow. The npz files hold one array per column, the text columns
+    being stored as strings, "" for None, so that they are read without pickle.
+    """
+    check_file_format(file_format)
+    if file_format == "csv":
+        dataframe.to_csv(file_path, index=False)
+    elif file_format == "parquet":
+        dataframe.to_parquet(file_path, index=False)
+    else:
+        columns = {
+            column: (
+                dataframe[column].map(lambda value: "" if value is None else str(value)).to_numpy(dtype=str)
+                if dataframe[column].dtype == object
+                else dataframe[column].to_numpy()
+            )
+            for column in dataframe.columns
+        }
+        with open(file_path, "wb") as file:
+            np.savez_compressed(file, **columns)
+
+
+def read_export(file_path: Path, file_format: str = "csv") -> pd.DataFrame:
+    """Read an exported series, see write_export"""
+    check_file_format(file_format)
+    if file_format == "csv":
+        return pd.read_csv(file_path)
+    if file_format == "parquet":
+        return pd.read_parquet(file_path)
+
+    with np.load(file_path) as arrays:
+        dataframe = pd.DataFrame({column: arrays[column] for column in arrays.files})
+    for column in dataframe.columns:
+        if dataframe[column].dtype.kind == "U" or dataframe[column].dtype == object:
+            dataframe[column] = [NPZ_TEXT_VALUES.get(value, value) for value in dataframe[column].tolist()]
+    return dataframe
+
+
+@functools.cache
+def code_hash() -> str:
+    """The hash of the sources of the library, computed once per session"""
+    content = hashlib.sha256()
+    for file in sorted(CODE_FOLDER.rglob("*.py")):
+        content.update(file.relative_to(CODE_FOLDER).as_posix().encode())
+        content.update(file.read_bytes())
+    return content.hexdigest()
+
+
+def row_hash(row: pd.Series, dataset_root) -> str:
+    """
+    The hash of a row of the dataset, of its columns, of the modification time and size of its csv files and of the
+    code of the library, see code_hash.
+
+    Parameters
+    ----------
+    row: pd.Series
+        The row of the dataset
+    dataset_root: DatasetRoot
+        The root holding the study folder of the row
+    """
+    values = {column: row[column] for column in row.index if column not in NON_DATASET_COLUMNS}
+
+    files = {}
+    try:
+        folder_path = dataset_root.folder_path(row["folder"])
+    except (ValueError, TypeError):
+        folder_path = None
+    for field in CSV_FIELDS:
+        if folder_path is None or row.get(field) is None:
+            continue
+        try:
+            stat = os.stat(Path(folder_path) / row[field])
+            files[field] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            files[field] = None
+
+    content = json.dumps({"row": values, "files": files, "code": code_hash()}, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def row_manifest(
+    dataframe: pd.DataFrame, hashes: list[str], angle_wide: pd.DataFrame, translation_wide: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    The row manifest of exported series, see ROW_MANIFEST_COLUMNS.
+
+    Parameters
+    ----------
+    dataframe: pd.DataFrame
+        The confident rows of the dataset, whose index is the row_id of the series
+    hashes: list[str]
+        The hash of each row, see row_hash
+    angle_wide: pd.DataFrame
+        The angle series in the wide layout
+    translation_wide: pd.DataFrame
+        The translation series in the wide layout
+    """
+    manifest = pd.DataFrame({"row_hash": hashes, "dataset_authors": dataframe["dataset_authors"].to_numpy()})
+    for column, wide in (("nb_samples", angle_wide), ("nb_translation_samples", translation_wide)):
+        sizes = wide.groupby("row_id").size() if wide is not None and wide.shape[0] else pd.Series(dtype=int)
+        manifest[column] = sizes.reindex(dataframe.index, fill_value=0).to_numpy(dtype=int)
+    return manifest[ROW_MANIFEST_COLUMNS]
+
+
+def read_previous_exports(
+    export_folder: Path, file_format: str = "csv", correction: bool = True
+) -> tuple[pd.DataFrame, dict[str, pd.DataFrame]] | None:
+    """
+    The row manifest and the series, in the wide layout, of the last export of the corrected or uncorrected series,
+    None if any of them is missing.
+
+    Parameters
+    ----------
+    export_folder: Path
+        The folder of the exports
+    file_format: str
+        The file format of the exports, see FILE_FORMATS
+    correction: bool
+        If True, the corrected exports are read, see CORRECTED_EXPORTS, otherwise the uncorrected ones
+
+    Returns
+    -------
+    tuple[pd.DataFrame, dict[str, pd.DataFrame]]
+        The row manifest and the wide series by wide attribute of Spartacus, see EXPORTS, whose row_id is the line
+        of the row in the manifest
+    """
+    exports = CORRECTED_EXPORTS if correction else UNCORRECTED_EXPORTS
+    manifest_path = row_manifest_path(export_folder, file_format, correction)
+    if not manifest_path.is_file() or not all(
+        export_path(export_folder, file, file_format).is_file() for _, file, _ in exports
+    ):
+        return None
+
+    manifest = pd.read_csv(manifest_path)
+    wide_series = {}
+    for attribute, file, wide_attribute in exports:
+        lengths_column = "nb_translation_samples" if "translation" in attribute else "nb_samples"
+        lengths = manifest[lengths_column].to_numpy(dtype=int)
+        long_dataframe = read_export(export_path(export_folder, file, file_format), file_format)
+        try:
+            wide_series[wide_attribute] = from_long_format(
+                long_dataframe, lengths[lengths > 0], np.flatnonzero(lengths > 0)
+            )
+        except ValueError:
+            # the exports were written without this manifest
+            return None
+
+    return manifest, wide_series
+
+
+def match_previous_lines(previous_hashes: list[str], hashes: list[str]) -> np.ndarray:
+    """For each hash, the first line of the same hash among the previous ones, -1 if none, shape (N,)"""
+    # a duplicated row has the same series
+    previous_line_of_hash = {}
+    for line, previous_hash in enumerate(previous_hashes):
+        previous_line_of_hash.setdefault(previous_hash, line)
+    return np.array([previous_line_of_hash.get(hash_, -1) for hash_ in hashes], dtype=int)
+
+
+def assemble_series(
+    previous_wide: pd.DataFrame, previous_lines: np.ndarray, new_wide: pd.DataFrame, row_ids: np.ndarray
+) -> pd.DataFrame:
+    """
+    The series of the rows in their order, each one taken from the previous export or from the new series.
+
+    Parameters
+    ----------
+    previous_wide: pd.DataFrame
+        The series of the previous export, whose row_id is the line of the row in the previous manifest
+    previous_lines: np.ndarray
+        For each row, its line in the previous manifest, -1 if it is recomputed, shape (N,)
+    new_wide: pd.DataFrame
+        The recomputed series, whose row_id is already the one of the row
+    row_ids: np.ndarray
+        The row_id of each row, shape (N,)
+
+    Returns
+    -------
+    pd.DataFrame
+        The series in the wide layout
+    """
+    combined = pd.concat([previous_wide, new_wide], ignore_index=True)
+    blocks = {
+        source: _series_blocks(wide["row_id"].to_numpy(), offset)
+        for source, wide, offset in (("previous", previous_wide, 0), ("new", new_wide, previous_wide.shape[0]))
+    }
+
+    lines, new_row_ids = [np.zeros(0, dtype=int)], [np.zeros(0, dtype=int)]
+    for row_id, previous_line in zip(row_ids, previous_lines):
+        source, key = ("new", row_id) if previous_line < 0 else ("previous", previous_line)
+        if key in blocks[source]:
+            start, length = blocks[source][key]
+            lines.append(np.arange(start, start + length))
+            new_row_ids.append(np.full(length, row_id))
+
+    assembled = combined.iloc[np.concatenate(lines)].reset_index(drop=True)
+    assembled["row_id"] = np.concatenate(new_row_ids)
+    return assembled
+
+
+def _series_blocks(row_ids: np.ndarray, offset: int = 0) -> dict[int, tuple[int, int]]:
+    """The first line and the number of lines of each series, consecutive lines sharing the same row_id"""
+    if row_ids.shape[0] == 0:
+        return {}
+    starts = np.flatnonzero(np.concatenate(([True], row_ids[1:] != row_ids[:-1])))
+    lengths = np.diff(np.append(starts, row_ids.shape[0]))
+    return {row_ids[start]: (offset + start, length) for start, length in zip(starts, lengths)}
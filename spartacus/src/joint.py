@@ -1,5 +1,5 @@
 from .enums import EulerSequence, JointType, Segment, BiomechOrigin
-from .legend_utils import isb_rotation_biomechanical_dof
+from .legend_utils import isb_rotation_biomechanical_dof, isb_translation_biomechanical_dof
 
 
 class Joint:
@@ -21,8 +21,6 @@ class Joint:
     def isb_euler_sequence(self) -> EulerSequence:
         return EulerSequence.isb_from_joint_type(self.joint_type)
 
-    # todo: stuff for translations ..?
-
     def is_sequence_convertible_through_factors(self, print_warning: bool = False) -> bool:
         """
         Check if the euler sequence of the joint can be converted to the ISB sequence with factors 1 or -1
@@ -74,27 +72,4 @@ class Joint:
 
     @property
     def isb_translation_biomechanical_dof(self) -> (str, str, str):
-        # TODO : Put correct dof
-        raise NotImplementedError("Not implemented yet")
-
-        joint_mapping = {
-            JointType.GLENO_HUMERAL: ("flexion_extension", "abduction_adduction", "internal_external_rotation"),
-            JointType.SCAPULO_THORACIC: (
-                "upward_downward_rotation",
-                "anterior_posterior_tilt",
-                "internal_external_rotation",
-            ),
-            JointType.ACROMIO_CLAVICULAR: (
-                "anterior_posterior_tilt",
-                "internal_external_rotation",
-                "upward_downward_rotation",
-            ),
-            JointType.STERNO_CLAVICULAR: (
-                "anterior_posterior_tilt",
-                "internal_external_rotation",
-                "upward_downward_rotation",
-            ),
-            JointType.THORACO_HUMERAL: ("flexion_extension", "abduction_adduction", "internal_external_rotation"),
-        }
-
-        return joint_mapping.get(self.joint_type)
+        return isb_translation_biomechanical_dof(self.joint_type)
@@ -0,0 +1,260 @@
+"""
+This module rebuilds the rotation series of a joint by composing the series of the two joints that chain it,
+e.g. the thoracohumeral series from the scapulothoracic and glenohumeral ones, R_thorax_humerus =
+R_thorax_scapula @ R_scapula_humerus, or the scapulothoracic series from the sternoclavicular and acromioclavicular
+ones, R_thorax_scapula = R_thorax_clavicle @ R_clavicle_scapula.
+
+The two series are aligned on a common humerothoracic grid, and all the series of a study are composed in a single
+batch of (N, 3, 3) matrices.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .angle_series import WIDE_COLUMNS, VALUE_COLUMNS
+from .corrections.angle_conversion_callbacks import (
+    from_euler_angles_to_rotation_matrices,
+    rotation_matrices_2_euler_angles,
+)
+from .enums import CorrectionPlan, EulerSequence, JointType
+from .legend_utils import isb_rotation_biomechanical_dof
+from .utils import unwrap_batch
+
+KINEMATIC_CHAINS = {
+    JointType.THORACO_HUMERAL: (JointType.SCAPULO_THORACIC, JointType.GLENO_HUMERAL),
+    JointType.SCAPULO_THORACIC: (JointType.STERNO_CLAVICULAR, JointType.ACROMIO_CLAVICULAR),
+}
+
+JOINT_NAMES = {
+    JointType.GLENO_HUMERAL: "glenohumeral",
+    JointType.SCAPULO_THORACIC: "scapulothoracic",
+    JointType.ACROMIO_CLAVICULAR: "acromioclavicular",
+    JointType.STERNO_CLAVICULAR: "sternoclavicular",
+    JointType.THORACO_HUMERAL: "thoracohumeral",
+}
+
+SERIES_KEYS = ["article", "humeral_motion", "shoulder_id"]
+
+DERIVED_COLUMNS = WIDE_COLUMNS + [
+    "proximal_row_id",  # int, the row of the dataset of the proximal joint series
+    "distal_row_id",  # int, the row of the dataset of the distal joint series
+]
+
+
+def pair_series(wide_dataframe: pd.DataFrame, joint_type: JointType) -> list[tuple[int, int]]:
+    """
+    Find the pairs of proximal and distal series that chain the joint, i.e. the series sharing the same article,
+    humeral motion and shoulder. When several series of the same joint share the same key, the pairing is ambiguous
+    and the key is skipped.
+
+    Parameters
+    ----------
+    wide_dataframe: pd.DataFrame
+        The corrected angle series in the wide layout, see WIDE_COLUMNS
+    joint_type: JointType
+        The joint to rebuild, see KINEMATIC_CHAINS
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        The row_id of the proximal and distal series of each pair
+    """
+    if joint_type not in KINEMATIC_CHAINS:
+        raise ValueError(f"{joint_type} cannot be rebuilt from a kinematic chain, choose among {[*KINEMATIC_CHAINS]}.")
+
+    proximal_joint, distal_joint = KINEMATIC_CHAINS[joint_type]
+    series = wide_dataframe[wide_dataframe["unit"] == "rad"].drop_duplicates("row_id")
+
+    keyed_row_ids = {}
+    for joint in (proximal_joint, distal_joint):
+        joint_series = series[series["joint"] == JOINT_NAMES[joint]]
+        # fillna, otherwise the series without shoulder_id never match
+        keys = joint_series[SERIES_KEYS].astype(object).where(joint_series[SERIES_KEYS].notna(), "nan")
+        keyed_row_ids[joint] = joint_series.groupby([keys[key] for key in SERIES_KEYS])["row_id"].agg(list)
+
+    pairs = (
+        keyed_row_ids[proximal_joint]
+        .to_frame("proximal")
+        .join(keyed_row_ids[distal_joint].to_frame("distal"), how="inner")
+    )
+    is_ambiguous = (pairs["proximal"].map(len) > 1) | (pairs["distal"].map(len) > 1)
+    for key in pairs.index[is_ambiguous]:
+        print(f"Several {proximal_joint.value} or {distal_joint.value} series for {key}, skipped.")
+
+    return [(proximal[0], distal[0]) for proximal, distal in pairs[~is_ambiguous].itertuples(index=False)]
+
+
+def align_series(proximal: pd.DataFrame, distal: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Resample two series on a common humerothoracic grid, the union of their samples restricted to the range
+    covered by both series.
+
+    Parameters
+    ----------
+    proximal: pd.DataFrame
+        The proximal joint series in the wide layout
+    distal: pd.DataFrame
+        The distal joint series in the wide layout
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        The humerothoracic grid, shape (N,), the proximal and the distal values on the grid, shape (N, 3)
+    """
+    series = []
+    for dataframe in (proximal, distal):
+        dataframe = dataframe[dataframe["humerothoracic_angle"].notna()].sort_values("humerothoracic_angle")
+        series.append(
+            (
+                dataframe["humerothoracic_angle"].to_numpy(dtype=float),
+                dataframe[VALUE_COLUMNS].to_numpy(dtype=float),
+            )
+        )
+
+    (proximal_angle, proximal_values), (distal_angle, distal_values) = series
+    if proximal_angle.size == 0 or distal_angle.size == 0:
+        return np.zeros(0), np.zeros((0, 3)), np.zeros((0, 3))
+
+    lower = max(proximal_angle[0], distal_angle[0])
+    upper = min(proximal_angle[-1], distal_angle[-1])
+    grid = np.union1d(proximal_angle, distal_angle)
+    grid = grid[(grid >= lower) & (grid <= upper)]
+
+    def resample(angle, values):
+        return np.stack([np.interp(grid, angle, values[:, dof]) for dof in range(3)], axis=1)
+
+    return grid, resample(proximal_angle, proximal_values), resample(distal_angle, distal_values)
+
+
+def compose_series(proximal_values: np.ndarray, distal_values: np.ndarray, joint_type: JointType) -> np.ndarray:
+    """
+    Compose the ISB rotations of the proximal and distal joints, both sampled on the same grid,
+    into the ISB rotations of the joint they chain. The angles must describe the corrected rotations, i.e. be
+    decomposed again from the corrected rotation matrices, see reexpression.isb_rotation_series, as unwrapping them
+    with a 180 degree period may shift a single angle by a half turn.
+
+    Parameters
+    ----------
+    proximal_values: np.ndarray
+        The ISB euler angles of the proximal joint in degrees, shape (N, 3)
+    distal_values: np.ndarray
+        The ISB euler angles of the distal joint in degrees, shape (N, 3)
+    joint_type: JointType
+        The joint to rebuild, see KINEMATIC_CHAINS
+
+    Returns
+    -------
+    np.ndarray
+        The ISB euler angles of the joint in degrees, shape (N, 3)
+    """
+    proximal_joint, distal_joint = KINEMATIC_CHAINS[joint_type]
+    proximal_matrices = from_euler_angles_to_rotation_matrices(
+        EulerSequence.isb_from_joint_type(proximal_joint).value, np.deg2rad(proximal_values)
+    )
+    distal_matrices = from_euler_angles_to_rotation_matrices(
+        EulerSequence.isb_from_joint_type(distal_joint).value, np.deg2rad(distal_values)
+    )
+    angles = rotation_matrices_2_euler_angles(
+        proximal_matrices @ distal_matrices, EulerSequence.isb_from_joint_type(joint_type)
+    )
+    # a sample with a NaN angle gives a NaN rotation
+    angles[np.isnan(proximal_values).any(axis=1) | np.isnan(distal_values).any(axis=1)] = np.nan
+
+    return np.rad2deg(angles)
+
+
+def derive_joint_series(wide_dataframe: pd.DataFrame, joint_type: JointType) -> pd.DataFrame:
+    """
+    Rebuild the series of a joint from the series of the two joints that chain it, study by study.
+    The derived series are identified by a negative row_id as they do not come from a row of the dataset,
+    the rows of the composed series are kept in proximal_row_id and distal_row_id.
+
+    Parameters
+    ----------
+    wide_dataframe: pd.DataFrame
+        The corrected angle series in the wide layout, see WIDE_COLUMNS, whose angles describe the corrected
+        rotations, see compose_series
+    joint_type: JointType
+        The joint to rebuild, see KINEMATIC_CHAINS
+
+    Returns
+    -------
+    pd.DataFrame
+        The derived series in the wide layout, see DERIVED_COLUMNS
+    """
+    pairs = pair_series(wide_dataframe, joint_type)
+    series_by_row_id = dict(tuple(wide_dataframe.groupby("row_id", sort=False)))
+
+    derived_series = []
+    derived_row_id = -1
+    for article in dict.fromkeys(series_by_row_id[proximal]["article"].iloc[0] for proximal, _ in pairs):
+        study_pairs = [pair for pair in pairs if series_by_row_id[pair[0]]["article"].iloc[0] == article]
+        aligned = [
+            align_series(series_by_row_id[proximal], series_by_row_id[distal]) for proximal, distal in study_pairs
+        ]
+        lengths = [grid.size for grid, _, _ in aligned]
+        if sum(lengths) == 0:
+            continue
+
+        # all the series of the study in a single batch
+        values = compose_series(
+            np.concatenate([proximal_values for _, proximal_values, _ in aligned]),
+            np.concatenate([distal_values for _, _, distal_values in aligned]),
+            joint_type,
+        )
+        series_starts = np.cumsum([0] + lengths[:-1])
+        values = unwrap_batch(values, period=180, series_starts=series_starts)
+
+        for (proximal, distal), (grid, _, _), start, length in zip(study_pairs, aligned, series_starts, lengths):
+            if length == 0:
+                continue
+            derived_series.append(
+                _to_derived_dataframe(
+                    series_by_row_id[proximal],
+                    series_by_row_id[distal],
+                    grid,
+                    values[start : start + length],
+                    joint_type,
+                    derived_row_id,
+                )
+            )
+            derived_row_id -= 1
+
+    return pd.concat([pd.DataFrame(columns=DERIVED_COLUMNS)] + derived_series, ignore_index=True)
+
+
+def _to_derived_dataframe(
+    proximal: pd.DataFrame,
+    distal: pd.DataFrame,
+    humerothoracic_angle: np.ndarray,
+    value_dof: np.ndarray,
+    joint_type: JointType,
+    row_id: int,
+) -> pd.DataFrame:
+    """Gather the composed values and the metadata shared by the two series in the wide layout"""
+    first_proximal, first_distal = proximal.iloc[0], distal.iloc[0]
+    legend_dof = isb_rotation_biomechanical_dof(joint_type)
+
+    series_dataframe = pd.DataFrame(columns=DERIVED_COLUMNS)
+    series_dataframe["value_dof1"] = value_dof[:, 0]
+    series_dataframe["value_dof2"] = value_dof[:, 1]
+    series_dataframe["value_dof3"] = value_dof[:, 2]
+    series_dataframe["article"] = first_proximal["article"]
+    series_dataframe["joint"] = JOINT_NAMES[joint_type]
+    series_dataframe["humeral_motion"] = first_proximal["humeral_motion"]
+    series_dataframe["humerothoracic_angle"] = humerothoracic_angle
+    series_dataframe["unit"] = "rad"
+    # the composed rotation can only be as trustworthy as both series
+    series_dataframe["confidence"] = first_proximal["confidence"] * first_distal["confidence"]
+    series_dataframe["shoulder_id"] = first_proximal["shoulder_id"]
+    series_dataframe["in_vivo"] = first_proximal["in_vivo"]
+    series_dataframe["xp_mean"] = first_proximal["xp_mean"]
+    series_dataframe["biomechanical_dof1"] = legend_dof[0]
+    series_dataframe["biomechanical_dof2"] = legend_dof[1]
+    series_dataframe["biomechanical_dof3"] = legend_dof[2]
+    series_dataframe["transform"] = CorrectionPlan.COMPOSITION.value
+    series_dataframe["row_id"] = row_id
+    series_dataframe["proximal_row_id"] = first_proximal["row_id"]
+    series_dataframe["distal_row_id"] = first_distal["row_id"]
+
+    return series_dataframe
@@ -22,3 +22,20 @@ def isb_rotation_biomechanical_dof(joint_type: JointType):
         JointType.THORACO_HUMERAL: ("plane of elevation", "elevation", "internal(+)/external(-) rotation"),
     }
     return joint_mapping.get(joint_type)
+
+
+def isb_translation_biomechanical_dof(joint_type: JointType):
+    # the translations are expressed along the axes of a segment coordinate system reoriented as ISB
+    isb_translations = (
+        "anterior(+)-posterior(-) translation",
+        "superior(+)-inferior(-) translation",
+        "lateral(+)-medial(-) translation",
+    )
+    joint_mapping = {
+        JointType.GLENO_HUMERAL: isb_translations,
+        JointType.SCAPULO_THORACIC: isb_translations,
+        JointType.ACROMIO_CLAVICULAR: isb_translations,
+        JointType.STERNO_CLAVICULAR: isb_translations,
+        JointType.THORACO_HUMERAL: isb_translations,
+    }
+    return joint_mapping.get(joint_type)
@@ -1,10 +1,42 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
-from .enums import DatasetCSV, DataFolder
+from .angle_series import WIDE_COLUMNS, to_long_format
+from .bootstrap import bootstrap_ci
+from .confidence import confidence_table
+from .corrections.angle_conversion_callbacks import rotation_matrices_to_quaternions
+from .corridor import compute_corridors
+from .dataset_root import DatasetRoot
+from .enums import DataFolder, JointType
+from .incremental import (
+    assemble_series,
+    check_file_format,
+    export_path,
+    match_previous_lines,
+    read_previous_exports,
+    row_hash,
+    row_manifest,
+    row_manifest_path,
+    selected_corrections,
+    selected_exports,
+    write_export,
+)
+from .kinematic_chain import derive_joint_series
+from .load_data import CSV_CACHE
+from .monte_carlo import DEFAULT_ANGULAR_SD, propagate_correction_uncertainty
+from .quality import quality_summary, sample_quality
+from .reexpression import SINGULARITY_TOLERANCE, isb_rotation_series, reexpress_rotation_series
+from .rotation_average import average_rotations
 from .row_data import RowData
+from .scapulohumeral_rhythm import scapulohumeral_rhythm
+from .sensitivity import sensitivity_sweep
+
+OUTPUTS = ("raw", "corrected", "both")
+ORIENTATION_INDEX_COLUMNS = ["article", "joint", "humeral_motion", "humerothoracic_angle", "shoulder_id", "row_id"]
 
 
 class Spartacus:
@@ -16,17 +48,490 @@ class Spartacus:
     def __init__(
         self,
         dataframe: pd.DataFrame,
+        dataset_root: DatasetRoot | str | Path = None,
     ):
+        """
+        Parameters
+        ----------
+        dataframe: pd.DataFrame
+            The rows of the dataset
+        dataset_root: DatasetRoot | str | Path
+            The root holding the study folders and the exports, see DatasetRoot for the default one
+        """
         self.dataframe = dataframe
+        self.dataset_root = dataset_root if isinstance(dataset_root, DatasetRoot) else DatasetRoot(dataset_root)
 
         self.clean_df()
         # self.remove_rows_not_ready_for_analysis() # Todo: remove this function ultimately
+        self.confident_dataframe = None
         self.rows = []
         self.rows_output = None
 
         self.corrected_confident = None
-        self.corrected_confident_data_values = None
-        self.confident_data_values = None
+        self._corrected_confident_data_wide = None
+        self._confident_data_wide = None
+        self._corrected_confident_data_values = None
+        self._confident_data_values = None
+
+        self._corrected_confident_translation_data_wide = None
+        self._confident_translation_data_wide = None
+
+        self._corrected_rotation_matrices = None
+        self._corrected_quaternions = None
+        self._isb_rotation_data_wide = None
+
+        self._derived_data_wide = {}
+        self._corridors = {}
+        self._reexpressed_data_wide = {}
+        self._quality = {}
+
+        self.row_hashes = None
+        self.nb_reused_rows = 0
+        # True if self.rows holds only some of the rows of the series, after an incremental or a parallel import
+        self.partial_rows = False
+
+    def _check_all_rows_imported(self):
+        """The series not computed by an incremental or a parallel import cannot be gathered from self.rows"""
+        if self.partial_rows:
+            raise ValueError(
+                "The rows of the series are not all kept after an incremental or a parallel import, "
+                "request the series when importing, see outputs."
+            )
+
+    @property
+    def confident_data_wide(self) -> pd.DataFrame:
+        """The uncorrected angle series in the wide layout, computed on first access if not requested when importing."""
+        if self._confident_data_wide is None:
+            self._check_all_rows_imported()
+            if self.rows:
+                self._confident_data_wide = self.angle_series_dataframe(correction=False)
+        return self._confident_data_wide
+
+    @property
+    def corrected_confident_data_wide(self) -> pd.DataFrame:
+        """The corrected angle series in the wide layout, computed on first access if not requested when importing."""
+        if self._corrected_confident_data_wide is None:
+            self._check_all_rows_imported()
+            if self.rows:
+                self._corrected_confident_data_wide = self.angle_series_dataframe(correction=True)
+        return self._corrected_confident_data_wide
+
+    @property
+    def confident_data_values(self) -> pd.DataFrame:
+        """The uncorrected angle series in the long layout, melted on first access."""
+        if self._confident_data_values is None and self.confident_data_wide is not None:
+            self._confident_data_values = self.long(correction=False)
+        return self._confident_data_values
+
+    @confident_data_values.setter
+    def confident_data_values(self, value: pd.DataFrame):
+        self._confident_data_values = value
+
+    @property
+    def corrected_confident_data_values(self) -> pd.DataFrame:
+        """The corrected angle series in the long layout, melted on first access."""
+        if self._corrected_confident_data_values is None and self.corrected_confident_data_wide is not None:
+            self._corrected_confident_data_values = self.long(correction=True)
+        return self._corrected_confident_data_values
+
+    @corrected_confident_data_values.setter
+    def corrected_confident_data_values(self, value: pd.DataFrame):
+        self._corrected_confident_data_values = value
+
+    @property
+    def confident_translation_data_wide(self) -> pd.DataFrame:
+        """The uncorrected translation series in the wide layout, computed on first access if not requested."""
+        if self._confident_translation_data_wide is None:
+            self._check_all_rows_imported()
+            if self.rows:
+                self._confident_translation_data_wide = self.translation_series_dataframe(correction=False)
+        return self._confident_translation_data_wide
+
+    @property
+    def corrected_confident_translation_data_wide(self) -> pd.DataFrame:
+        """The corrected translation series in the wide layout, computed on first access if not requested."""
+        if self._corrected_confident_translation_data_wide is None:
+            self._check_all_rows_imported()
+            if self.rows:
+                self._corrected_confident_translation_data_wide = self.translation_series_dataframe(correction=True)
+        return self._corrected_confident_translation_data_wide
+
+    @property
+    def confident_translation_data_values(self) -> pd.DataFrame:
+        """The uncorrected translation series in the long layout, unit "mm"."""
+        return to_long_format(self.confident_translation_data_wide)
+
+    @property
+    def corrected_confident_translation_data_values(self) -> pd.DataFrame:
+        """The corrected translation series in the long layout, unit "mm"."""
+        return to_long_format(self.corrected_confident_translation_data_wide)
+
+    @property
+    def corrected_rotation_matrices(self) -> np.ndarray:
+        """
+        The corrected rotation matrices, one per line of corrected_confident_data_wide, shape (M, 3, 3).
+        They are kept from the batch correction of the angles.
+        """
+        if self._corrected_rotation_matrices is None:
+            # the rotation matrices are kept by the rows when correcting the angles
+            corrected_confident_data_wide = self.corrected_confident_data_wide
+            rotation_matrices = np.concatenate(
+                [np.zeros((0, 3, 3))]
+                + [
+                    row_data.corrected_rotation_matrices
+                    for row_data in self.rows
+                    if row_data.usable_rotation_data and row_data.data is not None
+                ]
+            )
+            if corrected_confident_data_wide is not None and rotation_matrices.shape[0] != len(
+                corrected_confident_data_wide
+            ):
+                raise ValueError(
+                    "The rotation matrices are only kept for the rows imported by this process, "
+                    "import the whole dataset without incremental or parallel import to get them."
+                )
+            self._corrected_rotation_matrices = rotation_matrices
+        return self._corrected_rotation_matrices
+
+    @property
+    def corrected_quaternions(self) -> np.ndarray:
+        """The corrected rotations as quaternions (w, x, y, z), one per line of corrected_confident_data_wide"""
+        if self._corrected_quaternions is None:
+            self._corrected_quaternions = rotation_matrices_to_quaternions(self.corrected_rotation_matrices)
+        return self._corrected_quaternions
+
+    def _isb_rotation_series(self) -> pd.DataFrame:
+        """The corrected angle series decomposed again from the corrected rotation matrices, see isb_rotation_series"""
+        if self._isb_rotation_data_wide is None:
+            self._isb_rotation_data_wide = isb_rotation_series(
+                self.corrected_confident_data_wide, self.corrected_rotation_matrices
+            )
+        return self._isb_rotation_data_wide
+
+    def long(self, correction: bool = True) -> pd.DataFrame:
+        """
+        Melt the angle series into the long layout, one line per humerothoracic angle and per degree of freedom.
+
+        Parameters
+        ----------
+        correction: bool
+            If True, the corrected angle series are melted, otherwise the uncorrected ones.
+        """
+        return to_long_format(self.corrected_confident_data_wide if correction else self.confident_data_wide)
+
+    def reexpress(self, sequence_per_joint: dict, singularity_tolerance: float = SINGULARITY_TOLERANCE) -> pd.DataFrame:
+        """
+        The corrected angle series re-expressed in other euler sequences than the ISB ones, from the corrected
+        rotation matrices kept at load time, in the wide layout with the euler_sequence and singular columns.
+        They are computed once per set of sequences and kept until the data are imported again.
+
+        Parameters
+        ----------
+        sequence_per_joint: dict
+            The euler sequence of each joint to re-express, e.g. {"glenohumeral": "xzy"},
+            the other joints are kept in their ISB sequence
+        singularity_tolerance: float
+            The samples whose second angle is closer than this angle, in degrees, to the gimbal lock are flagged
+        """
+        key = (
+            tuple(sorted((str(joint), str(sequence)) for joint, sequence in sequence_per_joint.items())),
+            singularity_tolerance,
+        )
+        if key not in self._reexpressed_data_wide:
+            self._reexpressed_data_wide[key] = reexpress_rotation_series(
+                self.corrected_confident_data_wide,
+                self.corrected_rotation_matrices,
+                sequence_per_joint,
+                singularity_tolerance=singularity_tolerance,
+            )
+        return self._reexpressed_data_wide[key]
+
+    def quality(self, singularity_tolerance: float = SINGULARITY_TOLERANCE) -> pd.DataFrame:
+        """
+        The corrected angle series with the conditioning and the quality of each sample, in the wide layout,
+        see QUALITY_COLUMNS. The samples close to the gimbal lock of their sequence are near singular and the ones
+        whose angles do not match the corrected rotation matrix anymore, e.g. after unwrapping, are half turns.
+        They are computed once per tolerance and kept until the data are imported again.
+
+        Parameters
+        ----------
+        singularity_tolerance: float
+            The samples whose second angle is closer than this angle, in degrees, to the gimbal lock are flagged
+        """
+        if singularity_tolerance not in self._quality:
+            self._quality[singularity_tolerance] = sample_quality(
+                self.corrected_confident_data_wide,
+                self.corrected_rotation_matrices,
+                singularity_tolerance=singularity_tolerance,
+            )
+        return self._quality[singularity_tolerance]
+
+    def quality_summary(self, singularity_tolerance: float = SINGULARITY_TOLERANCE) -> pd.DataFrame:
+        """The quality of the corrected angle series summarized per row, see quality and QUALITY_SUMMARY_COLUMNS."""
+        return quality_summary(self.quality(singularity_tolerance))
+
+    def confidence_table(self, coefficients: np.ndarray = None) -> pd.DataFrame:
+        """
+        The risk flags and the confidence of the rotations and displacements of all the confident rows at once,
+        indexed as confident_dataframe, i.e. by row_id, see CONFIDENCE_COLUMNS.
+
+        Parameters
+        ----------
+        coefficients: np.ndarray
+            The risk coefficients, shape (segment types, risk types, risk kinds), DEFAULT_RISK_COEFFICIENTS by default
+        """
+        if self.confident_dataframe is None:
+            raise ValueError(
+                "The dataframe has not been checked yet. " "Use set_correction_callbacks_from_segment_joint_validity"
+            )
+        return confidence_table(self.confident_dataframe, coefficients=coefficients)
+
+    def derived_data_wide(self, joint_type: JointType = JointType.THORACO_HUMERAL) -> pd.DataFrame:
+        """
+        The series of a joint rebuilt by composing the corrected series of the two joints chaining it,
+        e.g. thoracohumeral from scapulothoracic and glenohumeral, in the wide layout.
+        The rotations are the corrected rotation matrices, not recomputed from the unwrapped angles, so they are not
+        available after an incremental or a parallel import, see corrected_rotation_matrices.
+        They are computed once and kept until the data are imported again.
+
+        Parameters
+        ----------
+        joint_type: JointType
+            The joint to rebuild, JointType.THORACO_HUMERAL or JointType.SCAPULO_THORACIC
+        """
+        if joint_type not in self._derived_data_wide:
+            self._derived_data_wide[joint_type] = derive_joint_series(self._isb_rotation_series(), joint_type)
+        return self._derived_data_wide[joint_type]
+
+    def derived_data_values(self, joint_type: JointType = JointType.THORACO_HUMERAL) -> pd.DataFrame:
+        """The derived series of the joint in the long layout, see derived_data_wide."""
+        return to_long_format(self.derived_data_wide(joint_type))
+
+    def corridors(
+        self,
+        joint: str = None,
+        humeral_motion: str = None,
+        articles: tuple[str, ...] = None,
+        translation: bool = False,
+        weighted: bool = False,
+        grid: np.ndarray = None,
+        min_series: int = 1,
+    ) -> pd.DataFrame:
+        """
+        The normative corridors of the corrected series, mean, standard deviation and percentiles across series on a
+        common humerothoracic grid, per joint, humeral motion and degree of freedom, see CORRIDOR_COLUMNS.
+        They are computed once per filter and kept until the data are imported again.
+
+        Parameters
+        ----------
+        joint: str
+            Restrict to a joint, e.g. "glenohumeral", all joints by default
+        humeral_motion: str
+            Restrict to a humeral motion, e.g. "frontal elevation", all motions by default
+        articles: tuple[str, ...]
+            Restrict to some articles, all articles by default
+        translation: bool
+            If True, the corridors of the translations, otherwise the ones of the angles
+        weighted: bool
+            If True, each series is weighted by its confidence
+        grid: np.ndarray
+            The humerothoracic angles of the corridors, DEFAULT_GRID by default
+        min_series: int
+            The statistics of a grid point covered by fewer series are NaN
+        """
+        key = (
+            joint,
+            humeral_motion,
+            None if articles is None else tuple(sorted(articles)),
+            translation,
+            weighted,
+            None if grid is None else tuple(np.asarray(grid, dtype=float)),
+            min_series,
+        )
+        if key not in self._corridors:
+            wide = self._select_corrected_series(joint, humeral_motion, articles, translation)
+            self._corridors[key] = compute_corridors(wide, grid=grid, weighted=weighted, min_series=min_series)
+
+        return self._corridors[key]
+
+    def bootstrap_ci(
+        self,
+        joint: str = None,
+        humeral_motion: str = None,
+        articles: tuple[str, ...] = None,
+        translation: bool = False,
+        grid: np.ndarray = None,
+        n_boot: int = 10000,
+        confidence_level: float = 0.95,
+        weighted: bool = False,
+        n_jobs: int = 1,
+        backend: str = "threads",
+        seed: int = 0,
+    ) -> pd.DataFrame:
+        """
+        Hierarchical bootstrap confidence intervals of the corridor means, resampling the studies within the corpus
+        and the shoulders within the studies, see BOOTSTRAP_COLUMNS.
+
+        Parameters
+        ----------
+        joint: str
+            Restrict to a joint, e.g. "glenohumeral", all joints by default
+        humeral_motion: str
+            Restrict to a humeral motion, e.g. "frontal elevation", all motions by default
+        articles: tuple[str, ...]
+            Restrict to some articles, all articles by default
+        translation: bool
+            If True, the intervals of the translations, otherwise the ones of the angles
+        grid: np.ndarray
+            The humerothoracic angles of the intervals, DEFAULT_GRID by default
+        n_boot: int
+            The number of bootstrap replicates
+        confidence_level: float
+            The coverage of the confidence interval
+        weighted: bool
+            If True, each series is weighted by its confidence
+        n_jobs: int
+            The number of workers, the result does not depend on it
+        backend: str
+            "threads" or "processes"
+        seed: int
+            The seed of the random generators
+        """
+        wide = self._select_corrected_series(joint, humeral_motion, articles, translation)
+        return bootstrap_ci(
+            wide,
+            grid=grid,
+            n_boot=n_boot,
+            confidence_level=confidence_level,
+            weighted=weighted,
+            n_jobs=n_jobs,
+            backend=backend,
+            seed=seed,
+        )
+
+    def average_rotations(
+        self,
+        joint: str = None,
+        humeral_motion: str = None,
+        articles: tuple[str, ...] = None,
+        grid: np.ndarray = None,
+        method: str = "karcher",
+        weighted: bool = False,
+    ) -> pd.DataFrame:
+        """
+        The mean rotations of the corrected angle series on SO(3), per joint, humeral motion and point of the grid,
+        decomposed in the ISB sequence of the joint, see AVERAGE_COLUMNS. The filters are the ones of corridors.
+        The rotations are the corrected rotation matrices, see derived_data_wide.
+
+        Parameters
+        ----------
+        joint: str
+            Restrict to a joint, e.g. "glenohumeral", all joints by default
+        humeral_motion: str
+            Restrict to a humeral motion, e.g. "frontal elevation", all motions by default
+        articles: tuple[str, ...]
+            Restrict to some articles, all articles by default
+        grid: np.ndarray
+            The humerothoracic angles of the mean series, DEFAULT_GRID by default
+        method: str
+            "chordal" for the quaternion eigenvector mean, "karcher" for the geodesic mean
+        weighted: bool
+            If True, each series is weighted by its confidence
+        """
+        wide = self._select_corrected_series(
+            joint, humeral_motion, articles, translation=False, wide=self._isb_rotation_series()
+        )
+        return average_rotations(wide, grid=grid, method=method, weighted=weighted)
+
+    def sensitivity_sweep(
+        self,
+        coefficients: np.ndarray,
+        joint: str = None,
+        humeral_motion: str = None,
+        articles: tuple[str, ...] = None,
+        translation: bool = False,
+        grid: np.ndarray = None,
+    ) -> pd.DataFrame:
+        """
+        The spread of the confidence-weighted corridor means over a sweep of confidence coefficients, without loading
+        the data again, see SWEEP_COLUMNS. The filters are the ones of corridors.
+
+        Parameters
+        ----------
+        coefficients: np.ndarray
+            The coefficient vectors, shape (K, len(COEFFICIENT_NAMES)), see coefficient_grid
+        joint: str
+            Restrict to a joint, e.g. "glenohumeral", all joints by default
+        humeral_motion: str
+            Restrict to a humeral motion, e.g. "frontal elevation", all motions by default
+        articles: tuple[str, ...]
+            Restrict to some articles, all articles by default
+        translation: bool
+            If True, the sweep of the translations, otherwise the one of the angles
+        grid: np.ndarray
+            The humerothoracic angles of the corridors, DEFAULT_GRID by default
+        """
+        wide = self._select_corrected_series(joint, humeral_motion, articles, translation)
+        return sensitivity_sweep(wide, self.confidence_table(), coefficients, grid=grid)
+
+    def correction_uncertainty(
+        self,
+        nb_draws: int = 1000,
+        angular_sd: float = DEFAULT_ANGULAR_SD,
+        confidence_level: float = 0.95,
+        seed: int = 0,
+    ) -> pd.DataFrame:
+        """
+        The corrected angle series with per-sample uncertainty bands due to the Kolz correction matrices, drawn around
+        the mean ones by a Monte Carlo simulation, see UNCERTAINTY_COLUMNS. The rows without such a correction keep
+        zero-width bands.
+
+        Parameters
+        ----------
+        nb_draws: int
+            The number of draws of the correction matrices per row
+        angular_sd: float
+            The standard deviation of each component of the rotation vectors of the perturbations, in degrees,
+            an assumption as Kolz et al. (2020) only report the mean matrices
+        confidence_level: float
+            The coverage of the bands
+        seed: int
+            The seed of the random generators, the draws of each row being independent of the other rows
+        """
+        rows = [row_data for row_data in self.rows if row_data.usable_rotation_data and row_data.data is not None]
+        return propagate_correction_uncertainty(
+            self.corrected_confident_data_wide,
+            rows,
+            nb_draws=nb_draws,
+            angular_sd=angular_sd,
+            confidence_level=confidence_level,
+            seed=seed,
+        )
+
+    def _select_corrected_series(
+        self, joint: str, humeral_motion: str, articles: tuple[str, ...], translation: bool, wide: pd.DataFrame = None
+    ) -> pd.DataFrame:
+        """
+        The corrected series in the wide layout, or the given ones, restricted to a joint, a humeral motion and some
+        articles
+        """
+        if wide is None:
+            wide = self.corrected_confident_translation_data_wide if translation else self.corrected_confident_data_wide
+        if joint is not None:
+            wide = wide[wide["joint"] == joint]
+        if humeral_motion is not None:
+            wide = wide[wide["humeral_motion"] == humeral_motion]
+        if articles is not None:
+            wide = wide[wide["article"].isin(articles)]
+        return wide
+
+    def scapulohumeral_rhythm(self) -> pd.DataFrame:
+        """
+        The scapulohumeral rhythm and the contributions of the glenohumeral and scapulothoracic joints to the
+        humeral elevation, for every pair of corrected series of the same article, humeral motion and shoulder,
+        see RHYTHM_COLUMNS.
+        """
+        return scapulohumeral_rhythm(self.corrected_confident_data_wide)
 
     def clean_df(self):
         # turn nan into None for the following columns
@@ -80,7 +585,7 @@ class Spartacus:
         for i, row in self.dataframe.iterrows():
             # print(row.article_author_year)
 
-            row_data = RowData(row)
+            row_data = RowData(row, dataset_root=self.dataset_root)
             if print_warnings:
                 print("")
                 print("")
@@ -103,7 +608,10 @@ class Spartacus:
             if rotation_validity:
                 row_data.set_rotation_correction_callback()
 
-            if not row_data.usable_rotation_data:
+            if translation_validity:
+                row_data.set_translation_correction_callback()
+
+            if not row_data.usable_rotation_data and not row_data.usable_translation_data:
                 if print_warnings:
                     print("WARNING : inconsistency in the dataset")
                     print(row.joint, row.dataset_authors)
@@ -123,70 +631,370 @@ class Spartacus:
 
         return self.confident_dataframe
 
-    def import_confident_data(self) -> pd.DataFrame:
+    def import_confident_data(
+        self, outputs: tuple[str, ...] = ("both",), rows: np.ndarray = None, n_jobs: int = 1
+    ) -> pd.DataFrame:
         """
         This function will import the data from the dataframe, using the callback functions.
         Only the data corresponding to the rows that are considered good and have a callback function will be imported.
+
+        Parameters
+        ----------
+        outputs: tuple[str, ...]
+            The angle series to compute right away, among "raw", "corrected" and "both".
+            The other one is computed on first access of confident_data_values or corrected_confident_data_values.
+        rows: np.ndarray
+            The positions, in confident_dataframe, of the rows to import, all of them by default
+        n_jobs: int
+            The number of processes importing the rows, each one a chunk of consecutive rows. With several processes,
+            the rows are not kept in self.rows and only the requested series are available.
+
+        Returns
+        -------
+        pd.DataFrame
+            The corrected angle series in the long layout if requested, the uncorrected ones otherwise, see
+            import_confident_series to import the series without building the long layout.
         """
+        self.import_confident_series(outputs=outputs, rows=rows, n_jobs=n_jobs)
+        if "corrected" in outputs or "both" in outputs:
+            return self.corrected_confident_data_values
+        return self.confident_data_values
+
+    def import_confident_series(self, outputs: tuple[str, ...] = ("both",), rows: np.ndarray = None, n_jobs: int = 1):
+        """
+        Import the rows and compute the requested series in the wide layout only, the long layout being built on first
+        access, e.g. of corrected_confident_data_values.
+
+        Parameters
+        ----------
+        outputs: tuple[str, ...]
+            The angle series to compute right away, among "raw", "corrected" and "both", see import_confident_data
+        rows: np.ndarray
+            The positions, in confident_dataframe, of the rows to import, all of them by default
+        n_jobs: int
+            The number of processes importing the rows, see import_confident_data
+        """
+        check_outputs(outputs)
+        if n_jobs < 1:
+            raise ValueError(f"n_jobs must be at least 1, got {n_jobs}.")
+
         if self.confident_dataframe is None:
             raise ValueError(
                 "The dataframe has not been checked yet. " "Use set_correction_callbacks_from_segment_joint_validity"
             )
 
-        output_dataframe = pd.DataFrame(
-            columns=[
-                "article",
-                "joint",
-                "degree_of_freedom",
-                "biomechanical_dof",
-                "humeral_motion",
-                "humerothoracic_angle",
-                "value",
-                "unit",
-                "confidence",
-                "shoulder_id",
-            ]
-        )
-        corrected_output_dataframe = output_dataframe.copy()
+        CSV_CACHE.reset_stats()
+        # the rows are kept only once all of them are imported, the previous ones are left as is if one fails
+        imported_rows = []
+        confident_dataframe = self.confident_dataframe if rows is None else self.confident_dataframe.iloc[rows]
+        parallel = n_jobs > 1 and confident_dataframe.shape[0] > 1
+        if parallel:
+            wide_series = self._import_in_parallel(confident_dataframe, outputs, n_jobs)
+        else:
+            for i, row in confident_dataframe.iterrows():
+                row_data = RowData(row, dataset_root=self.dataset_root)
 
-        for i, row in self.confident_dataframe.iterrows():
-            row_data = RowData(row)
+                row_data.check_all_segments_validity(print_warnings=False)
+                row_data.check_joint_validity(print_warnings=False)
+                row_data.set_segments()
+                rotation_validity, translation_validity = row_data.check_segments_correction_validity(
+                    print_warnings=False
+                )
+                if rotation_validity:
+                    row_data.set_rotation_correction_callback()
+                if translation_validity:
+                    row_data.set_translation_correction_callback()
 
-            row_data.check_all_segments_validity(print_warnings=False)
-            row_data.check_joint_validity(print_warnings=False)
-            row_data.set_segments()
-            row_data.check_segments_correction_validity(print_warnings=False)
-            row_data.set_rotation_correction_callback()
+                row_data.import_data()
 
-            row_data.import_data()
+                imported_rows.append(row_data)
 
-            df_angle_series = row_data.to_angle_series_dataframe(correction=False)
-            corrected_angle_series = row_data.to_angle_series_dataframe(correction=True)
-            # add the row to the dataframe
-            output_dataframe = pd.concat([output_dataframe, df_angle_series], ignore_index=True)
-            corrected_output_dataframe = pd.concat(
-                [corrected_output_dataframe, corrected_angle_series], ignore_index=True
+        print(CSV_CACHE.report())
+        self.rows = imported_rows
+
+        self._confident_data_wide = None
+        self._corrected_confident_data_wide = None
+        self.confident_data_values = None
+        self.corrected_confident_data_values = None
+        self._confident_translation_data_wide = None
+        self._corrected_confident_translation_data_wide = None
+        self._corrected_rotation_matrices = None
+        self._corrected_quaternions = None
+        self._isb_rotation_data_wide = None
+        self._derived_data_wide = {}
+        self._corridors = {}
+        self._reexpressed_data_wide = {}
+        self._quality = {}
+        self.partial_rows = parallel
+
+        if parallel:
+            for wide_attribute, wide in wide_series.items():
+                setattr(self, wide_attribute, wide)
+        else:
+            if "raw" in outputs or "both" in outputs:
+                self._confident_data_wide = self.angle_series_dataframe(correction=False)
+                self._confident_translation_data_wide = self.translation_series_dataframe(correction=False)
+            if "corrected" in outputs or "both" in outputs:
+                self._corrected_confident_data_wide = self.angle_series_dataframe(correction=True)
+                self._corrected_confident_translation_data_wide = self.translation_series_dataframe(correction=True)
+
+    def _import_in_parallel(
+        self, confident_dataframe: pd.DataFrame, outputs: tuple[str, ...], n_jobs: int
+    ) -> dict[str, pd.DataFrame]:
+        """The requested series, by wide attribute, of the rows imported by chunks in n_jobs processes"""
+        # the callbacks cannot be sent to the processes, they are set again by each one
+        confident_dataframe = confident_dataframe.drop(columns="callback_function", errors="ignore")
+        chunks = [
+            confident_dataframe.iloc[chunk]
+            for chunk in np.array_split(np.arange(confident_dataframe.shape[0]), n_jobs)
+            if chunk.shape[0]
+        ]
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            results = list(pool.map(_import_rows, chunks, repeat(self.dataset_root), repeat(outputs)))
+
+        return {
+            wide_attribute: pd.concat([result[wide_attribute] for result in results], ignore_index=True)
+            for _, _, wide_attribute in selected_exports(outputs)
+        }
+
+    def import_confident_data_incrementally(
+        self,
+        previous_hashes: list[str] = None,
+        previous_wide_series: dict[str, pd.DataFrame] = None,
+        outputs: tuple[str, ...] = ("both",),
+        export_folder: str | Path = None,
+        file_format: str = "csv",
+        n_jobs: int = 1,
+    ):
+        """
+        Import the data of the rows added or changed since the last export only, the series of the other rows are read
+        back from the exports of the dataset root and the ones of the removed rows are dropped, see incremental.py.
+        All the rows are imported if there is no previous export.
+
+        Parameters
+        ----------
+        previous_hashes: list[str]
+            The hashes of the rows of a previous import, the ones of the last export by default
+        previous_wide_series: dict[str, pd.DataFrame]
+            The series of a previous import in the wide layout, by wide attribute, see EXPORTS, whose row_id is the
+            position of the row among previous_hashes
+        outputs: tuple[str, ...]
+            The series to import, among "raw", "corrected" and "both", the other ones are not available after the import
+        export_folder: str | Path
+            The folder of the last export, the export folder of the dataset root by default
+        file_format: str
+            The file format of the last export, see FILE_FORMATS
+        n_jobs: int
+            The number of processes importing the rows, see import_confident_data
+        """
+        check_outputs(outputs)
+        if self.confident_dataframe is None:
+            raise ValueError(
+                "The dataframe has not been checked yet. " "Use set_correction_callbacks_from_segment_joint_validity"
             )
 
-        self.confident_data_values = output_dataframe
-        self.corrected_confident_data_values = corrected_output_dataframe
+        self.row_hashes = [row_hash(row, self.dataset_root) for _, row in self.confident_dataframe.iterrows()]
+        if previous_hashes is not None:
+            lines = match_previous_lines(previous_hashes, self.row_hashes)
+            previous_lines = {wide_attribute: lines for _, _, wide_attribute in selected_exports(outputs)}
+        else:
+            # the corrected and uncorrected exports may come from different exports, each one has its own manifest
+            export_folder = self.dataset_root.export_folder if export_folder is None else export_folder
+            previous_lines, previous_wide_series = {}, {}
+            for correction in selected_corrections(outputs):
+                previous_exports = read_previous_exports(export_folder, file_format, correction)
+                if previous_exports is None:
+                    self.nb_reused_rows = 0
+                    self.import_confident_series(outputs=outputs, n_jobs=n_jobs)
+                    return
+                previous_manifest, wide_series = previous_exports
+                lines = match_previous_lines(previous_manifest["row_hash"], self.row_hashes)
+                previous_lines.update({wide_attribute: lines for wide_attribute in wide_series})
+                previous_wide_series.update(wide_series)
 
-        return self.corrected_confident_data_values
+        self._import_changed_rows(previous_lines, previous_wide_series, outputs, n_jobs)
 
-    def export(self):
-        path_next_to_clean = Path(DatasetCSV.CLEAN.value).parent
+    def reimport_rows(self, row_ids: list[int]):
+        """
+        Import again the data of some rows, e.g. the ones whose csv files changed, the series of the other rows are kept.
 
-        confident_path = Path.joinpath(path_next_to_clean, "corrected_confident_data.csv")
-        self.corrected_confident_data_values.to_csv(confident_path, index=False)
+        Parameters
+        ----------
+        row_ids: list[int]
+            The row_id of the rows to import again, i.e. their index in confident_dataframe
+        """
+        corrected = self._corrected_confident_data_wide is not None
+        uncorrected = self._confident_data_wide is not None
+        if not corrected and not uncorrected:
+            raise ValueError("No series were imported yet, use import_confident_data.")
+        outputs = ("both",) if corrected and uncorrected else ("corrected",) if corrected else ("raw",)
+        previous_wide_series = {
+            wide_attribute: getattr(self, wide_attribute) for _, _, wide_attribute in selected_exports(outputs)
+        }
+        lines = self.confident_dataframe.index.to_numpy().copy()
+        changed = np.isin(lines, row_ids)
+        lines[changed] = -1
 
-        confident_path = Path.joinpath(path_next_to_clean, "confident_data.csv")
-        self.confident_data_values.to_csv(confident_path, index=False)
+        self._import_changed_rows(
+            {wide_attribute: lines for wide_attribute in previous_wide_series}, previous_wide_series, outputs
+        )
+
+        if self.row_hashes is not None:
+            for position in np.flatnonzero(changed):
+                self.row_hashes[position] = row_hash(self.confident_dataframe.iloc[position], self.dataset_root)
+
+    def _import_changed_rows(
+        self,
+        previous_lines: dict[str, np.ndarray],
+        previous_wide_series: dict[str, pd.DataFrame],
+        outputs: tuple[str, ...] = ("both",),
+        n_jobs: int = 1,
+    ):
+        """
+        Import the rows without previous line, -1, in any of the previous series, by wide attribute, and take the
+        series of the other ones from the previous import
+        """
+        recomputed = np.any([lines < 0 for lines in previous_lines.values()], axis=0)
+        self.nb_reused_rows = int((~recomputed).sum())
+
+        self.import_confident_series(outputs=outputs, rows=np.flatnonzero(recomputed), n_jobs=n_jobs)
+        for _, _, wide_attribute in selected_exports(outputs):
+            setattr(
+                self,
+                wide_attribute,
+                assemble_series(
+                    previous_wide_series[wide_attribute],
+                    np.where(recomputed, -1, previous_lines[wide_attribute]),
+                    getattr(self, wide_attribute),
+                    self.confident_dataframe.index.to_numpy(),
+                ),
+            )
+        self.partial_rows = True
 
+    def angle_series_dataframe(self, correction: bool = True) -> pd.DataFrame:
+        """
+        Gather the angle series of all the imported rows in a single dataframe, in the wide layout.
 
-def load() -> Spartacus:
-    """Load the confident dataset"""
+        Parameters
+        ----------
+        correction: bool
+            If True, the angles are corrected to be ISB-like, otherwise they are kept as in the article.
+        """
+        output_dataframe = pd.DataFrame(columns=WIDE_COLUMNS)
+        angle_series = [
+            row_data.to_wide_angle_series_dataframe(correction=correction)
+            for row_data in self.rows
+            if row_data.usable_rotation_data and row_data.data is not None
+        ]
+
+        return pd.concat([output_dataframe] + angle_series, ignore_index=True)
+
+    def translation_series_dataframe(self, correction: bool = True) -> pd.DataFrame:
+        """
+        Gather the translation series of all the imported rows in a single dataframe, in the wide layout.
+
+        Parameters
+        ----------
+        correction: bool
+            If True, the translations are expressed in ISB-like segment coordinate systems, otherwise as in the article.
+        """
+        output_dataframe = pd.DataFrame(columns=WIDE_COLUMNS)
+        translation_series = [
+            row_data.to_wide_translation_series_dataframe(correction=correction)
+            for row_data in self.rows
+            if row_data.usable_translation_data
+        ]
+
+        return pd.concat([output_dataframe] + translation_series, ignore_index=True)
+
+    def export(
+        self,
+        orientations: bool = False,
+        outputs: tuple[str, ...] = ("both",),
+        file_format: str = "csv",
+        export_folder: str | Path = None,
+    ):
+        """
+        Export the angle and translation series in the long layout next to the clean dataset of the dataset root.
+
+        Parameters
+        ----------
+        orientations: bool
+            If True, the corrected rotation matrices and quaternions are exported too, as .npy sidecars whose
+            lines match the ones of corrected_confident_orientations.csv, i.e. of corrected_confident_data_wide.
+        outputs: tuple[str, ...]
+            The series to export, among "raw", "corrected" and "both"
+        file_format: str
+            The file format of the series, see FILE_FORMATS, the row manifests being always csv files
+        export_folder: str | Path
+            The folder to export in, the export folder of the dataset root by default, e.g. one per build when
+            several builds of the same root run in parallel
+        """
+        check_outputs(outputs)
+        check_file_format(file_format)
+        path_next_to_clean = self.dataset_root.export_folder if export_folder is None else Path(export_folder)
+
+        for attribute, file, _ in selected_exports(outputs):
+            write_export(getattr(self, attribute), export_path(path_next_to_clean, file, file_format), file_format)
+
+        # the hash and the number of samples of each row, to rebuild the exports incrementally on the next load,
+        # the manifest of the outputs not exported is left as is, as their exports
+        if self.row_hashes is None:
+            self.row_hashes = [row_hash(row, self.dataset_root) for _, row in self.confident_dataframe.iterrows()]
+        for correction in selected_corrections(outputs):
+            row_manifest(
+                self.confident_dataframe,
+                self.row_hashes,
+                self.corrected_confident_data_wide if correction else self.confident_data_wide,
+                self.corrected_confident_translation_data_wide if correction else self.confident_translation_data_wide,
+            ).to_csv(row_manifest_path(path_next_to_clean, file_format, correction), index=False)
+
+        if orientations:
+            confident_path = export_path(path_next_to_clean, "corrected_confident_orientations.csv", file_format)
+            write_export(self.corrected_confident_data_wide[ORIENTATION_INDEX_COLUMNS], confident_path, file_format)
+
+            confident_path = Path.joinpath(path_next_to_clean, "corrected_confident_rotation_matrices.npy")
+            np.save(confident_path, np.ascontiguousarray(self.corrected_rotation_matrices))
+
+            confident_path = Path.joinpath(path_next_to_clean, "corrected_confident_quaternions.npy")
+            np.save(confident_path, np.ascontiguousarray(self.corrected_quaternions))
+
+
+def check_outputs(outputs: tuple[str, ...]):
+    """Check the requested outputs are among "raw", "corrected" and "both"."""
+    if isinstance(outputs, str) or not all(output in OUTPUTS for output in outputs):
+        raise ValueError(f"outputs must be a tuple of values among {OUTPUTS}, got {outputs}.")
+
+
+def load(
+    outputs: tuple[str, ...] = ("both",),
+    dataset_csv: str | Path = None,
+    dataset_root: DatasetRoot | str | Path = None,
+    incremental: bool = False,
+    n_jobs: int = 1,
+) -> Spartacus:
+    """
+    Load the confident dataset
+
+    Parameters
+    ----------
+    outputs: tuple[str, ...]
+        The angle series to compute right away, among "raw", "corrected" and "both".
+    dataset_csv: str | Path
+        The dataset table to load, the dataset_clean.csv of the dataset root by default, e.g. a synthetic one,
+        see generate_synthetic_dataset
+    dataset_root: DatasetRoot | str | Path
+        The root holding the dataset table, the study folders and the exports, see DatasetRoot for the default one
+    incremental: bool
+        If True, only the rows added or changed since the last export are recomputed, the other ones are read back
+        from the exports, and the exports of the outputs are updated, see Spartacus.import_confident_data_incrementally.
+        Only the series of the outputs are then available.
+    n_jobs: int
+        The number of processes importing the rows, see Spartacus.import_confident_data
+    """
+    dataset_root = dataset_root if isinstance(dataset_root, DatasetRoot) else DatasetRoot(dataset_root)
     # open the file only_dataset_raw.csv
-    df = pd.read_csv(DatasetCSV.CLEAN.value)
+    df = pd.read_csv(dataset_root.clean_csv if dataset_csv is None else dataset_csv)
     # temporary for debugging
     # df = df[df["dataset_authors"] == "Fung et al."]
     # keep Fung and Bourne
@@ -205,22 +1013,55 @@ def load() -> Spartacus:
     # df = df[df["dataset_authors"] == "Yoshida et al."]
 
     print(df.shape)
-    sp = Spartacus(dataframe=df)
+    sp = Spartacus(dataframe=df, dataset_root=dataset_root)
     sp.remove_rows_not_ready_for_analysis()
     sp.set_correction_callbacks_from_segment_joint_validity(print_warnings=True)
-    sp.import_confident_data()
+    if incremental:
+        sp.import_confident_data_incrementally(outputs=outputs, n_jobs=n_jobs)
+        sp.export(outputs=outputs)
+    else:
+        sp.import_confident_series(outputs=outputs, n_jobs=n_jobs)
     # df = load_confident_data(df, print_warnings=True)
     print(df.shape)
     return sp
 
 
-def load_subdataset(name: DataFolder | str) -> Spartacus:
-    """Load the confident dataset"""
+def load_subdataset(
+    name: DataFolder | str,
+    outputs: tuple[str, ...] = ("both",),
+    dataset_csv: str | Path = None,
+    dataset_root: DatasetRoot | str | Path = None,
+) -> Spartacus:
+    """
+    Load the confident dataset of a single article
+
+    Parameters
+    ----------
+    name: DataFolder | str
+        The data folder or the dataset author of the article.
+    outputs: tuple[str, ...]
+        The angle series to compute right away, among "raw", "corrected" and "both".
+    dataset_csv: str | Path
+        The dataset table to load, the dataset_clean.csv of the dataset root by default
+    dataset_root: DatasetRoot | str | Path
+        The root holding the dataset table, the study folders and the exports, see DatasetRoot for the default one
+    """
+    dataset_root = dataset_root if isinstance(dataset_root, DatasetRoot) else DatasetRoot(dataset_root)
     # open the file only_dataset_raw.csv
-    df = pd.read_csv(DatasetCSV.CLEAN.value)
+    df = pd.read_csv(dataset_root.clean_csv if dataset_csv is None else dataset_csv)
     datafolder_string = name if isinstance(name, str) else name.to_dataset_author()
     df = df[df["dataset_authors"] == datafolder_string]
-    sp = Spartacus(dataframe=df)
+    sp = Spartacus(dataframe=df, dataset_root=dataset_root)
     sp.set_correction_callbacks_from_segment_joint_validity(print_warnings=True)
-    sp.import_confident_data()
+    sp.import_confident_series(outputs=outputs)
     return sp
+
+
+def _import_rows(
+    confident_dataframe: pd.DataFrame, dataset_root: DatasetRoot, outputs: tuple[str, ...]
+) -> dict[str, pd.DataFrame]:
+    """Import a chunk of confident rows in a worker process, see Spartacus.import_confident_data"""
+    spartacus = Spartacus(dataframe=confident_dataframe, dataset_root=dataset_root)
+    spartacus.confident_dataframe = confident_dataframe
+    spartacus.import_confident_series(outputs=outputs)
+    return {wide_attribute: getattr(spartacus, wide_attribute) for _, _, wide_attribute in selected_exports(outputs)}
@@ -2,10 +2,84 @@
 This module is used to load the data from the csv file for individual datasets for each dofs.
 """
 
+import os
+from collections import OrderedDict
+
 import numpy as np
 import pandas as pd
 
 
+class CsvCache:
+    """
+    Process-wide cache of the parsed csv files, several rows of the dataset share the same dof files.
+
+    The files are identified by their absolute path, modification time and size, so that an edited file is read again.
+    The parsed arrays are read-only and shared by all the rows, the least recently used ones are evicted when the
+    memory budget is exceeded.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024**2):
+        """
+        Parameters
+        ----------
+        max_bytes: int
+            The memory budget of the cached arrays, in bytes
+        """
+        self.max_bytes = max_bytes
+        self.arrays = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(csv_filename: str) -> tuple[str, int, int]:
+        """The absolute path, modification time and size of the file"""
+        stat = os.stat(csv_filename)
+        return os.path.abspath(csv_filename), stat.st_mtime_ns, stat.st_size
+
+    def get(self, csv_filename: str) -> np.ndarray:
+        """Returns the read-only array of the csv file, parsed only if not already cached"""
+        key = self.key(csv_filename)
+
+        array = self.arrays.get(key)
+        if array is not None:
+            self.hits += 1
+            self.arrays.move_to_end(key)
+            return array
+
+        self.misses += 1
+        print(f"Loading {csv_filename}")
+        array = pd.read_csv(csv_filename, sep=",", header=None).to_numpy(dtype=float)
+        array.flags.writeable = False
+
+        self.arrays[key] = array
+        self.nbytes += array.nbytes
+        while self.nbytes > self.max_bytes and len(self.arrays) > 1:
+            _, evicted_array = self.arrays.popitem(last=False)
+            self.nbytes -= evicted_array.nbytes
+
+        return array
+
+    def clear(self):
+        """Empty the cache and reset the counters"""
+        self.arrays.clear()
+        self.nbytes = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def report(self) -> str:
+        return (
+            f"CSV cache: {self.hits} hits, {self.misses} misses, "
+            f"{len(self.arrays)} files cached ({self.nbytes / 1024**2:.1f} MB)"
+        )
+
+
+CSV_CACHE = CsvCache()
+
+
 def load_euler_csv(csv_filenames: tuple[str, str, str], drop_humerothoracic_raw_data: bool = True) -> pd.DataFrame:
     """
     Load the csv file from the filename and return a pandas dataframe.
@@ -89,9 +163,7 @@ def load_euler_csv(csv_filenames: tuple[str, str, str], drop_humerothoracic_raw_
 def load_csv(csv_filenames, columns):
     """Load the csv file from the filename and return a pandas dataframe."""
     if csv_filenames is not None:
-        print(f"Loading {csv_filenames}")
-        csv_file_dof1 = pd.read_csv(csv_filenames, sep=",", header=None)
-        csv_file_dof1.columns = columns
+        csv_file_dof1 = pd.DataFrame(CSV_CACHE.get(csv_filenames), columns=columns)
     else:
         csv_file_dof1 = pd.DataFrame(columns=columns)
 
@@ -0,0 +1,222 @@
+"""
+This module propagates the uncertainty of the coordinate system corrections of Kolz et al. (2020) to the corrected
+angles with a Monte Carlo simulation. The correction matrices are population means, so each row draws K correction
+matrices rotated by small random rotations around the mean ones, all the draws go through the correction chain at
+once as a stack of shape (K, N, 3, 3), and the spread of the corrected angles gives per-sample uncertainty bands.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .angle_series import VALUE_COLUMNS
+from .corrections.kolz_matrices import orthonormalize_matrix
+from .utils import flip_rotations_batch
+
+# the angular standard deviation, in degrees, of the small rotations around the correction matrices
+DEFAULT_ANGULAR_SD = 5.0
+
+UNCERTAINTY_COLUMNS = [
+    "sd_dof1",  # float, the standard deviation of the corrected angles over the draws, in degrees
+    "sd_dof2",  # float
+    "sd_dof3",  # float
+    "lower_dof1",  # float, the lower bound of the band, in degrees
+    "lower_dof2",  # float
+    "lower_dof3",  # float
+    "upper_dof1",  # float, the upper bound of the band, in degrees
+    "upper_dof2",  # float
+    "upper_dof3",  # float
+]
+
+
+def random_small_rotations(rng: np.random.Generator, nb_draws: int, angular_sd: float) -> np.ndarray:
+    """
+    Draw rotation matrices whose rotation vectors follow an isotropic normal distribution, with Rodrigues' formula.
+
+    Parameters
+    ----------
+    rng: np.random.Generator
+        The random generator
+    nb_draws: int
+        The number of rotations K
+    angular_sd: float
+        The standard deviation of each component of the rotation vectors, in degrees
+
+    Returns
+    -------
+    np.ndarray
+        The rotation matrices, shape (K, 3, 3)
+    """
+    rotation_vectors = rng.normal(0.0, np.deg2rad(angular_sd), size=(nb_draws, 3))
+    angles = np.linalg.norm(rotation_vectors, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        axes = np.where(angles[:, np.newaxis] > 0, rotation_vectors / angles[:, np.newaxis], 0.0)
+
+    skew = np.zeros((nb_draws, 3, 3))
+    skew[:, 0, 1], skew[:, 0, 2], skew[:, 1, 2] = -axes[:, 2], axes[:, 1], -axes[:, 0]
+    skew -= np.swapaxes(skew, 1, 2)
+
+    sin, cos = np.sin(angles)[:, np.newaxis, np.newaxis], np.cos(angles)[:, np.newaxis, np.newaxis]
+    return np.eye(3) + sin * skew + (1 - cos) * skew @ skew
+
+
+def perturb_rotation_matrix(
+    matrix: np.ndarray, rng: np.random.Generator, nb_draws: int, angular_sd: float = DEFAULT_ANGULAR_SD
+) -> np.ndarray:
+    """
+    Draw rotation matrices around a mean one, orthonormalized in a single batch.
+
+    Parameters
+    ----------
+    matrix: np.ndarray
+        The mean rotation matrix, shape (3, 3)
+    rng: np.random.Generator
+        The random generator
+    nb_draws: int
+        The number of draws K
+    angular_sd: float
+        The standard deviation of each component of the rotation vectors of the perturbations, in degrees
+
+    Returns
+    -------
+    np.ndarray
+        The perturbed rotation matrices, shape (K, 3, 3)
+    """
+    return orthonormalize_matrix(random_small_rotations(rng, nb_draws, angular_sd) @ matrix)
+
+
+def closest_branch(angles: np.ndarray, reference: np.ndarray, sequence: str, period: float = np.pi) -> np.ndarray:
+    """
+    Express stacked euler angles on the branch, as returned or flipped, the closest to reference angles, each angle
+    being shifted by the multiple of period that brings it the closest to its reference, as unwrap_batch does.
+
+    Parameters
+    ----------
+    angles: np.ndarray
+        The euler angles in radians, shape (K, N, 3)
+    reference: np.ndarray
+        The reference euler angles in radians, shape (N, 3)
+    sequence: str
+        The euler sequence of the angles
+    period: float
+        The period of the shifts in radians, pi as the corrected angles are unwrapped with a period of 180 degrees
+
+    Returns
+    -------
+    np.ndarray
+        The euler angles, shape (K, N, 3)
+    """
+    flipped = flip_rotations_batch(angles.reshape(-1, 3), sequence).reshape(angles.shape)
+    angles_difference = np.mod(angles - reference + period / 2, period) - period / 2
+    flipped_difference = np.mod(flipped - reference + period / 2, period) - period / 2
+    is_flipped = np.abs(flipped_difference).sum(axis=2) < np.abs(angles_difference).sum(axis=2)
+    return reference + np.where(is_flipped[..., np.newaxis], flipped_difference, angles_difference)
+
+
+def correction_uncertainty(
+    row_data,
+    corrected_angles: np.ndarray,
+    nb_draws: int = 1000,
+    angular_sd: float = DEFAULT_ANGULAR_SD,
+    confidence_level: float = 0.95,
+    seed: int | np.random.SeedSequence = 0,
+) -> np.ndarray:
+    """
+    The per-sample uncertainty of the corrected angles of a row due to its Kolz correction matrices. The rows without
+    such a correction have no uncertainty, their bands collapse on the corrected angles.
+
+    Parameters
+    ----------
+    row_data: RowData
+        The row, with its angle series
+    corrected_angles: np.ndarray
+        The corrected angles of the row in degrees, the center of the draws, shape (N, 3)
+    nb_draws: int
+        The number of draws K of the correction matrices
+    angular_sd: float
+        The standard deviation of each component of the rotation vectors of the perturbations, in degrees
+    confidence_level: float
+        The coverage of the bands
+    seed: int | np.random.SeedSequence
+        The seed of the random generator
+
+    Returns
+    -------
+    np.ndarray
+        The standard deviation, lower and upper bounds of the corrected angles in degrees, shape (N, 9),
+        see UNCERTAINTY_COLUMNS
+    """
+    if not 0 < confidence_level < 1:
+        raise ValueError(f"confidence_level must be between 0 and 1, got {confidence_level}.")
+
+    nominal = np.asarray(corrected_angles, dtype=float)
+    if row_data.parent_corrections is None and row_data.child_corrections is None:
+        return np.hstack((np.zeros_like(nominal), nominal, nominal))
+
+    rng = np.random.default_rng(seed)
+    parent_matrix_corrections = perturb_rotation_matrix(row_data.parent_matrix_correction, rng, nb_draws, angular_sd)
+    child_matrix_corrections = perturb_rotation_matrix(row_data.child_matrix_correction, rng, nb_draws, angular_sd)
+    # an identity correction is exact, it is not perturbed
+    if row_data.parent_corrections is None:
+        parent_matrix_corrections[:] = np.eye(3)
+    if row_data.child_corrections is None:
+        child_matrix_corrections[:] = np.eye(3)
+
+    value_dof = row_data.data[VALUE_COLUMNS].to_numpy(dtype=float)
+    draws = row_data.apply_perturbed_correction_in_radians_batch(
+        value_dof, parent_matrix_corrections, child_matrix_corrections
+    )
+    draws = np.rad2deg(closest_branch(draws, np.deg2rad(nominal), row_data.joint.isb_euler_sequence().value.lower()))
+
+    alpha = (1 - confidence_level) / 2
+    with np.errstate(invalid="ignore"):
+        lower, upper = np.percentile(draws, [100 * alpha, 100 * (1 - alpha)], axis=0)
+    return np.hstack((draws.std(axis=0), lower, upper))
+
+
+def propagate_correction_uncertainty(
+    wide_dataframe: pd.DataFrame,
+    rows: list,
+    nb_draws: int = 1000,
+    angular_sd: float = DEFAULT_ANGULAR_SD,
+    confidence_level: float = 0.95,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    The corrected angle series with their per-sample uncertainty bands, see UNCERTAINTY_COLUMNS. Each row has its own
+    random generator spawned from the seed, so the draws of a row do not depend on the other rows.
+
+    Parameters
+    ----------
+    wide_dataframe: pd.DataFrame
+        The corrected angle series of the rows in the wide layout, see WIDE_COLUMNS
+    rows: list[RowData]
+        The rows of the series, in the order of wide_dataframe
+    nb_draws: int
+        The number of draws K of the correction matrices
+    angular_sd: float
+        The standard deviation of each component of the rotation vectors of the perturbations, in degrees
+    confidence_level: float
+        The coverage of the bands
+    seed: int
+        The seed of the random generators
+
+    Returns
+    -------
+    pd.DataFrame
+        The series in the wide layout with the uncertainty columns
+    """
+    lengths = [row_data.data.shape[0] for row_data in rows]
+    if sum(lengths) != wide_dataframe.shape[0]:
+        raise ValueError(f"The rows have {sum(lengths)} samples, but the series have {wide_dataframe.shape[0]} lines.")
+
+    corrected_angles = np.split(wide_dataframe[VALUE_COLUMNS].to_numpy(dtype=float), np.cumsum(lengths)[:-1])
+    seeds = np.random.SeedSequence(seed).spawn(len(rows))
+    bands = [np.zeros((0, len(UNCERTAINTY_COLUMNS)))] + [
+        correction_uncertainty(row_data, angles, nb_draws, angular_sd, confidence_level, seed=row_seed)
+        for row_data, angles, row_seed in zip(rows, corrected_angles, seeds)
+    ]
+    bands = np.vstack(bands)
+
+    uncertain = wide_dataframe.reset_index(drop=True).copy()
+    uncertain[UNCERTAINTY_COLUMNS] = bands
+    return uncertain
@@ -0,0 +1,167 @@
+"""
+This module grades each sample of the angle series, in whole batches, by how well its euler angles describe its
+rotation: far from the gimbal lock of the sequence, close to it, or no longer matching the corrected rotation matrix,
+e.g. when unwrapping the angles with a period of 180 degrees shifted a single angle by a half turn.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .angle_series import LEGEND_COLUMNS, VALUE_COLUMNS
+from .corrections.angle_conversion_callbacks import euler_conditioning, from_euler_angles_to_rotation_matrices
+from .enums import EulerSequence, JointType
+from .reexpression import SINGULARITY_TOLERANCE
+
+# the largest difference between the coefficients of the rotation matrices of the angles and the corrected ones
+MATRIX_TOLERANCE = 1e-6
+
+QUALITY_LEVELS = (
+    "good",  # far enough from the gimbal lock
+    "near_singular",  # closer than the tolerance to the gimbal lock, the first and third angles are ill-defined
+    "half_turn",  # the angles do not describe the corrected rotation matrix anymore
+    "missing",  # NaN angles
+)
+
+QUALITY_COLUMNS = [
+    "conditioning",  # float, see euler_conditioning, 1 far from the gimbal lock and 0 on it
+    "quality",  # string, see QUALITY_LEVELS
+]
+
+QUALITY_SUMMARY_COLUMNS = [
+    "row_id",  # int
+    "article",  # string
+    "joint",  # string
+    "humeral_motion",  # string
+    "shoulder_id",  # int
+    "euler_sequence",  # string
+    "nb_samples",  # int
+    "nb_near_singular",  # int
+    "nb_half_turn",  # int
+    "nb_missing",  # int
+    "min_conditioning",  # float
+    "min_lock_distance",  # float, the smallest angle to the gimbal lock in degrees
+    "flagged_fraction",  # float, the fraction of samples which are not good
+]
+
+
+def _line_sequences(wide_dataframe: pd.DataFrame) -> np.ndarray:
+    """
+    The euler sequence of each line, the euler_sequence column if any, e.g. after a re-expression, otherwise the
+    legend when it spells a sequence, i.e. uncorrected angles, otherwise the ISB sequence of the joint.
+    """
+    if "euler_sequence" in wide_dataframe.columns:
+        return wide_dataframe["euler_sequence"].to_numpy(dtype=object)
+
+    legend = wide_dataframe[LEGEND_COLUMNS].astype(str)
+    legend = (legend[LEGEND_COLUMNS[0]] + legend[LEGEND_COLUMNS[1]] + legend[LEGEND_COLUMNS[2]]).to_numpy(dtype=object)
+    joints = wide_dataframe["joint"].to_numpy(dtype=object)
+    is_letters = np.isin(legend, [sequence.value for sequence in EulerSequence])
+    sequences = legend.copy()
+    for joint in pd.unique(joints[~is_letters]):
+        isb_sequence = EulerSequence.isb_from_joint_type(JointType.from_string(joint)).value
+        sequences[(joints == joint) & ~is_letters] = isb_sequence
+
+    return sequences
+
+
+def sample_quality(
+    wide_dataframe: pd.DataFrame,
+    rotation_matrices: np.ndarray = None,
+    singularity_tolerance: float = SINGULARITY_TOLERANCE,
+) -> pd.DataFrame:
+    """
+    Grade every sample of the angle series, one batch per euler sequence, see QUALITY_LEVELS.
+
+    Parameters
+    ----------
+    wide_dataframe: pd.DataFrame
+        The angle series in the wide layout, see WIDE_COLUMNS, the translation lines are ignored
+    rotation_matrices: np.ndarray
+        The corrected rotation matrices, one per line of wide_dataframe, shape (M, 3, 3). If None, the half turns
+        are not detected.
+    singularity_tolerance: float
+        The samples whose second angle is closer than this angle, in degrees, to the gimbal lock are near singular
+
+    Returns
+    -------
+    pd.DataFrame
+        The series in the wide layout with the conditioning and quality columns, see QUALITY_COLUMNS,
+        NaN and None for the translation lines
+    """
+    if rotation_matrices is not None and rotation_matrices.shape[0] != wide_dataframe.shape[0]:
+        raise ValueError(
+            f"One rotation matrix per line is expected, got {rotation_matrices.shape[0]} matrices "
+            f"for {wide_dataframe.shape[0]} lines."
+        )
+
+    assessed = wide_dataframe.reset_index(drop=True).copy()
+    conditioning = np.full(assessed.shape[0], np.nan)
+    is_half_turn = np.zeros(assessed.shape[0], dtype=bool)
+
+    is_angle = (assessed["unit"] == "rad").to_numpy()
+    sequences = np.full(assessed.shape[0], None, dtype=object)
+    sequences[is_angle] = _line_sequences(assessed[is_angle])
+    angles = np.deg2rad(assessed[VALUE_COLUMNS].to_numpy(dtype=float))
+
+    for sequence in pd.unique(sequences[is_angle]):
+        is_sequence = sequences == sequence
+        conditioning[is_sequence] = euler_conditioning(angles[is_sequence], EulerSequence.from_string(sequence))
+        if rotation_matrices is not None:
+            rebuilt = from_euler_angles_to_rotation_matrices(sequence, angles[is_sequence])
+            difference = np.abs(rebuilt - rotation_matrices[is_sequence]).max(axis=(1, 2), initial=0)
+            is_half_turn[is_sequence] = difference > MATRIX_TOLERANCE
+
+    is_missing = np.isnan(angles).any(axis=1)
+    with np.errstate(invalid="ignore"):
+        is_near_singular = conditioning < np.sin(np.deg2rad(singularity_tolerance))
+
+    quality = np.full(assessed.shape[0], "good", dtype=object)
+    quality[is_near_singular] = "near_singular"
+    quality[is_half_turn] = "half_turn"
+    quality[is_missing] = "missing"
+    quality[~is_angle] = None
+
+    assessed["conditioning"] = conditioning
+    assessed["quality"] = quality
+    return assessed
+
+
+def quality_summary(assessed_dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Summarize the quality of the samples per row of the dataset.
+
+    Parameters
+    ----------
+    assessed_dataframe: pd.DataFrame
+        The angle series graded by sample_quality
+
+    Returns
+    -------
+    pd.DataFrame
+        One line per row of the dataset, see QUALITY_SUMMARY_COLUMNS
+    """
+    assessed = assessed_dataframe[assessed_dataframe["quality"].notna()].copy()
+    if assessed.shape[0] == 0:
+        return pd.DataFrame(columns=QUALITY_SUMMARY_COLUMNS)
+
+    assessed["euler_sequence"] = _line_sequences(assessed)
+    for level in ("near_singular", "half_turn", "missing"):
+        assessed[f"nb_{level}"] = assessed["quality"] == level
+    assessed["is_flagged"] = assessed["quality"] != "good"
+
+    summary = assessed.groupby("row_id", sort=False).agg(
+        article=("article", "first"),
+        joint=("joint", "first"),
+        humeral_motion=("humeral_motion", "first"),
+        shoulder_id=("shoulder_id", "first"),
+        euler_sequence=("euler_sequence", "first"),
+        nb_samples=("quality", "size"),
+        nb_near_singular=("nb_near_singular", "sum"),
+        nb_half_turn=("nb_half_turn", "sum"),
+        nb_missing=("nb_missing", "sum"),
+        min_conditioning=("conditioning", "min"),
+        flagged_fraction=("is_flagged", "mean"),
+    )
+    summary["min_lock_distance"] = np.rad2deg(np.arcsin(summary["min_conditioning"].clip(upper=1)))
+
+    return summary.reset_index()[QUALITY_SUMMARY_COLUMNS]
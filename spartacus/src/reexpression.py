@@ -0,0 +1,138 @@
+"""
+This module re-expresses the corrected rotations of the dataset in other euler sequences than the ISB ones,
+e.g. the glenohumeral joint in xzy to stay away from the gimbal lock of yxy at low elevations.
+The corrected rotation matrices kept at load time are decomposed again, no csv file is read twice.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .angle_series import LEGEND_COLUMNS, VALUE_COLUMNS
+from .corrections.angle_conversion_callbacks import euler_conditioning, rotation_matrices_2_euler_angles
+from .enums import EulerSequence, JointType
+from .kinematic_chain import JOINT_NAMES
+from .utils import continuous_rotations_batch, unwrap_batch
+
+# samples closer than this angle, in degrees, to the gimbal lock of their sequence are flagged as singular
+SINGULARITY_TOLERANCE = 5.0
+
+REEXPRESSED_COLUMNS = [
+    "euler_sequence",  # string, the sequence of the values
+    "singular",  # bool, True if the sample is close to the gimbal lock of the sequence
+]
+
+
+def _to_joint_name(joint: JointType | str) -> str:
+    """The joint name of the wide layout"""
+    return JOINT_NAMES[joint if isinstance(joint, JointType) else JointType.from_string(joint)]
+
+
+def _decompose(rotation_matrices: np.ndarray, sequence: EulerSequence, row_id: np.ndarray) -> np.ndarray:
+    """The angles of stacked series of rotation matrices, in radians, each series continuous and unwrapped"""
+    series_starts = np.flatnonzero(np.concatenate(([True], row_id[1:] != row_id[:-1])))
+    angles = rotation_matrices_2_euler_angles(rotation_matrices, sequence)
+    angles = continuous_rotations_batch(angles, sequence.value, series_starts=series_starts)
+    return unwrap_batch(angles, series_starts=series_starts)
+
+
+def isb_rotation_series(wide_dataframe: pd.DataFrame, rotation_matrices: np.ndarray) -> pd.DataFrame:
+    """
+    Decompose the rotation matrices of each joint again into its ISB sequence, one batch per joint, the branch of the
+    angles being picked to keep each series continuous and the angles unwrapped by full turns only. The angles then
+    describe the corrected rotations, even where unwrapping them with a 180 degree period shifted a single angle by a
+    half turn, see quality.py.
+
+    Parameters
+    ----------
+    wide_dataframe: pd.DataFrame
+        The corrected angle series in the wide layout, see WIDE_COLUMNS
+    rotation_matrices: np.ndarray
+        The corrected rotation matrices, one per line of wide_dataframe, shape (M, 3, 3)
+
+    Returns
+    -------
+    pd.DataFrame
+        The series in the wide layout, whose values are the ISB euler angles of the rotation matrices in degrees
+    """
+    if rotation_matrices.shape[0] != wide_dataframe.shape[0]:
+        raise ValueError(
+            f"One rotation matrix per line is expected, got {rotation_matrices.shape[0]} matrices "
+            f"for {wide_dataframe.shape[0]} lines."
+        )
+
+    rebuilt = wide_dataframe.reset_index(drop=True).copy()
+    joint_names = rebuilt["joint"].to_numpy()
+    row_id = rebuilt["row_id"].to_numpy()
+    for joint in pd.unique(joint_names):
+        is_joint = joint_names == joint
+        sequence = EulerSequence.isb_from_joint_type(JointType.from_string(joint))
+        rebuilt.loc[is_joint, VALUE_COLUMNS] = np.rad2deg(
+            _decompose(rotation_matrices[is_joint], sequence, row_id[is_joint])
+        )
+
+    return rebuilt
+
+
+def reexpress_rotation_series(
+    wide_dataframe: pd.DataFrame,
+    rotation_matrices: np.ndarray,
+    sequence_per_joint: dict,
+    singularity_tolerance: float = SINGULARITY_TOLERANCE,
+) -> pd.DataFrame:
+    """
+    Decompose the rotation matrices of each joint into the requested euler sequence, the other joints being kept in
+    their ISB sequence. Each joint is decomposed in a single batch, the branch of the angles is picked to keep each
+    series continuous, and the samples close to the gimbal lock are flagged.
+
+    Parameters
+    ----------
+    wide_dataframe: pd.DataFrame
+        The corrected angle series in the wide layout, see WIDE_COLUMNS
+    rotation_matrices: np.ndarray
+        The corrected rotation matrices, one per line of wide_dataframe, shape (M, 3, 3)
+    sequence_per_joint: dict
+        The euler sequence of each joint to re-express, e.g. {"glenohumeral": "xzy"} or
+        {JointType.GLENO_HUMERAL: EulerSequence.XZY}
+    singularity_tolerance: float
+        The samples whose second angle is closer than this angle, in degrees, to the gimbal lock are flagged
+
+    Returns
+    -------
+    pd.DataFrame
+        The series in the wide layout with the euler_sequence and singular columns, see REEXPRESSED_COLUMNS
+    """
+    if rotation_matrices.shape[0] != wide_dataframe.shape[0]:
+        raise ValueError(
+            f"One rotation matrix per line is expected, got {rotation_matrices.shape[0]} matrices "
+            f"for {wide_dataframe.shape[0]} lines."
+        )
+
+    sequences = {
+        _to_joint_name(joint): sequence if isinstance(sequence, EulerSequence) else EulerSequence.from_string(sequence)
+        for joint, sequence in sequence_per_joint.items()
+    }
+
+    reexpressed = wide_dataframe.reset_index(drop=True).copy()
+    reexpressed["euler_sequence"] = None
+    reexpressed["singular"] = False
+
+    joint_names = reexpressed["joint"].to_numpy()
+    row_id = reexpressed["row_id"].to_numpy()
+    for joint in pd.unique(joint_names):
+        is_joint = joint_names == joint
+        isb_sequence = EulerSequence.isb_from_joint_type(JointType.from_string(joint))
+        sequence = sequences.get(joint, isb_sequence)
+
+        if sequence != isb_sequence:
+            angles = _decompose(rotation_matrices[is_joint], sequence, row_id[is_joint])
+            reexpressed.loc[is_joint, VALUE_COLUMNS] = np.rad2deg(angles)
+            reexpressed.loc[is_joint, LEGEND_COLUMNS] = list(sequence.value)
+        else:
+            angles = np.deg2rad(reexpressed.loc[is_joint, VALUE_COLUMNS].to_numpy(dtype=float))
+
+        reexpressed.loc[is_joint, "euler_sequence"] = sequence.value
+        reexpressed.loc[is_joint, "singular"] = euler_conditioning(angles, sequence) < np.sin(
+            np.deg2rad(singularity_tolerance)
+        )
+
+    return reexpressed
@@ -1,8 +1,19 @@
-from itertools import product
-import csv
+"""
+This module enumerates every combination of the options of the risk categories of an experimental setup with its
+cumulative risk, the sum of the risks of its options, e.g. to rank the setups of the studies of the dataset.
 
-# Update the risk values
-categories_updated = [
+The combinations are never built one by one: the cumulative risks of the whole grid come from broadcasting the risks
+of each category along its own axis, and the options of the combinations are read from their flat index in the
+grid, chunk by chunk, so that many more categories can be enumerated and written to CSV or Parquet.
+"""
+
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+RISK_CATEGORIES = [
     {"name": "Medical Imagery", "options": [("Yes", 0), ("No", 2)]},
     {"name": "Intracortical Pins", "options": [("Without Imagery", 2), ("With Imagery", 0)]},
     {
@@ -33,30 +44,141 @@ categories_updated = [
     },
 ]
 
-# Generate all possible combinations of options
-combinations_updated = product(*(category["options"] for category in categories_updated))
-
-# Calculate cumulative risk for each combination and sort by risk
-sorted_combinations_updated = sorted(
-    ((comb, sum(option[1] for option in comb)) for comb in combinations_updated), key=lambda x: x[1]
-)
-
-# Display a sample of the sorted combinations
-print("Individual risks: ", sorted_combinations_updated[0])
-# cumulative risk
-print("Cumulative risk: ", sorted_combinations_updated[0][1])
-
-# Prepare data for CSV
-csv_data = []
-headers = [category["name"] for category in categories_updated] + ["Cumulative Risk"]
-
-for comb, risk in sorted_combinations_updated:
-    row = [option[0] for option in comb] + [risk]
-    csv_data.append(row)
-
-# Save data to CSV file
-file_path = "risk_combinations.csv"
-with open(file_path, mode="w", newline="") as file:
-    writer = csv.writer(file)
-    writer.writerow(headers)
-    writer.writerows(csv_data)
+CUMULATIVE_RISK_COLUMN = "Cumulative Risk"
+CHUNK_SIZE = 100_000
+FILE_FORMATS = ("csv", "parquet")
+
+
+def cumulative_risk_grid(categories: list[dict] = None) -> np.ndarray:
+    """
+    The cumulative risk of every combination of options, the risks of each category being broadcast along its axis.
+
+    Parameters
+    ----------
+    categories: list[dict]
+        The risk categories, each with a "name" and "options", a list of (option, risk), RISK_CATEGORIES by default
+
+    Returns
+    -------
+    np.ndarray
+        The cumulative risks, one axis per category, shape (n_1, ..., n_C)
+    """
+    categories = RISK_CATEGORIES if categories is None else categories
+    nb_categories = len(categories)
+
+    cumulative_risk = np.zeros((1,) * nb_categories, dtype=int)
+    for axis, category in enumerate(categories):
+        risks = np.array([risk for _, risk in category["options"]])
+        shape = [1] * nb_categories
+        shape[axis] = risks.shape[0]
+        cumulative_risk = cumulative_risk + risks.reshape(shape)
+
+    return cumulative_risk
+
+
+def iter_risk_combinations(
+    categories: list[dict] = None, sort: bool = True, chunk_size: int = CHUNK_SIZE
+) -> Iterator[pd.DataFrame]:
+    """
+    Enumerate the combinations of options with their cumulative risk, chunk by chunk. The combinations follow the
+    order of itertools.product over the options, and are stably sorted by cumulative risk if requested.
+
+    Parameters
+    ----------
+    categories: list[dict]
+        The risk categories, each with a "name" and "options", a list of (option, risk), RISK_CATEGORIES by default
+    sort: bool
+        If True, the combinations are sorted by increasing cumulative risk
+    chunk_size: int
+        The number of combinations per chunk
+
+    Returns
+    -------
+    Iterator[pd.DataFrame]
+        The chunks, one column per category with the option names and the cumulative risk column
+    """
+    categories = RISK_CATEGORIES if categories is None else categories
+    cumulative_risk = cumulative_risk_grid(categories).ravel()
+    shape = tuple(len(category["options"]) for category in categories)
+    option_names = [np.array([option for option, _ in category["options"]], dtype=object) for category in categories]
+
+    order = np.argsort(cumulative_risk, kind="stable") if sort else None
+    for start in range(0, cumulative_risk.shape[0], chunk_size):
+        flat_index = np.arange(start, min(start + chunk_size, cumulative_risk.shape[0]))
+        if order is not None:
+            flat_index = order[flat_index]
+
+        option_index = np.unravel_index(flat_index, shape)
+        chunk = pd.DataFrame(
+            {category["name"]: option_names[i][option_index[i]] for i, category in enumerate(categories)}
+        )
+        chunk[CUMULATIVE_RISK_COLUMN] = cumulative_risk[flat_index]
+        yield chunk
+
+
+def risk_combinations(categories: list[dict] = None, sort: bool = True) -> pd.DataFrame:
+    """All the combinations of options with their cumulative risk in a single dataframe, see iter_risk_combinations"""
+    return pd.concat(iter_risk_combinations(categories, sort=sort), ignore_index=True)
+
+
+def write_risk_combinations(
+    file_path: str | Path,
+    categories: list[dict] = None,
+    sort: bool = True,
+    chunk_size: int = CHUNK_SIZE,
+    file_format: str = None,
+) -> Path:
+    """
+    Write the combinations of options with their cumulative risk, chunk by chunk, so that the whole table is never
+    held in memory as strings.
+
+    Parameters
+    ----------
+    file_path: str | Path
+        The file to write
+    categories: list[dict]
+        The risk categories, each with a "name" and "options", a list of (option, risk), RISK_CATEGORIES by default
+    sort: bool
+        If True, the combinations are sorted by increasing cumulative risk
+    chunk_size: int
+        The number of combinations per chunk
+    file_format: str
+        "csv" or "parquet", guessed from the extension of file_path by default. Parquet requires pyarrow.
+
+    Returns
+    -------
+    Path
+        The written file
+    """
+    file_path = Path(file_path)
+    file_format = file_path.suffix.lstrip(".").lower() if file_format is None else file_format
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f"file_format must be one of {FILE_FORMATS}, got {file_format}.")
+
+    chunks = iter_risk_combinations(categories, sort=sort, chunk_size=chunk_size)
+    if file_format == "csv":
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(file_path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+        return file_path
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            writer = pq.ParquetWriter(file_path, table.schema) if writer is None else writer
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return file_path
+
+
+if __name__ == "__main__":
+    combinations = risk_combinations()
+    print("Individual risks: ", combinations.iloc[0].to_dict())
+    print("Cumulative risk: ", combinations[CUMULATIVE_RISK_COLUMN].iloc[0])
+    write_risk_combinations("risk_combinations.csv")
@@ -0,0 +1,242 @@
+"""
+This module averages the rotations of several series on SO(3) rather than their euler angles component-wise,
+which is wrong near gimbal lock and for the glenohumeral YXY sequence whose first and third angles share an axis.
+
+The series are resampled on a common humerothoracic grid, turned into quaternions, averaged at each grid point,
+and the mean rotations are decomposed back into the ISB sequence of the joint.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .angle_series import LEGEND_COLUMNS, VALUE_COLUMNS
+from .corrections.angle_conversion_callbacks import (
+    from_euler_angles_to_rotation_matrices,
+    quaternions_to_rotation_matrices,
+    rotation_matrices_2_euler_angles,
+    rotation_matrices_to_quaternions,
+)
+from .corridor import CORRIDOR_KEYS, DEFAULT_GRID, resample_on_grid
+from .enums import EulerSequence, JointType
+from .utils import unwrap_batch
+
+METHODS = ("chordal", "karcher")
+KARCHER_MAX_ITERATIONS = 50
+KARCHER_TOLERANCE = 1e-10
+
+AVERAGE_COLUMNS = [
+    "joint",  # string
+    "humeral_motion",  # string
+    "humerothoracic_angle",  # float, the grid
+    "value_dof1",  # float, the ISB euler angles of the mean rotation in degrees
+    "value_dof2",  # float
+    "value_dof3",  # float
+    "unit",  # string "rad"
+    "biomechanical_dof1",  # string
+    "biomechanical_dof2",  # string
+    "biomechanical_dof3",  # string
+    "geodesic_sd",  # float, root mean square angle between the rotations and their mean in degrees
+    "nb_series",  # int
+]
+
+
+def chordal_mean(quaternions: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    The chordal L2 mean of unit quaternions, i.e. the eigenvector of the largest eigenvalue of the weighted sum of
+    their outer products, for many sets of quaternions at once. The sign of the quaternions does not matter.
+
+    Parameters
+    ----------
+    quaternions: np.ndarray
+        The quaternions, NaN when missing, shape (S, G, 4)
+    weights: np.ndarray
+        The weight of each series, shape (S,)
+
+    Returns
+    -------
+    np.ndarray
+        The mean quaternions, NaN if no quaternion at the grid point, shape (G, 4)
+    """
+    is_valid = ~np.isnan(quaternions).any(axis=2)
+    valid_quaternions = np.where(is_valid[..., np.newaxis], quaternions, 0.0)
+    weighted_quaternions = valid_quaternions * weights[:, np.newaxis, np.newaxis]
+
+    outer_products = np.einsum("sgi,sgj->gij", weighted_quaternions, valid_quaternions)
+    _, eigenvectors = np.linalg.eigh(outer_products)
+    mean = eigenvectors[:, :, -1]
+    mean = np.where(mean[:, :1] < 0, -mean, mean)
+    mean[~is_valid.any(axis=0)] = np.nan
+
+    return mean
+
+
+def _quaternion_product(p: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """The Hamilton product of quaternions, scalar first, broadcast on the leading dimensions"""
+    pw, px, py, pz = np.moveaxis(p, -1, 0)
+    qw, qx, qy, qz = np.moveaxis(q, -1, 0)
+    return np.stack(
+        [
+            pw * qw - px * qx - py * qy - pz * qz,
+            pw * qx + px * qw + py * qz - pz * qy,
+            pw * qy - px * qz + py * qw + pz * qx,
+            pw * qz + px * qy - py * qx + pz * qw,
+        ],
+        axis=-1,
+    )
+
+
+def _quaternion_log(quaternions: np.ndarray) -> np.ndarray:
+    """The rotation vectors of unit quaternions with a non-negative scalar part, shape (..., 4) -> (..., 3)"""
+    vector_norm = np.linalg.norm(quaternions[..., 1:], axis=-1, keepdims=True)
+    angle = 2 * np.arctan2(vector_norm, quaternions[..., :1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.where(vector_norm > 1e-12, angle / vector_norm, 2.0)
+    return scale * quaternions[..., 1:]
+
+
+def _quaternion_exp(rotation_vectors: np.ndarray) -> np.ndarray:
+    """The unit quaternions of rotation vectors, shape (..., 3) -> (..., 4)"""
+    angle = np.linalg.norm(rotation_vectors, axis=-1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.where(angle > 1e-12, np.sin(angle / 2) / angle, 0.5)
+    return np.concatenate((np.cos(angle / 2), scale * rotation_vectors), axis=-1)
+
+
+def _residuals(quaternions: np.ndarray, mean: np.ndarray) -> np.ndarray:
+    """The rotation vectors from the mean to each quaternion, NaN when missing, shape (S, G, 3)"""
+    conjugate = mean * np.array([1, -1, -1, -1])
+    differences = _quaternion_product(conjugate[np.newaxis], quaternions)
+    differences = np.where(differences[..., :1] < 0, -differences, differences)
+    return _quaternion_log(differences)
+
+
+def karcher_mean(quaternions: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    The Karcher mean of unit quaternions, i.e. the rotation minimizing the sum of the squared geodesic distances,
+    for many sets of quaternions at once. It starts from the chordal mean and moves every mean along the average
+    of the residual rotation vectors until they vanish.
+
+    Parameters
+    ----------
+    quaternions: np.ndarray
+        The quaternions, NaN when missing, shape (S, G, 4)
+    weights: np.ndarray
+        The weight of each series, shape (S,)
+
+    Returns
+    -------
+    np.ndarray
+        The mean quaternions, NaN if no quaternion at the grid point, shape (G, 4)
+    """
+    mean = chordal_mean(quaternions, weights)
+    is_valid = ~np.isnan(quaternions).any(axis=2)
+    valid_weights = np.where(is_valid, weights[:, np.newaxis], 0.0)
+    total_weight = valid_weights.sum(axis=0)
+    has_mean = total_weight > 0
+
+    for _ in range(KARCHER_MAX_ITERATIONS):
+        residuals = np.nan_to_num(_residuals(quaternions, np.where(has_mean[:, np.newaxis], mean, 1.0)))
+        step = (valid_weights[..., np.newaxis] * residuals).sum(axis=0)
+        step[has_mean] /= total_weight[has_mean, np.newaxis]
+        mean = _quaternion_product(mean, _quaternion_exp(step))
+        mean /= np.linalg.norm(mean, axis=1, keepdims=True)
+        if np.nanmax(np.linalg.norm(step, axis=1), initial=0) < KARCHER_TOLERANCE:
+            break
+
+    return np.where(mean[:, :1] < 0, -mean, mean)
+
+
+def average_rotation_series(
+    values: np.ndarray, joint_type: JointType, weights: np.ndarray = None, method: str = "karcher"
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Average stacked series of ISB euler angles sampled on the same grid on SO(3).
+
+    Parameters
+    ----------
+    values: np.ndarray
+        The ISB euler angles in degrees, shape (S, G, 3), which must describe the corrected rotations, see
+        reexpression.isb_rotation_series
+    joint_type: JointType
+        The joint of the series, which gives its ISB sequence
+    weights: np.ndarray
+        The weight of each series, all ones by default
+    method: str
+        "chordal" or "karcher"
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The ISB euler angles of the mean rotations in degrees, shape (G, 3),
+        and the root mean square geodesic distance to the mean in degrees, shape (G,)
+    """
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}, got {method}.")
+
+    nb_series, nb_points = values.shape[:2]
+    weights = np.ones(nb_series) if weights is None else np.asarray(weights, dtype=float)
+    sequence = EulerSequence.isb_from_joint_type(joint_type)
+
+    matrices = from_euler_angles_to_rotation_matrices(sequence.value, np.deg2rad(values.reshape(-1, 3)))
+    quaternions = rotation_matrices_to_quaternions(matrices).reshape(nb_series, nb_points, 4)
+
+    mean = chordal_mean(quaternions, weights) if method == "chordal" else karcher_mean(quaternions, weights)
+
+    is_valid = ~np.isnan(quaternions).any(axis=2)
+    valid_weights = np.where(is_valid, weights[:, np.newaxis], 0.0)
+    squared_distances = np.nan_to_num(np.linalg.norm(_residuals(quaternions, mean), axis=2) ** 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        geodesic_sd = np.sqrt((valid_weights * squared_distances).sum(axis=0) / valid_weights.sum(axis=0))
+
+    has_mean = ~np.isnan(mean).any(axis=1)
+    angles = np.full((nb_points, 3), np.nan)
+    angles[has_mean] = rotation_matrices_2_euler_angles(quaternions_to_rotation_matrices(mean[has_mean]), sequence)
+
+    # full turns only, so that the angles still describe the mean rotations
+    return unwrap_batch(np.rad2deg(angles), period=360, series_starts=np.array([0])), np.rad2deg(geodesic_sd)
+
+
+def average_rotations(
+    wide_dataframe: pd.DataFrame, grid: np.ndarray = None, method: str = "karcher", weighted: bool = False
+) -> pd.DataFrame:
+    """
+    Average on SO(3) the corrected angle series of every joint and humeral motion at each point of the grid.
+
+    Parameters
+    ----------
+    wide_dataframe: pd.DataFrame
+        The corrected angle series in the wide layout, see WIDE_COLUMNS, whose angles describe the corrected
+        rotations, see reexpression.isb_rotation_series
+    grid: np.ndarray
+        The humerothoracic angles of the mean series, DEFAULT_GRID by default
+    method: str
+        "chordal" or "karcher"
+    weighted: bool
+        If True, each series is weighted by its confidence
+
+    Returns
+    -------
+    pd.DataFrame
+        One line per joint, humeral motion and grid point, see AVERAGE_COLUMNS
+    """
+    grid = DEFAULT_GRID if grid is None else np.asarray(grid, dtype=float)
+    series, values = resample_on_grid(wide_dataframe[wide_dataframe["unit"] == "rad"], grid)
+
+    averages = [pd.DataFrame(columns=AVERAGE_COLUMNS)]
+    for key, group in series.reset_index(drop=True).groupby(CORRIDOR_KEYS, sort=False):
+        group_values = values[group.index.to_numpy()]
+        weights = group["confidence"].to_numpy(dtype=float) if weighted else np.ones(group.shape[0])
+        mean, geodesic_sd = average_rotation_series(
+            group_values, JointType.from_string(key[0]), weights=weights, method=method
+        )
+
+        average = pd.DataFrame({"humerothoracic_angle": grid})
+        average["joint"], average["humeral_motion"] = key
+        average[VALUE_COLUMNS] = mean
+        average["unit"] = "rad"
+        average[LEGEND_COLUMNS] = group[LEGEND_COLUMNS].iloc[0].to_numpy()
+        average["geodesic_sd"] = geodesic_sd
+        average["nb_series"] = (~np.isnan(group_values).any(axis=2)).sum(axis=0)
+        averages.append(average[AVERAGE_COLUMNS])
+
+    return pd.concat(averages, ignore_index=True)
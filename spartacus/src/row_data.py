@@ -3,6 +3,7 @@ import os
 import numpy as np
 import pandas as pd
 
+from .angle_series import WIDE_COLUMNS, to_long_format
 from .biomech_system import BiomechCoordinateSystem
 from .checks import (
     check_segment_filled_with_nan,
@@ -14,18 +15,24 @@ from .checks import (
     check_correction_methods,
 )
 from .corrections.angle_conversion_callbacks import (
+    apply_sign_factors,
+    from_euler_angles_to_rotation_matrices,
     isb_framed_rotation_matrix_from_euler_angles,
+    isb_framed_rotation_matrices_from_euler_angles,
+    rotation_matrices_2_euler_angles,
     set_corrections_on_rotation_matrix,
     rotation_matrix_2_euler_angles,
     to_left_handed_frame,
 )
+from .corrections.correction_planner import plan_rotation_correction, plan_translation_correction
 from .corrections.kolz_matrices import get_kolz_rotation_matrix
+from .dataset_root import DatasetRoot
 from .deviation import Deviation
 from .enums import (
     Segment,
     Frame,
     Correction,
-    DataFolder,
+    CorrectionPlan,
     EulerSequence,
     BiomechDirection,
     BiomechOrigin,
@@ -38,6 +45,7 @@ from .utils import (
     get_correction_column,
     get_is_correctable_column,
     get_is_isb_column,
+    unwrap_batch,
 )
 
 
@@ -46,14 +54,17 @@ class RowData:
     This class is used to store the data of a row of the dataset and make it accessible through attributes and methods.
     """
 
-    def __init__(self, row: pd.Series):
+    def __init__(self, row: pd.Series, dataset_root: DatasetRoot = None):
         """
         Parameters
         ----------
         row : pandas.Series
             The row of the dataset to store.
+        dataset_root : DatasetRoot
+            The root holding the study folder of the row, see DatasetRoot for the default one.
         """
         self.row = row
+        self.dataset_root = DatasetRoot() if dataset_root is None else dataset_root
 
         self.parent_segment = Segment.from_string(self.row.parent)
         self.parent_columns = get_segment_columns(self.parent_segment)
@@ -89,13 +100,25 @@ class RowData:
         self.translation_data_risk = None
 
         self.euler_angles_correction_callback = None
+        self.parent_matrix_correction = None
+        self.child_matrix_correction = None
+        self.sign_factors = None
+        self.rotation_correction_plan = None
         self.translation_correction_callback = None
         self.translation_isb_matrix_callback = None
+        self.translation_biomech_sys = None
+        self.translation_matrix = None
+        self.translation_correction_plan = None
 
         self.csv_filenames = None
         self.data = None
         self.corrected_data = None
         self.melted_corrected_data = None
+        self.corrected_rotation_matrices = None
+
+        self.translation_csv_filenames = None
+        self.translation_data = None
+        self.corrected_translation_data = None
 
     @property
     def left_side(self):
@@ -255,6 +278,13 @@ class RowData:
             segment=self.child_segment,
         )
 
+        # the segment coordinate system in which the translations are expressed, if any
+        if self.joint is not None and isinstance(self.joint.translation_frame, Frame.Local):
+            if self.joint.translation_frame.value == self.parent_segment.value:
+                self.translation_biomech_sys = self.parent_biomech_sys
+            elif self.joint.translation_frame.value == self.child_segment.value:
+                self.translation_biomech_sys = self.child_biomech_sys
+
     def extract_corrections(self, segment: Segment) -> str:
         """
         Extract the correction cell of the correction column.
@@ -594,9 +624,7 @@ class RowData:
         self.usable_rotation_data = (
             self.child_segment_usable_for_rotation_data and self.parent_segment_usable_for_rotation_data
         )
-        self.usable_translation_data = (
-            self.child_segment_usable_for_translation_data and self.parent_segment_usable_for_translation_data
-        )
+        self.usable_translation_data = self._check_translation_data_validity(print_warnings=print_warnings)
 
         # todo: risk level implementation
         # self.rotation_risk = Risk.LOW
@@ -604,6 +632,34 @@ class RowData:
 
         return self.usable_rotation_data, self.usable_translation_data
 
+    def _check_translation_data_validity(self, print_warnings: bool = False) -> bool:
+        """
+        Translations are usable if they are expressed in the coordinate system of the parent or the child segment,
+        joint coordinate systems are non-orthogonal and cannot be reoriented, and if the csv files exist.
+        """
+        if not self.has_translation_data:
+            return False
+
+        if self.translation_biomech_sys is None:
+            if print_warnings:
+                print(
+                    f"WARNING : translations of {self.row.dataset_authors} are expressed in {self.row.displacement_cs},"
+                    f" which is neither the parent nor the child segment coordinate system, they can't be corrected."
+                )
+            return False
+
+        csv_filenames = [filename for filename in self.get_translation_csv_filenames() if filename is not None]
+        if not csv_filenames:
+            return False
+
+        missing_files = [filename for filename in csv_filenames if not os.path.exists(filename)]
+        if missing_files:
+            if print_warnings:
+                print(f"WARNING : translation files of {self.row.dataset_authors} are missing: {missing_files}")
+            return False
+
+        return True
+
     def set_rotation_correction_callback(self):
         """
         The idea is to prepare a function ready to receive 3 Euler Angles (rot1, rot2, rot3) from any Euler Sequence,
@@ -635,7 +691,7 @@ class RowData:
 
         if self.left_side:
             self.mediolateral_matrix = lambda rot1, rot2, rot3: to_left_handed_frame(
-                maxtrix=isb_framed_rotation_matrix_from_euler_angles(
+                matrix=isb_framed_rotation_matrix_from_euler_angles(
                     rot1=rot1,
                     rot2=rot2,
                     rot3=rot3,
@@ -647,21 +703,27 @@ class RowData:
         else:
             self.mediolateral_matrix = self.isb_rotation_matrix_callback
 
-        parent_matrix_correction = (
-            np.eye(3)
-            if self.parent_corrections is None
-            else get_kolz_rotation_matrix(correction=self.parent_corrections[0])
-        )
-        child_matrix_correction = (
-            np.eye(3)
-            if self.child_corrections is None
-            else get_kolz_rotation_matrix(correction=self.child_corrections[0])
+        self.parent_matrix_correction = get_matrix_correction(self.parent_corrections)
+        self.child_matrix_correction = get_matrix_correction(self.child_corrections)
+
+        # when the whole conversion is the identity, a permutation or a sign change of the axes,
+        # the angles don't need the rotation matrix round trip
+        mediolateral_matrix = np.diag([1, 1, -1]) if self.left_side else np.eye(3)
+        self.rotation_correction_plan, self.sign_factors = plan_rotation_correction(
+            child_matrix=self.child_matrix_correction
+            @ mediolateral_matrix
+            @ self.child_biomech_sys.get_rotation_matrix(),
+            parent_matrix=self.parent_matrix_correction
+            @ mediolateral_matrix
+            @ self.parent_biomech_sys.get_rotation_matrix(),
+            previous_sequence_str=self.joint.euler_sequence.value,
+            new_sequence_str=self.joint.isb_euler_sequence().value,
         )
 
         self.correct_isb_rotation_matrix_callback = lambda rot1, rot2, rot3: set_corrections_on_rotation_matrix(
             matrix=self.mediolateral_matrix(rot1, rot2, rot3),
-            child_matrix_correction=child_matrix_correction,
-            parent_matrix_correction=parent_matrix_correction,
+            child_matrix_correction=self.child_matrix_correction,
+            parent_matrix_correction=self.parent_matrix_correction,
         )
 
         self.euler_angles_correction_callback = lambda rot1, rot2, rot3: rotation_matrix_2_euler_angles(
@@ -671,52 +733,43 @@ class RowData:
 
     def set_translation_correction_callback(self):
         """
-        Work in Progress but here is the idea.
-
-        I feel like we want to express the translation in the proximal segment coordinate system in ISB frame
-        on the right side.
+        The translations are expressed in the proximal or distal segment coordinate system, see displacement_cs.
+        The idea is to prepare a matrix which, for a series of translations (N, 3), does:
+        - Reorient into x antero-posterior, y infero-superior, z medio-lateral (right)
+        - Switch to a left-handed coordinate system if the data are on the left side
+        - Apply the correction of the segment if any to make it ISB
 
-        It only fixes the ISB orientation, restoring x as antero-posterior, y as infero-superior, z as medio-lateral.
-        and the side of the coordinate system left to right if needed.
+        More mathematically:
+        - 1st : t = R_segment_isb @ t
+        - 2nd if left side : t = np.diag([1, 1, -1]) @ t
+        - 3rd : t = R_segment_correction @ t
 
         Missing features:
         - transport local to distal SCS ?
-
+        - the origin shift of the corrections is not applied, only their orientation
         """
-
         self.translation_isb_matrix_callback = (
-            lambda trans_x, trans_y, trans_z: self.child_biomech_sys.get_rotation_matrix()
-            @ np.array([[trans_x, trans_y, trans_z]]).T
+            lambda trans_x, trans_y, trans_z: self.translation_biomech_sys.get_rotation_matrix()
+            @ np.array([trans_x, trans_y, trans_z])
         )
 
-        if self.left_side:
-            self.translation_mediolateral_matrix = (
-                lambda trans_x, trans_y, trans_z: self.translation_isb_matrix_callback(trans_x, trans_y, trans_z)
-                * np.array([1, 1, -1])
-            )
-        else:
-            self.translation_mediolateral_matrix = self.translation_isb_matrix_callback
-
-        # parent_matrix_correction = (
-        #     np.eye(3)
-        #     if self.parent_corrections is None
-        #     else get_kolz_rotation_matrix(correction=self.parent_corrections[0])
-        # )
-        # child_matrix_correction = (
-        #     np.eye(3)
-        #     if self.child_corrections is None
-        #     else get_kolz_rotation_matrix(correction=self.child_corrections[0])
-        # )
-        #
-        # self.correct_isb_rotation_matrix_callback = lambda rot1, rot2, rot3: set_corrections_on_rotation_matrix(
-        #     matrix=self.mediolateral_matrix(rot1, rot2, rot3),
-        #     child_matrix_correction=child_matrix_correction,
-        #     parent_matrix_correction=parent_matrix_correction,
-        # )
-        #
-        # self.euler_angles_correction_callback = lambda rot1, rot2, rot3: rotation_matrix_2_euler_angles(
-        #     rotation_matrix=self.correct_isb_rotation_matrix_callback(rot1, rot2, rot3),
-        #     euler_sequence=self.joint.isb_euler_sequence(),
+        translation_corrections = (
+            self.parent_corrections
+            if self.translation_biomech_sys is self.parent_biomech_sys
+            else self.child_corrections
+        )
+        mediolateral_matrix = np.diag([1, 1, -1]) if self.left_side else np.eye(3)
+
+        self.translation_matrix = (
+            get_matrix_correction(translation_corrections)
+            @ mediolateral_matrix
+            @ self.translation_biomech_sys.get_rotation_matrix()
+        )
+        self.translation_correction_plan = plan_translation_correction(self.translation_matrix)
+
+        self.translation_correction_callback = lambda trans_x, trans_y, trans_z: self.translation_matrix @ np.array(
+            [trans_x, trans_y, trans_z]
+        )
 
     def quantify_segment_risk(self, type_risk: str):
         """
@@ -780,7 +833,6 @@ class RowData:
 
     def import_data(self):
         """this function import the data of the following row"""
-        # todo: translation
         print(
             f" Importing data ...\n"
             f" for article {self.row.dataset_authors},"
@@ -790,122 +842,143 @@ class RowData:
         )
         # load the csv file
         self.csv_filenames = self.get_euler_csv_filenames()
-        self.data = load_euler_csv(self.csv_filenames)
-        self.data["article"] = self.row.dataset_authors
-        self.data["joint"] = JointType.from_string(self.row.joint)
-        self.data["humeral_motion"] = self.row.humeral_motion
-
-    def to_angle_series_dataframe(self, correction: bool = True):
-        """
-        This converts the row to a panda dataframe with the angles in degrees with the following columns:
-         - article
-         - joint
-         - angle_translation
-         - degree_of_freedom
-         - movement
-         - humerothoracic_angle (one line per angle)
-         - value
+        if any(filename is not None for filename in self.csv_filenames):
+            self.data = load_euler_csv(self.csv_filenames)
+            self.data["article"] = self.row.dataset_authors
+            self.data["joint"] = JointType.from_string(self.row.joint)
+            self.data["humeral_motion"] = self.row.humeral_motion
+
+        if self.usable_translation_data:
+            self.translation_csv_filenames = self.get_translation_csv_filenames()
+            self.translation_data = load_euler_csv(self.translation_csv_filenames)
+            # some articles provide the translations in meters
+            millimeters_factor = self.dataset_root.millimeters_factor(self.row["folder"])
+            self.translation_data[["value_dof1", "value_dof2", "value_dof3"]] *= millimeters_factor
+
+    def to_wide_angle_series_dataframe(self, correction: bool = True) -> pd.DataFrame:
+        """
+        This converts the row to a panda dataframe with the angles in degrees, in the wide layout,
+        one line per humerothoracic angle with the three degrees of freedom side by side, see WIDE_COLUMNS.
+        The legend of the degrees of freedom is held by each line in the biomechanical_dof columns.
 
         Returns
         -------
         pandas.DataFrame
             The dataframe with the angles in degrees
         """
-
-        angle_series_dataframe = pd.DataFrame(
-            columns=[
-                "article",  # string
-                "joint",  # string
-                "humeral_motion",  # string
-                "humerothoracic_angle",  # float
-                "value_dof1",  # float
-                "value_dof2",  # float
-                "value_dof3",  # float
-                "unit",  # string "angle" or "translation"
-                "confidence",  # float
-                "shoulder_id",  # int
-                "in_vivo",  # bool
-                "xp_mean",  # string
-            ],
-        )
-
         confidence_total = Deviation.confidence_total(row_data=self, type_risk="rotation")
-        # TODO : detect if this is angle or translation
 
-        value_dof = np.zeros((self.data.shape[0], 3))
+        value_dof = self.data[["value_dof1", "value_dof2", "value_dof3"]].to_numpy(dtype=float)
 
+        transform = CorrectionPlan.IDENTITY
         if correction:
-            for i, row in enumerate(self.data.itertuples()):
-                deg_corrected_dof_1, deg_corrected_dof_2, deg_corrected_dof_3 = self.apply_correction_in_radians(
-                    row.value_dof1, row.value_dof2, row.value_dof3
+            transform = self.rotation_correction_plan
+            if transform != CorrectionPlan.IDENTITY:
+                value_dof, self.corrected_rotation_matrices = self.apply_correction_in_radians_batch(
+                    value_dof, return_rotation_matrices=True
                 )
-                value_dof[i, 0] = deg_corrected_dof_1
-                value_dof[i, 1] = deg_corrected_dof_2
-                value_dof[i, 2] = deg_corrected_dof_3
-
-            # unwrap the angles to avoid discontinuities between -180 and 180 for example
-            for i in range(0, 3):
-                value_dof[:, i] = np.unwrap(value_dof[:, i], period=180)
+                # unwrap the angles to avoid discontinuities between -180 and 180 for example,
+                # the half turns it may leave on a single angle are flagged by sample_quality
+                value_dof = unwrap_batch(value_dof, period=180)
+            else:
+                self.corrected_rotation_matrices = from_euler_angles_to_rotation_matrices(
+                    self.joint.isb_euler_sequence().value, np.deg2rad(value_dof)
+                )
+            legend_dof = self.joint.isb_rotation_biomechanical_dof
         else:
-            value_dof[:, 0] = self.data["value_dof1"].values
-            value_dof[:, 1] = self.data["value_dof2"].values
-            value_dof[:, 2] = self.data["value_dof3"].values
-
-        angle_series_dataframe["value_dof1"] = value_dof[:, 0]
-        angle_series_dataframe["value_dof2"] = value_dof[:, 1]
-        angle_series_dataframe["value_dof3"] = value_dof[:, 2]
-        angle_series_dataframe["article"] = self.row.dataset_authors
-        angle_series_dataframe["joint"] = self.row.joint
-        angle_series_dataframe["humeral_motion"] = self.row.humeral_motion
-        angle_series_dataframe["humerothoracic_angle"] = self.data["humerothoracic_angle"]
-        angle_series_dataframe["unit"] = "rad"
-        angle_series_dataframe["confidence"] = confidence_total
-        angle_series_dataframe["shoulder_id"] = self.row.shoulder_id
-        angle_series_dataframe["in_vivo"] = self.row.in_vivo
-        angle_series_dataframe["xp_mean"] = self.row.experimental_mean
+            legend_dof = tuple(self.joint.euler_sequence.value)
+
+        self.corrected_data = self._to_wide_series_dataframe(
+            value_dof,
+            self.data["humerothoracic_angle"],
+            legend_dof,
+            unit="rad",
+            confidence=confidence_total,
+            transform=transform,
+        )
+        return self.corrected_data
 
+    def to_wide_translation_series_dataframe(self, correction: bool = True) -> pd.DataFrame:
+        """
+        This converts the row to a panda dataframe with the translations in millimeters, in the wide layout,
+        one line per humerothoracic angle with the three translations side by side, see WIDE_COLUMNS.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The dataframe with the translations in millimeters
+        """
+        confidence_total = Deviation.confidence_segment(row_data=self, type_risk="displacement")
+
+        value_dof = self.translation_data[["value_dof1", "value_dof2", "value_dof3"]].to_numpy(dtype=float)
+
+        transform = CorrectionPlan.IDENTITY
         if correction:
-            (legend_dof1, legend_dof2, legend_dof3) = self.joint.isb_rotation_biomechanical_dof
+            transform = self.translation_correction_plan
+            if transform != CorrectionPlan.IDENTITY:
+                value_dof = self.apply_translation_correction_batch(value_dof)
+            legend_dof = self.joint.isb_translation_biomechanical_dof
         else:
-            legend_dof1, legend_dof2, legend_dof3 = (
-                self.joint.euler_sequence.value[0],
-                self.joint.euler_sequence.value[1],
-                self.joint.euler_sequence.value[2],
-            )
-
-        legend_df = pd.DataFrame(
-            {
-                "degree_of_freedom": ["value_dof1", "value_dof2", "value_dof3"],
-                "biomechanical_dof": [legend_dof1, legend_dof2, legend_dof3],
-            }
+            legend_dof = ("x", "y", "z")
+
+        self.corrected_translation_data = self._to_wide_series_dataframe(
+            value_dof,
+            self.translation_data["humerothoracic_angle"],
+            legend_dof,
+            unit="mm",
+            confidence=confidence_total,
+            transform=transform,
         )
+        return self.corrected_translation_data
+
+    def _to_wide_series_dataframe(
+        self,
+        value_dof: np.ndarray,
+        humerothoracic_angle: pd.Series,
+        legend_dof: tuple[str, str, str],
+        unit: str,
+        confidence: float,
+        transform: CorrectionPlan,
+    ) -> pd.DataFrame:
+        """Gather the values of the three degrees of freedom and the metadata of the row in the wide layout"""
+        series_dataframe = pd.DataFrame(columns=WIDE_COLUMNS)
+
+        series_dataframe["value_dof1"] = value_dof[:, 0]
+        series_dataframe["value_dof2"] = value_dof[:, 1]
+        series_dataframe["value_dof3"] = value_dof[:, 2]
+        series_dataframe["article"] = self.row.dataset_authors
+        series_dataframe["joint"] = self.row.joint
+        series_dataframe["humeral_motion"] = self.row.humeral_motion
+        series_dataframe["humerothoracic_angle"] = humerothoracic_angle
+        series_dataframe["unit"] = unit
+        series_dataframe["confidence"] = confidence
+        series_dataframe["shoulder_id"] = self.row.shoulder_id
+        series_dataframe["in_vivo"] = self.row.in_vivo
+        series_dataframe["xp_mean"] = self.row.experimental_mean
+        series_dataframe["biomechanical_dof1"] = legend_dof[0]
+        series_dataframe["biomechanical_dof2"] = legend_dof[1]
+        series_dataframe["biomechanical_dof3"] = legend_dof[2]
+        series_dataframe["transform"] = transform.value
+        series_dataframe["row_id"] = self.row.name if self.row.name is not None else 0
+
+        return series_dataframe
+
+    def to_angle_series_dataframe(self, correction: bool = True) -> pd.DataFrame:
+        """
+        This converts the row to a panda dataframe with the angles in degrees, in the long layout,
+        one line per humerothoracic angle and per degree of freedom, see LONG_COLUMNS.
 
-        self.corrected_data = angle_series_dataframe
-        self.melted_data = angle_series_dataframe.melt(
-            id_vars=[
-                "article",
-                "joint",
-                "humeral_motion",
-                "humerothoracic_angle",
-                "unit",
-                "confidence",
-                "shoulder_id",
-                "in_vivo",
-                "xp_mean",
-            ],
-            value_vars=["value_dof1", "value_dof2", "value_dof3"],
-            var_name="degree_of_freedom",
-            value_name="value",
-        )
-        self.melted_data = pd.merge(self.melted_data, legend_df, on="degree_of_freedom")
-        self.melted_data["degree_of_freedom"] = self.melted_data["degree_of_freedom"].replace(
-            {"value_dof1": 1, "value_dof2": 2, "value_dof3": 3}
-        )
+        Returns
+        -------
+        pandas.DataFrame
+            The dataframe with the angles in degrees
+        """
+        self.melted_data = to_long_format(self.to_wide_angle_series_dataframe(correction=correction))
         return self.melted_data
 
     def get_euler_csv_filenames(self) -> tuple[str, str, str]:
         """load the csv filenames from the row data"""
-        folder_path = DataFolder.from_string(self.row["folder"]).value
+        folder_path = self.dataset_root.folder_path(self.row["folder"])
 
         csv_paths = ()
 
@@ -920,7 +993,7 @@ class RowData:
 
     def get_translation_csv_filenames(self) -> tuple[str, str, str]:
         """load the csv filenames from the row data"""
-        folder_path = DataFolder.from_string(self.row["folder"]).value
+        folder_path = self.dataset_root.folder_path(self.row["folder"])
 
         csv_paths = ()
 
@@ -949,3 +1022,130 @@ class RowData:
         deg_corrected_dof_3 = np.rad2deg(corrected_dof_3)
 
         return deg_corrected_dof_1, deg_corrected_dof_2, deg_corrected_dof_3
+
+    def apply_correction_in_radians_batch(
+        self, value_dof: np.ndarray, return_rotation_matrices: bool = False
+    ) -> np.ndarray | tuple[np.ndarray, np.ndarray]:
+        """
+        Apply the correction to a whole series of angles at once, same steps as euler_angles_correction_callback
+        but on stacked rotation matrices, or only with the sign factors when the conversion allows it.
+
+        Parameters
+        ----------
+        value_dof: np.ndarray
+            The euler angles in degrees, shape (N, 3)
+        return_rotation_matrices: bool
+            If True, the corrected rotation matrices are returned too, the ones of the batch when they are computed,
+            otherwise built from the corrected angles
+
+        Returns
+        -------
+        np.ndarray | tuple[np.ndarray, np.ndarray]
+            The corrected euler angles in degrees, shape (N, 3), and the corrected rotation matrices, shape (N, 3, 3)
+        """
+        rotation_matrices = None
+        if self.rotation_correction_plan == CorrectionPlan.IDENTITY:
+            corrected_angles = value_dof.copy()
+        elif self.sign_factors is not None:
+            corrected_angles = np.rad2deg(
+                apply_sign_factors(np.deg2rad(value_dof), self.sign_factors, self.joint.isb_euler_sequence())
+            )
+        else:
+            rotation_matrices = isb_framed_rotation_matrices_from_euler_angles(
+                previous_sequence_str=self.joint.euler_sequence.value,
+                angles=np.deg2rad(value_dof),
+                bsys_parent=self.parent_biomech_sys,
+                bsys_child=self.child_biomech_sys,
+            )
+            if self.left_side:
+                rotation_matrices = to_left_handed_frame(matrix=rotation_matrices)
+
+            rotation_matrices = set_corrections_on_rotation_matrix(
+                matrix=rotation_matrices,
+                child_matrix_correction=self.child_matrix_correction,
+                parent_matrix_correction=self.parent_matrix_correction,
+            )
+            corrected_angles = np.rad2deg(
+                rotation_matrices_2_euler_angles(rotation_matrices, euler_sequence=self.joint.isb_euler_sequence())
+            )
+
+        if not return_rotation_matrices:
+            return corrected_angles
+
+        if rotation_matrices is None:
+            rotation_matrices = from_euler_angles_to_rotation_matrices(
+                self.joint.isb_euler_sequence().value, np.deg2rad(corrected_angles)
+            )
+        return corrected_angles, rotation_matrices
+
+    def apply_perturbed_correction_in_radians_batch(
+        self,
+        value_dof: np.ndarray,
+        parent_matrix_corrections: np.ndarray,
+        child_matrix_corrections: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Apply the rotation matrix correction to a whole series of angles for K draws of the correction matrices
+        at once, same steps as apply_correction_in_radians_batch on stacks of shape (K, N, 3, 3).
+
+        Parameters
+        ----------
+        value_dof: np.ndarray
+            The euler angles in degrees, shape (N, 3)
+        parent_matrix_corrections: np.ndarray
+            The draws of the correction matrix of the parent segment, shape (K, 3, 3)
+        child_matrix_corrections: np.ndarray
+            The draws of the correction matrix of the child segment, shape (K, 3, 3)
+
+        Returns
+        -------
+        np.ndarray
+            The corrected euler angles in radians in the ISB sequence, shape (K, N, 3)
+        """
+        rotation_matrices = isb_framed_rotation_matrices_from_euler_angles(
+            previous_sequence_str=self.joint.euler_sequence.value,
+            angles=np.deg2rad(value_dof),
+            bsys_parent=self.parent_biomech_sys,
+            bsys_child=self.child_biomech_sys,
+        )
+        if self.left_side:
+            rotation_matrices = to_left_handed_frame(matrix=rotation_matrices)
+
+        rotation_matrices = (
+            child_matrix_corrections[:, np.newaxis]
+            @ rotation_matrices[np.newaxis]
+            @ np.swapaxes(parent_matrix_corrections, 1, 2)[:, np.newaxis]
+        )
+        nb_draws, nb_samples = rotation_matrices.shape[:2]
+        corrected_angles = rotation_matrices_2_euler_angles(
+            rotation_matrices.reshape(-1, 3, 3), euler_sequence=self.joint.isb_euler_sequence()
+        )
+        return corrected_angles.reshape(nb_draws, nb_samples, 3)
+
+    def apply_translation_correction_batch(self, value_dof: np.ndarray) -> np.ndarray:
+        """
+        Apply the correction to a whole series of translations at once, i.e. t @ translation_matrix.T for each line.
+        A missing translation, i.e. nan, only spreads to the corrected translations it contributes to.
+
+        Parameters
+        ----------
+        value_dof: np.ndarray
+            The translations in millimeters, shape (N, 3)
+
+        Returns
+        -------
+        np.ndarray
+            The corrected translations in millimeters, shape (N, 3)
+        """
+        is_missing = np.isnan(value_dof)
+        corrected_value_dof = np.where(is_missing, 0, value_dof) @ self.translation_matrix.T
+
+        contributions = np.abs(self.translation_matrix.T) > 1e-12
+        corrected_value_dof[(is_missing.astype(int) @ contributions.astype(int)) > 0] = np.nan
+
+        return corrected_value_dof
+
+
+def get_matrix_correction(corrections: list[Correction] | None) -> np.ndarray:
+    """Returns the rotation matrix of the first correction of a segment, identity if there is none"""
+    return np.eye(3) if corrections is None else get_kolz_rotation_matrix(correction=corrections[0])
@@ -0,0 +1,94 @@
+"""
+This module computes the scapulohumeral rhythm, i.e. how the humeral elevation splits between the glenohumeral
+elevation and the scapulothoracic upward rotation, for all the paired series of the dataset at once.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .enums import JointType
+from .kinematic_chain import JOINT_NAMES, SERIES_KEYS, pair_series
+from .utils import gradient_batch
+
+RHYTHM_COLUMNS = [
+    "article",  # string
+    "humeral_motion",  # string
+    "shoulder_id",  # int
+    "humerothoracic_angle",  # float
+    "glenohumeral_elevation",  # float, second dof of the glenohumeral joint
+    "scapulothoracic_upward_rotation",  # float, lateral rotation of the scapula, i.e. minus its second dof
+    "rhythm",  # float, glenohumeral_elevation / scapulothoracic_upward_rotation
+    "glenohumeral_contribution",  # float, d(glenohumeral_elevation) / d(humerothoracic_angle)
+    "scapulothoracic_contribution",  # float, d(scapulothoracic_upward_rotation) / d(humerothoracic_angle)
+    "instantaneous_rhythm",  # float, glenohumeral_contribution / scapulothoracic_contribution
+    "confidence",  # float, product of the confidence of both series
+    "scapulothoracic_row_id",  # int
+    "glenohumeral_row_id",  # int
+]
+
+
+def scapulohumeral_rhythm(wide_dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Join the scapulothoracic and glenohumeral series of the same article, humeral motion and shoulder on the
+    humerothoracic angles they share, and compute the rhythm and the contributions of both joints to the
+    humeral elevation. The series are joined on their index and all the pairs are differentiated in one pass.
+
+    Parameters
+    ----------
+    wide_dataframe: pd.DataFrame
+        The corrected angle series in the wide layout, see WIDE_COLUMNS
+
+    Returns
+    -------
+    pd.DataFrame
+        One line per pair of series and per shared humerothoracic angle, see RHYTHM_COLUMNS
+    """
+    pairs = pair_series(wide_dataframe, JointType.THORACO_HUMERAL)
+    if len(pairs) == 0:
+        return pd.DataFrame(columns=RHYTHM_COLUMNS)
+
+    scapulothoracic_row_ids, glenohumeral_row_ids = (list(row_ids) for row_ids in zip(*pairs))
+    index = SERIES_KEYS + ["humerothoracic_angle"]
+
+    scapulothoracic = wide_dataframe[wide_dataframe["row_id"].isin(scapulothoracic_row_ids)]
+    scapulothoracic = scapulothoracic[scapulothoracic["joint"] == JOINT_NAMES[JointType.SCAPULO_THORACIC]]
+    scapulothoracic = scapulothoracic.set_index(index)[["value_dof2", "confidence", "row_id"]].rename(
+        columns={
+            "value_dof2": "scapulothoracic_upward_rotation",
+            "confidence": "scapulothoracic_confidence",
+            "row_id": "scapulothoracic_row_id",
+        }
+    )
+    # the upward rotation of the scapula is a lateral rotation, i.e. negative about ISB axis
+    scapulothoracic["scapulothoracic_upward_rotation"] *= -1
+
+    glenohumeral = wide_dataframe[wide_dataframe["row_id"].isin(glenohumeral_row_ids)]
+    glenohumeral = glenohumeral[glenohumeral["joint"] == JOINT_NAMES[JointType.GLENO_HUMERAL]]
+    glenohumeral = glenohumeral.set_index(index)[["value_dof2", "confidence", "row_id"]].rename(
+        columns={
+            "value_dof2": "glenohumeral_elevation",
+            "confidence": "glenohumeral_confidence",
+            "row_id": "glenohumeral_row_id",
+        }
+    )
+
+    rhythm = scapulothoracic.join(glenohumeral, how="inner").reset_index()
+    rhythm = rhythm[rhythm["humerothoracic_angle"].notna()]
+    rhythm = rhythm.drop_duplicates(["scapulothoracic_row_id", "humerothoracic_angle"])
+    rhythm = rhythm.sort_values(["scapulothoracic_row_id", "humerothoracic_angle"], ignore_index=True)
+
+    humerothoracic_angle = rhythm["humerothoracic_angle"].to_numpy(dtype=float)
+    values = rhythm[["glenohumeral_elevation", "scapulothoracic_upward_rotation"]].to_numpy(dtype=float)
+    row_id = rhythm["scapulothoracic_row_id"].to_numpy()
+    series_starts = np.flatnonzero(np.concatenate(([True], row_id[1:] != row_id[:-1])))
+
+    contributions = gradient_batch(values, humerothoracic_angle, series_starts=series_starts)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rhythm["rhythm"] = values[:, 0] / values[:, 1]
+        rhythm["instantaneous_rhythm"] = contributions[:, 0] / contributions[:, 1]
+    rhythm["glenohumeral_contribution"] = contributions[:, 0]
+    rhythm["scapulothoracic_contribution"] = contributions[:, 1]
+    rhythm["confidence"] = rhythm["scapulothoracic_confidence"] * rhythm["glenohumeral_confidence"]
+
+    return rhythm[RHYTHM_COLUMNS]
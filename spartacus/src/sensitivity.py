@@ -0,0 +1,208 @@
+"""
+This module sweeps the confidence coefficients, e.g. the 0.9 and 0.5 of DEFAULT_RISK_COEFFICIENTS, and measures how
+the confidence-weighted corridor means shift. The risks of each row are gathered once in an indicator matrix, the
+confidence of every row for every coefficient vector of the sweep is then a single matrix product in log space,
+and the weighted means of all the vectors are two more matrix products on the series resampled once.
+"""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from .angle_series import LEGEND_COLUMNS
+from .biomech_system import DEFAULT_RISK_COEFFICIENTS, RISK_KINDS, RISK_TYPES, SEGMENT_TYPES
+from .confidence import NON_ISB_SEQUENCE_COEFFICIENT
+from .corridor import CORRIDOR_KEYS, DEFAULT_GRID, resample_on_grid
+
+# one name per coefficient, in the order of the coefficient vectors, e.g. "proximal_rotation_label"
+COEFFICIENT_NAMES = [
+    f"{type_segment}_{type_risk}_{kind}"
+    for type_segment, type_risk, kind in itertools.product(SEGMENT_TYPES, RISK_TYPES, RISK_KINDS)
+] + ["non_isb_sequence"]
+
+DEFAULT_COEFFICIENT_VECTOR = np.append(DEFAULT_RISK_COEFFICIENTS.ravel(), NON_ISB_SEQUENCE_COEFFICIENT)
+
+SWEEP_COLUMNS = [
+    "joint",  # string
+    "humeral_motion",  # string
+    "degree_of_freedom",  # int
+    "biomechanical_dof",  # string
+    "humerothoracic_angle",  # float, the grid
+    "unit",  # string "rad" or "mm"
+    "mean",  # float, the weighted mean with the default coefficients
+    "sweep_min",  # float, the smallest weighted mean of the sweep
+    "sweep_max",  # float, the largest weighted mean of the sweep
+    "sweep_sd",  # float, the standard deviation of the weighted means of the sweep
+    "max_shift",  # float, the largest distance between a weighted mean of the sweep and the default one
+    "nb_series",  # int
+]
+
+
+def coefficient_grid(levels: dict[str, tuple[float, ...]]) -> np.ndarray:
+    """
+    Every combination of the levels of some coefficients, the other ones keeping their default value.
+
+    Parameters
+    ----------
+    levels: dict[str, tuple[float, ...]]
+        The values taken by each swept coefficient, see COEFFICIENT_NAMES, e.g. {"proximal_rotation_label": (0.5, 0.9)}
+
+    Returns
+    -------
+    np.ndarray
+        The coefficient vectors, shape (K, len(COEFFICIENT_NAMES))
+    """
+    unknown = [name for name in levels if name not in COEFFICIENT_NAMES]
+    if unknown:
+        raise ValueError(f"{unknown} are not coefficients, they must be among {COEFFICIENT_NAMES}.")
+
+    columns = [COEFFICIENT_NAMES.index(name) for name in levels]
+    combinations = np.array(list(itertools.product(*levels.values())), dtype=float).reshape(-1, len(columns))
+
+    grid = np.tile(DEFAULT_COEFFICIENT_VECTOR, (combinations.shape[0], 1))
+    grid[:, columns] = combinations
+    return grid
+
+
+def risk_indicators(flags: pd.DataFrame, type_risk: str = "rotation") -> np.ndarray:
+    """
+    The risks each row is subject to, as a matrix whose columns follow COEFFICIENT_NAMES, so that the confidence
+    of the rows is the product of the coefficients their indicators select.
+
+    Parameters
+    ----------
+    flags: pd.DataFrame
+        The risk flags of the rows, see risk_flags
+    type_risk: str
+        "rotation" or "displacement"
+
+    Returns
+    -------
+    np.ndarray
+        The indicators, 0 or 1, shape (N, len(COEFFICIENT_NAMES))
+    """
+    indicators = np.zeros((flags.shape[0], len(COEFFICIENT_NAMES)))
+    flag_suffixes = {"label": "mislabeled", "sens": "wrong_sens", "origin": "not_isb_origin"}
+    for type_segment in SEGMENT_TYPES:
+        for kind in RISK_KINDS:
+            column = COEFFICIENT_NAMES.index(f"{type_segment}_{type_risk}_{kind}")
+            indicators[:, column] = flags[f"{type_segment}_{flag_suffixes[kind]}"].to_numpy(dtype=bool)
+    if type_risk == "rotation":
+        indicators[:, -1] = ~flags["is_euler_sequence_isb"].to_numpy(dtype=bool)
+
+    return indicators
+
+
+def sweep_confidence(indicators: np.ndarray, coefficients: np.ndarray) -> np.ndarray:
+    """
+    The confidence of every row for every coefficient vector, as exp(indicators @ log(coefficients).T).
+
+    Parameters
+    ----------
+    indicators: np.ndarray
+        The risk indicators of the rows, shape (N, P), see risk_indicators
+    coefficients: np.ndarray
+        The coefficient vectors, between 0 excluded and 1, shape (K, P), see coefficient_grid
+
+    Returns
+    -------
+    np.ndarray
+        The confidences, shape (N, K)
+    """
+    coefficients = np.atleast_2d(np.asarray(coefficients, dtype=float))
+    if coefficients.shape[1] != indicators.shape[1]:
+        raise ValueError(f"{indicators.shape[1]} coefficients per vector are expected, got {coefficients.shape[1]}.")
+    if np.any(coefficients <= 0):
+        raise ValueError("The coefficients must be strictly positive.")
+
+    return np.exp(indicators @ np.log(coefficients).T)
+
+
+def weighted_means(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    The weighted means of stacked series for many weight vectors at once, ignoring the NaN values.
+
+    Parameters
+    ----------
+    values: np.ndarray
+        The series, shape (S, G, 3)
+    weights: np.ndarray
+        The weights of the series, one column per weight vector, shape (S, K)
+
+    Returns
+    -------
+    np.ndarray
+        The weighted means, shape (K, G, 3)
+    """
+    is_valid = ~np.isnan(values.reshape(values.shape[0], -1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        means = (weights.T @ np.where(is_valid, values.reshape(values.shape[0], -1), 0.0)) / (weights.T @ is_valid)
+    return means.reshape((weights.shape[1],) + values.shape[1:])
+
+
+def sensitivity_sweep(
+    wide_dataframe: pd.DataFrame,
+    flags: pd.DataFrame,
+    coefficients: np.ndarray,
+    grid: np.ndarray = None,
+) -> pd.DataFrame:
+    """
+    The spread of the confidence-weighted corridor means of every joint and humeral motion over a sweep of
+    coefficient vectors. The series are resampled once and the weights of all the vectors come from one product.
+
+    Parameters
+    ----------
+    wide_dataframe: pd.DataFrame
+        The series in the wide layout, see WIDE_COLUMNS, either angles or translations
+    flags: pd.DataFrame
+        The risk flags of the rows, indexed by row_id, see risk_flags
+    coefficients: np.ndarray
+        The coefficient vectors, shape (K, len(COEFFICIENT_NAMES)), see coefficient_grid
+    grid: np.ndarray
+        The humerothoracic angles of the corridors, DEFAULT_GRID by default
+
+    Returns
+    -------
+    pd.DataFrame
+        One line per joint, humeral motion, degree of freedom and grid point, see SWEEP_COLUMNS
+    """
+    grid = DEFAULT_GRID if grid is None else np.asarray(grid, dtype=float)
+    series, values = resample_on_grid(wide_dataframe, grid)
+
+    sweeps = [pd.DataFrame(columns=SWEEP_COLUMNS)]
+    if series.shape[0] == 0:
+        return pd.concat(sweeps, ignore_index=True)
+
+    type_risk = "displacement" if (series["unit"] == "mm").all() else "rotation"
+    series_flags = flags.loc[series["row_id"].to_numpy()]
+    indicators = risk_indicators(series_flags, type_risk)
+    all_coefficients = np.vstack((DEFAULT_COEFFICIENT_VECTOR, np.atleast_2d(coefficients)))
+    weights = sweep_confidence(indicators, all_coefficients)
+
+    for key, group in series.reset_index(drop=True).groupby(CORRIDOR_KEYS, sort=False):
+        group_values = values[group.index.to_numpy()]
+        means = weighted_means(group_values, weights[group.index.to_numpy()])
+        default_mean, swept_means = means[0], means[1:]
+
+        # the weights are positive, so the grid points without any series are NaN for all the vectors alike
+        statistics = {
+            "mean": default_mean,
+            "sweep_min": swept_means.min(axis=0),
+            "sweep_max": swept_means.max(axis=0),
+            "sweep_sd": swept_means.std(axis=0),
+            "max_shift": np.abs(swept_means - default_mean).max(axis=0),
+        }
+
+        for dof in range(3):
+            sweep = pd.DataFrame({"humerothoracic_angle": grid})
+            sweep["joint"], sweep["humeral_motion"] = key
+            sweep["degree_of_freedom"] = dof + 1
+            sweep["biomechanical_dof"] = group[LEGEND_COLUMNS[dof]].iloc[0]
+            sweep["unit"] = group["unit"].iloc[0]
+            for name, statistic in statistics.items():
+                sweep[name] = statistic[:, dof]
+            sweep["nb_series"] = (~np.isnan(group_values[:, :, dof])).sum(axis=0)
+            sweeps.append(sweep[SWEEP_COLUMNS])
+
+    return pd.concat(sweeps, ignore_index=True)
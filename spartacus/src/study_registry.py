@@ -0,0 +1,252 @@
+"""
+This module indexes the study folders of a dataset root, so that a new study is onboarded by dropping its folder,
+with a manifest, under the data folder of the root, without editing DataFolder.
+
+Each study folder may hold a manifest.json describing the study, see MANIFEST_KEYS and write_manifest. The folders
+without a manifest, e.g. the ones bundled with the package, are described by DataFolder and the dataset table.
+The index is built once per root, kept in the cache folder of the root and rebuilt only when the modification time
+of the data folder, of a study folder, of a manifest or of the dataset table changes.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from .enums import FOLDER_NAME_TO_DATA_FOLDER
+
+MANIFEST_FILENAME = "manifest.json"
+REGISTRY_CACHE_FILENAME = "study_registry.json"
+REGISTRY_CACHE_VERSION = 2  # the indexes written by another version are rebuilt
+
+MANIFEST_KEYS = [
+    "author",  # string, the dataset author, as in the dataset_authors column, e.g. "Begon et al."
+    "year",  # int
+    "doi",  # string
+    "millimeters_factor",  # float, required, the factor to get the translations of the csv files in millimeters
+    "files",  # dict[str, str], the sha256 checksum of each csv file of the folder
+]
+
+STUDY_KEYS = ["folder", "has_manifest"] + MANIFEST_KEYS
+
+
+def file_checksum(file_path: str | Path) -> str:
+    """The sha256 checksum of a file"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for block in iter(lambda: file.read(1024**2), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def write_manifest(
+    study_folder: str | Path,
+    author: str,
+    year: int = None,
+    doi: str = None,
+    millimeters_factor: float = 1.0,
+) -> Path:
+    """
+    Write the manifest of a study folder, with the checksums of all its csv files.
+
+    Parameters
+    ----------
+    study_folder: str | Path
+        The study folder
+    author: str
+        The dataset author, as in the dataset_authors column of the dataset table
+    year: int
+        The year of the study
+    doi: str
+        The doi of the study
+    millimeters_factor: float
+        The factor to apply on the translations of the csv files to get millimeters, e.g. 1000 for meters
+
+    Returns
+    -------
+    Path
+        The manifest file
+    """
+    study_folder = Path(study_folder)
+    manifest = {
+        "author": author,
+        "year": year,
+        "doi": doi,
+        "millimeters_factor": millimeters_factor,
+        "files": {file.name: file_checksum(file) for file in sorted(study_folder.glob("*.csv"))},
+    }
+    manifest_path = study_folder / MANIFEST_FILENAME
+    manifest_path.write_text(json.dumps(manifest, indent=1))
+    return manifest_path
+
+
+def check_millimeters_factor(folder: str, millimeters_factor: float | None) -> float:
+    """The millimeters factor of a study folder, a ValueError if it is unknown or not positive"""
+    if millimeters_factor is None:
+        raise ValueError(
+            f"The millimeters factor of {folder} is unknown, the translations could be in meters. "
+            f"Give it in the manifest of the folder, see write_manifest."
+        )
+    if not millimeters_factor > 0:
+        raise ValueError(f"The millimeters factor of {folder} must be positive, got {millimeters_factor}.")
+    return float(millimeters_factor)
+
+
+def read_manifest_millimeters_factor(study_folder: str | Path) -> float:
+    """The millimeters factor given by the manifest of a study folder, see check_millimeters_factor"""
+    manifest_path = Path(study_folder) / MANIFEST_FILENAME
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.is_file() else {}
+    return check_millimeters_factor(str(study_folder), manifest.get("millimeters_factor"))
+
+
+class StudyRegistry:
+    """
+    The index of the study folders of a dataset root, by folder name and by dataset author.
+    """
+
+    def __init__(self, dataset_root):
+        """
+        Parameters
+        ----------
+        dataset_root: DatasetRoot
+            The root whose data folder is indexed
+        """
+        self.dataset_root = dataset_root
+        self.signature = self._signature()
+        self.studies = self._load_cache()
+        if self.studies is None:
+            self.studies = self._scan()
+            self._save_cache()
+        self.folders_by_author = {study["author"]: folder for folder, study in self.studies.items() if study["author"]}
+
+    def _signature(self) -> dict[str, int]:
+        """The modification times, in ns, of the files and folders the index depends on"""
+        data_folder, clean_csv = self.dataset_root.data_folder, self.dataset_root.clean_csv
+        signature = {
+            "data": data_folder.stat().st_mtime_ns if data_folder.is_dir() else 0,
+            "dataset": clean_csv.stat().st_mtime_ns if clean_csv.is_file() else 0,
+        }
+        for folder, path in self.dataset_root.discover_studies().items():
+            signature[folder] = path.stat().st_mtime_ns
+            manifest_path = path / MANIFEST_FILENAME
+            if manifest_path.is_file():
+                signature[f"{folder}/{MANIFEST_FILENAME}"] = manifest_path.stat().st_mtime_ns
+        return signature
+
+    def _cache_path(self) -> Path:
+        return self.dataset_root.cache_folder / REGISTRY_CACHE_FILENAME
+
+    def _load_cache(self) -> dict[str, dict] | None:
+        """The cached index, None if there is none or if it is outdated"""
+        try:
+            cache = json.loads(self._cache_path().read_text())
+        except (OSError, ValueError):
+            return None
+        # an index written with other keys, e.g. by another version of the library, is outdated too
+        if (
+            cache.get("signature") != self.signature
+            or cache.get("keys") != STUDY_KEYS
+            or cache.get("version") != REGISTRY_CACHE_VERSION
+        ):
+            return None
+        return cache["studies"]
+
+    def _save_cache(self):
+        """Keep the index in the cache folder of the root, if the root can be written"""
+        try:
+            self._cache_path().write_text(
+                json.dumps(
+                    {
+                        "signature": self.signature,
+                        "keys": STUDY_KEYS,
+                        "version": REGISTRY_CACHE_VERSION,
+                        "studies": self.studies,
+                    }
+                )
+            )
+        except OSError:
+            pass
+
+    def _dataset_descriptions(self) -> dict[str, dict]:
+        """The author, year and doi of each folder, from the first row of the dataset table using it"""
+        if not self.dataset_root.clean_csv.is_file():
+            return {}
+        table = pd.read_csv(
+            self.dataset_root.clean_csv, usecols=["folder", "dataset_authors", "dataset_year", "dataset_doi"]
+        )
+        table = table.dropna(subset=["folder"]).drop_duplicates("folder")
+        return {
+            row.folder: {
+                "author": row.dataset_authors,
+                "year": None if pd.isna(row.dataset_year) else int(row.dataset_year),
+                "doi": None if pd.isna(row.dataset_doi) else row.dataset_doi,
+            }
+            for row in table.itertuples()
+        }
+
+    def _scan(self) -> dict[str, dict]:
+        """Index the study folders, from their manifest if any, see STUDY_KEYS"""
+        descriptions = self._dataset_descriptions()
+        studies = {}
+        for folder, path in self.dataset_root.discover_studies().items():
+            manifest_path = path / MANIFEST_FILENAME
+            if manifest_path.is_file():
+                manifest = json.loads(manifest_path.read_text())
+                # a missing millimeters factor is kept as None, see check_millimeters_factor
+                study = {key: manifest.get(key) for key in MANIFEST_KEYS}
+                study["files"] = study["files"] or {}
+            else:
+                data_folder = FOLDER_NAME_TO_DATA_FOLDER.get(folder)
+                study = {"author": None, "year": None, "doi": None, "files": {}}
+                study.update(descriptions.get(folder, {}))
+                if data_folder is not None:
+                    study["author"] = data_folder.to_dataset_author()
+                study["millimeters_factor"] = (
+                    None if data_folder is None else data_folder.translation_to_millimeters_factor()
+                )
+
+            study.update(folder=folder, has_manifest=manifest_path.is_file())
+            studies[folder] = {key: study[key] for key in STUDY_KEYS}
+        return studies
+
+    def study(self, folder: str) -> dict:
+        """The description of a study folder, see STUDY_KEYS"""
+        study = self.studies.get(folder)
+        if study is None:
+            raise ValueError(f"Unknown data folder: {folder} in {self.dataset_root.data_folder}")
+        return study
+
+    def folder_path(self, folder: str) -> Path:
+        """The path of a study folder, the index holds no path so that the root can be moved"""
+        return self.dataset_root.data_folder / self.study(folder)["folder"]
+
+    def millimeters_factor(self, folder: str) -> float:
+        """
+        The factor to apply on the translations of the csv files of a study folder to get millimeters, a ValueError if
+        neither its manifest nor DataFolder gives it
+        """
+        return check_millimeters_factor(folder, self.study(folder)["millimeters_factor"])
+
+    def folder_from_author(self, author: str) -> str:
+        """The study folder of a dataset author, e.g. "Begon et al." -> "#1_Begon_et_al" """
+        folder = self.folders_by_author.get(author)
+        if folder is None:
+            raise ValueError(f"Unknown dataset author: {author} in {self.dataset_root.data_folder}")
+        return folder
+
+    def verify(self, folder: str) -> list[str]:
+        """
+        The csv files of a study folder that do not match the checksums of its manifest, or that are missing.
+
+        Returns
+        -------
+        list[str]
+            The names of the files, empty if all of them match or if the folder has no manifest
+        """
+        study_path = self.folder_path(folder)
+        return [
+            name
+            for name, checksum in self.study(folder)["files"].items()
+            if not (study_path / name).is_file() or file_checksum(study_path / name) != checksum
+        ]
@@ -0,0 +1,200 @@
+"""
+This module generates synthetic datasets, with the schema of dataset_clean.csv and the layout of the data folders,
+to run the analyses on corpora many times larger than the bundled one, e.g. for scaling and load tests.
+
+Each synthetic row copies the setup of a template row of the dataset, i.e. its joint, segments, euler sequence and
+corrections, so that the mix of sequences and coordinate systems follows the templates, and its series are the ones
+of the template resampled and perturbed. The dataset is written as a dataset root, see DatasetRoot, and can be
+loaded with load(dataset_root=...).
+"""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .dataset_root import DatasetRoot
+from .enums import DatasetCSV, DataFolder
+from .load import Spartacus
+from .load_data import load_euler_csv
+from .study_registry import write_manifest
+
+EULER_FIELDS = ["dof_1st_euler", "dof_2nd_euler", "dof_3rd_euler"]
+TRANSLATION_FIELDS = ["dof_translation_x", "dof_translation_y", "dof_translation_z"]
+
+
+def synthetic_author(study: int) -> str:
+    """The dataset author of a synthetic study, e.g. "Synthetic 12 et al." """
+    return f"Synthetic {study} et al."
+
+
+def template_rows(dataframe: pd.DataFrame = None) -> pd.DataFrame:
+    """
+    The rows of the dataset that can serve as templates, the ones ready for analysis whose csv files are all in
+    the package.
+
+    Parameters
+    ----------
+    dataframe: pd.DataFrame
+        The dataset table, dataset_clean.csv by default
+    """
+    spartacus = Spartacus(pd.read_csv(DatasetCSV.CLEAN.value) if dataframe is None else dataframe)
+    spartacus.remove_rows_not_ready_for_analysis()
+    dataframe = spartacus.dataframe
+
+    has_files = []
+    for _, row in dataframe.iterrows():
+        try:
+            folder_path = DataFolder.folder_path(row["folder"])
+        except (ValueError, TypeError):
+            has_files.append(False)
+            continue
+        filenames = [row[field] for field in EULER_FIELDS + TRANSLATION_FIELDS if row[field] is not None]
+        has_files.append(len(filenames) > 0 and all(os.path.isfile(folder_path / name) for name in filenames))
+
+    return dataframe[np.array(has_files, dtype=bool)]
+
+
+def template_weights(templates: pd.DataFrame, mix: dict[str, dict[str, float]] = None) -> np.ndarray:
+    """
+    The probability of drawing each template, the product of the relative weights of its values in the mixed columns.
+
+    Parameters
+    ----------
+    templates: pd.DataFrame
+        The template rows
+    mix: dict[str, dict[str, float]]
+        The relative weights of the values of some columns, e.g. {"euler_sequence": {"yxy": 3, "xzy": 1}},
+        the values not listed are never drawn, all the templates are equally likely by default
+
+    Returns
+    -------
+    np.ndarray
+        The probabilities, shape (len(templates),)
+    """
+    weights = np.ones(templates.shape[0])
+    for column, values in (mix or {}).items():
+        if column not in templates.columns:
+            raise ValueError(f"{column} is not a column of the dataset.")
+        weights *= templates[column].map(values).fillna(0).to_numpy(dtype=float)
+
+    if weights.sum() <= 0:
+        raise ValueError(f"No template row matches the mix {mix}.")
+    return weights / weights.sum()
+
+
+def _resample_series(series: pd.DataFrame, nb_samples: int, rng: np.random.Generator, noise_sd: float) -> tuple:
+    """The humerothoracic angles and the values of a template series resampled, shifted and perturbed"""
+    humerothoracic_angle = series["humerothoracic_angle"].to_numpy(dtype=float)
+    order = np.argsort(humerothoracic_angle)
+    grid = np.linspace(humerothoracic_angle.min(), humerothoracic_angle.max(), nb_samples)
+
+    values = {}
+    for dof in range(3):
+        value = series[f"value_dof{dof + 1}"].to_numpy(dtype=float)
+        if np.isnan(value).all():
+            continue
+        resampled = np.interp(grid, humerothoracic_angle[order], value[order])
+        # one offset per series and a small noise per sample
+        values[dof] = resampled + rng.normal(0, noise_sd) + rng.normal(0, noise_sd / 10, size=nb_samples)
+
+    return grid, values
+
+
+def generate_synthetic_dataset(
+    output_folder: str | Path,
+    nb_studies: int = 10,
+    rows_per_study: int = 50,
+    nb_samples: int = 100,
+    mix: dict[str, dict[str, float]] = None,
+    noise_sd: float = 2.0,
+    templates: pd.DataFrame = None,
+    seed: int = 0,
+) -> Path:
+    """
+    Write a synthetic dataset as a dataset root, its table and one folder of csv files per study, e.g. in a temporary
+    directory.
+
+    Parameters
+    ----------
+    output_folder: str | Path
+        The root to write the dataset in, created if needed
+    nb_studies: int
+        The number of synthetic studies
+    rows_per_study: int
+        The number of rows of each study
+    nb_samples: int
+        The number of samples of each series
+    mix: dict[str, dict[str, float]]
+        The relative weights of the values of some columns of the templates, e.g. of "euler_sequence", "parent"
+        or "thorax_is_isb", see template_weights
+    noise_sd: float
+        The standard deviation of the offset of each series, in the units of the series, i.e. degrees or millimeters
+    templates: pd.DataFrame
+        The template rows, the rows of dataset_clean.csv with all their csv files by default
+    seed: int
+        The seed of the random generator
+
+    Returns
+    -------
+    Path
+        The dataset table, the dataset root being loaded with load(dataset_root=output_folder)
+    """
+    dataset_root = Path(output_folder).absolute()
+    dataset_root.mkdir(parents=True, exist_ok=True)
+    templates = template_rows() if templates is None else templates.where(pd.notna(templates), None)
+    probabilities = template_weights(templates, mix)
+    rng = np.random.default_rng(seed)
+
+    series_cache = {}
+
+    def template_series(template_index, fields: list[str]) -> pd.DataFrame:
+        """The series of a template, read once"""
+        key = (template_index, fields[0])
+        if key not in series_cache:
+            template = templates.loc[template_index]
+            folder_path = DataFolder.folder_path(template["folder"])
+            filenames = tuple(
+                os.path.join(folder_path, template[field]) if template[field] is not None else None for field in fields
+            )
+            series = load_euler_csv(filenames)
+            if fields == TRANSLATION_FIELDS:
+                factor = DataFolder.translation_to_millimeters_factor_from_string(template["folder"])
+                series[["value_dof1", "value_dof2", "value_dof3"]] *= factor
+            series_cache[key] = series
+        return series_cache[key]
+
+    rows = []
+    for study in range(1, nb_studies + 1):
+        study_folder = dataset_root / "data" / f"#S{study}_Synthetic_et_al"
+        study_folder.mkdir(parents=True, exist_ok=True)
+
+        drawn = rng.choice(templates.shape[0], size=rows_per_study, p=probabilities)
+        for row_index, template_index in enumerate(templates.index[drawn]):
+            row = templates.loc[template_index].copy()
+            row["dataset_id"] = f"#S{study}"
+            row["dataset_authors"] = synthetic_author(study)
+            row["folder"] = study_folder.name
+            row["dof_translation_norm"] = None
+
+            for fields in (EULER_FIELDS, TRANSLATION_FIELDS):
+                if all(row[field] is None for field in fields):
+                    continue
+                grid, values = _resample_series(template_series(template_index, fields), nb_samples, rng, noise_sd)
+                for dof, field in enumerate(fields):
+                    if row[field] is None or dof not in values:
+                        row[field] = None
+                        continue
+                    filename = f"row_{row_index}_{field}.csv"
+                    np.savetxt(study_folder / filename, np.column_stack((grid, values[dof])), delimiter=",")
+                    row[field] = filename
+
+            rows.append(row)
+
+        write_manifest(study_folder, author=synthetic_author(study))
+
+    dataset_csv = DatasetRoot(dataset_root).clean_csv
+    dataset_csv.parent.mkdir(exist_ok=True)
+    pd.DataFrame(rows, columns=templates.columns).to_csv(dataset_csv, index=False)
+    return dataset_csv
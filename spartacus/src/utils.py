@@ -68,6 +68,171 @@ def flip_rotations(angles: np.ndarray, seq: str) -> np.ndarray:
     return angles
 
 
+def wrap_angles(angles: np.ndarray) -> np.ndarray:
+    """Wrap angles in radians into [-pi, pi["""
+    return np.mod(angles + np.pi, 2 * np.pi) - np.pi
+
+
+def flip_rotations_batch(angles: np.ndarray, seq: str) -> np.ndarray:
+    """
+    Batch version of flip_rotations, it returns the alternate branch of each sample of a series of euler angles,
+    i.e. the angles with the second angle inverted that lead to the same rotation matrices.
+
+    Parameters
+    ----------
+    angles: np.ndarray
+        The rotation angles in radians, shape (N, 3)
+    seq: str
+        The sequence of the rotation angles
+
+    Returns
+    -------
+    np.ndarray
+        The rotation angles flipped and wrapped into [-pi, pi[, shape (N, 3)
+    """
+    offset = np.pi  # only in radians
+
+    flipped = np.empty_like(angles, dtype=float)
+    flipped[:, 0] = angles[:, 0] + offset
+    flipped[:, 1] = -angles[:, 1] if seq[0] == seq[2] else offset - angles[:, 1]
+    flipped[:, 2] = angles[:, 2] + offset
+
+    return wrap_angles(flipped)
+
+
+def continuous_rotations_batch(angles: np.ndarray, seq: str, series_starts: np.ndarray = None) -> np.ndarray:
+    """
+    Pick for each sample the branch of the euler angles, as returned or flipped, that keeps each series continuous.
+
+    Both branches describe the same rotation matrices, so we switch branch between two consecutive samples whenever
+    the flipped next sample is closer to the current one, and the branch of each sample is the parity of the number
+    of switches since the start of its series. Each series finally keeps the branch the most of its samples were given.
+
+    Parameters
+    ----------
+    angles: np.ndarray
+        The rotation angles in radians, shape (N, 3)
+    seq: str
+        The sequence of the rotation angles
+    series_starts: np.ndarray
+        The index of the first sample of each series when several series are stacked, a single series by default
+
+    Returns
+    -------
+    np.ndarray
+        The rotation angles on the most continuous branch, shape (N, 3)
+    """
+    nb_samples = angles.shape[0]
+    series_starts = np.array([0]) if series_starts is None else np.asarray(series_starts)
+    if nb_samples == 0:
+        return angles.copy()
+
+    flipped = flip_rotations_batch(angles, seq)
+
+    same_branch_jump = np.abs(wrap_angles(angles[1:] - angles[:-1])).sum(axis=1)
+    switched_branch_jump = np.abs(wrap_angles(flipped[1:] - angles[:-1])).sum(axis=1)
+    switches = np.concatenate(([0], (switched_branch_jump < same_branch_jump).astype(int)))
+    # no switch is carried from one series to the next one
+    switches[series_starts] = 0
+
+    lengths = np.diff(np.append(series_starts, nb_samples))
+    cumulated_switches = np.cumsum(switches)
+    is_flipped = (cumulated_switches - np.repeat(cumulated_switches[series_starts], lengths)) % 2 == 1
+
+    # keep the branch of the majority of the samples of each series
+    flipped_majority = np.add.reduceat(is_flipped.astype(int), series_starts) > lengths / 2
+    is_flipped ^= np.repeat(flipped_majority, lengths)
+
+    return np.where(is_flipped[:, np.newaxis], flipped, angles)
+
+
+def unwrap_batch(angles: np.ndarray, period: float = 2 * np.pi, series_starts: np.ndarray = None) -> np.ndarray:
+    """
+    Unwrap all the columns of a series of angles at once, see np.unwrap.
+
+    Parameters
+    ----------
+    angles: np.ndarray
+        The angles, shape (N, 3)
+    period: float
+        The period of the angles, e.g. 2 * pi for radians or 180 to remove the half-turn jumps in degrees
+    series_starts: np.ndarray
+        The index of the first sample of each series when several series are stacked, a single series by default.
+        In this case, NaN samples do not propagate to the following samples.
+
+    Returns
+    -------
+    np.ndarray
+        The unwrapped angles, shape (N, 3)
+    """
+    if series_starts is None:
+        return np.unwrap(angles, period=period, axis=0)
+
+    nb_samples = angles.shape[0]
+    series_starts = np.asarray(series_starts)
+    if nb_samples == 0:
+        return angles.copy()
+
+    # same correction as np.unwrap, between consecutive samples
+    delta = np.diff(angles, axis=0)
+    wrapped_delta = np.mod(delta + period / 2, period) - period / 2
+    wrapped_delta[(wrapped_delta == -period / 2) & (delta > 0)] = period / 2
+    correction = wrapped_delta - delta
+    correction[np.abs(delta) < period / 2] = 0
+    correction[np.isnan(correction)] = 0
+
+    # which is cumulated within each series only
+    cumulated_correction = np.concatenate((np.zeros((1, angles.shape[1])), np.cumsum(correction, axis=0)))
+    lengths = np.diff(np.append(series_starts, nb_samples))
+    cumulated_correction -= np.repeat(cumulated_correction[series_starts], lengths, axis=0)
+
+    return angles + cumulated_correction
+
+
+def gradient_batch(values: np.ndarray, abscissa: np.ndarray, series_starts: np.ndarray = None) -> np.ndarray:
+    """
+    Differentiate stacked series at once, see np.gradient, second order inside each series and first order at
+    both ends of each series, so that no difference is taken across two series.
+
+    Parameters
+    ----------
+    values: np.ndarray
+        The values to differentiate, shape (N,) or (N, M)
+    abscissa: np.ndarray
+        The sample points of the values, e.g. the humerothoracic angle, shape (N,)
+    series_starts: np.ndarray
+        The index of the first sample of each series when several series are stacked, a single series by default
+
+    Returns
+    -------
+    np.ndarray
+        The derivative of the values with respect to the abscissa, NaN for the series of a single sample
+    """
+    nb_samples = values.shape[0]
+    series_starts = np.array([0]) if series_starts is None else np.asarray(series_starts)
+    if nb_samples < 2:
+        return np.full(values.shape, np.nan)
+
+    # the stencils across two series may divide by zero, they are overwritten below
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gradient = np.gradient(values, abscissa, axis=0)
+
+    # the first and last samples of each series would otherwise see the neighbouring series
+    series_ends = np.append(series_starts[1:], nb_samples) - 1
+    is_single = series_starts == series_ends
+    starts, ends = series_starts[~is_single], series_ends[~is_single]
+    gradient[starts] = (values[starts + 1] - values[starts]) / _expand(abscissa[starts + 1] - abscissa[starts], values)
+    gradient[ends] = (values[ends] - values[ends - 1]) / _expand(abscissa[ends] - abscissa[ends - 1], values)
+    gradient[series_starts[is_single]] = np.nan
+
+    return gradient
+
+
+def _expand(steps: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Broadcast the steps over the columns of the values, if any"""
+    return steps if values.ndim == 1 else steps[:, np.newaxis]
+
+
 def get_segment_columns(segment: Segment) -> list[str]:
     columns = {
         Segment.THORAX: ["thorax_x", "thorax_y", "thorax_z", "thorax_origin"],
@@ -0,0 +1,182 @@
+"""
+This module watches the files of a dataset root, the dataset table and the csv files of the rows, and rebuilds the
+series of the rows whose files changed, so that the curators see their edits without reloading the whole dataset,
+e.g. in the GUI, see plots/gui.py.
+
+The changes are detected by polling the modification time and size of the files. A changed csv file is mapped to the
+rows reading it through a reverse index, and only these rows are imported again. A changed dataset table is checked
+again and only its added or changed rows are imported, see Spartacus.import_confident_data_incrementally. The exports
+of the root are kept up to date after each rebuild. A step is skipped while another one runs, e.g. in the threads of
+the GUI callbacks.
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from .dataset_root import DatasetRoot
+from .incremental import CSV_FIELDS, EXPORTS
+from .load import Spartacus, load
+
+
+def file_stats(files: list[Path]) -> dict[Path, tuple[int, int] | None]:
+    """The modification time, in ns, and the size of each file, None if it does not exist"""
+    stats = {}
+    for file in files:
+        try:
+            stat = os.stat(file)
+            stats[file] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stats[file] = None
+    return stats
+
+
+def rows_of_file(dataframe: pd.DataFrame, dataset_root: DatasetRoot) -> dict[Path, list[int]]:
+    """
+    The reverse index from each csv file to the rows reading it.
+
+    Parameters
+    ----------
+    dataframe: pd.DataFrame
+        The confident rows of the dataset
+    dataset_root: DatasetRoot
+        The root holding the study folders of the rows
+
+    Returns
+    -------
+    dict[Path, list[int]]
+        The index, in dataframe, of the rows reading each file
+    """
+    index = {}
+    for row_id, row in dataframe.iterrows():
+        try:
+            folder_path = dataset_root.folder_path(row["folder"])
+        except (ValueError, TypeError):
+            continue
+        for field in CSV_FIELDS:
+            if row.get(field) is None:
+                continue
+            index.setdefault(Path(folder_path) / row[field], []).append(row_id)
+    return index
+
+
+class DatasetWatcher:
+    """
+    The series of a dataset root, rebuilt when its files change.
+
+    Attributes
+    ----------
+    spartacus: Spartacus
+        The dataset, replaced when the dataset table changes
+    version: int
+        The number of rebuilds, to tell whether the series changed since they were last read
+    """
+
+    def __init__(self, dataset_root: DatasetRoot | str | Path = None):
+        """
+        Parameters
+        ----------
+        dataset_root: DatasetRoot | str | Path
+            The root to watch, see DatasetRoot for the default one
+        """
+        self.dataset_root = dataset_root if isinstance(dataset_root, DatasetRoot) else DatasetRoot(dataset_root)
+        self.spartacus = load(dataset_root=self.dataset_root, incremental=True)
+        self.version = 0
+        # held during a step, so that concurrent steps do not rebuild the same series
+        self._step_lock = threading.Lock()
+        self._index()
+
+    def _index(self, stats: dict[Path, tuple[int, int] | None] = None):
+        """
+        Index the files of the rows and keep their stats, the given ones for the files already watched, so that a file
+        saved during an import is rebuilt on the next step, and the current ones for the files new to the index.
+        """
+        stats = {} if stats is None else stats
+        self.rows_of_file = rows_of_file(self.spartacus.confident_dataframe, self.dataset_root)
+        files = [self.dataset_root.clean_csv] + list(self.rows_of_file)
+        new_stats = file_stats([file for file in files if file not in stats])
+        self.stats = {file: stats[file] if file in stats else new_stats[file] for file in files}
+
+    def step(self) -> bool:
+        """
+        Rebuild the series of the rows whose files changed since the last rebuild, if any.
+        If a file cannot be read, e.g. deleted or being written, the previous series are kept and the rebuild is
+        tried again on the next step. Nothing is done while another step runs, the changes are rebuilt by that one or
+        on the next step.
+
+        Returns
+        -------
+        bool
+            True if the series were rebuilt
+        """
+        if not self._step_lock.acquire(blocking=False):
+            return False
+        try:
+            return self._step()
+        finally:
+            self._step_lock.release()
+
+    def _step(self) -> bool:
+        """Rebuild the series of the rows whose files changed, see step"""
+        # the stats taken before the import, a file edited meanwhile is rebuilt on the next step
+        stats = file_stats(list(self.stats))
+        changed = [file for file, stat in stats.items() if stat != self.stats[file]]
+        if not changed:
+            return False
+
+        try:
+            if self.dataset_root.clean_csv in changed:
+                self._reload_table()
+            else:
+                row_ids = sorted({row_id for file in changed for row_id in self.rows_of_file[file]})
+                self.spartacus.reimport_rows(row_ids)
+        except (OSError, ValueError) as error:
+            print(f"WARNING : the rows of {[str(file) for file in changed]} could not be rebuilt: {error}")
+            return False
+
+        if self.dataset_root.clean_csv in changed:
+            self._index(stats)
+        else:
+            self.stats = stats
+
+        self.spartacus.export()
+        self.version += 1
+        return True
+
+    def _reload_table(self):
+        """Check the dataset table again and import its added or changed rows only"""
+        previous = self.spartacus
+        spartacus = Spartacus(dataframe=pd.read_csv(self.dataset_root.clean_csv), dataset_root=self.dataset_root)
+        spartacus.remove_rows_not_ready_for_analysis()
+        spartacus.set_correction_callbacks_from_segment_joint_validity(print_warnings=False)
+        spartacus.import_confident_data_incrementally(
+            previous_hashes=previous.row_hashes,
+            previous_wide_series={
+                wide_attribute: getattr(previous, wide_attribute[1:]) for _, _, wide_attribute in EXPORTS
+            },
+        )
+        self.spartacus = spartacus
+
+    def run(self, interval: float = 1.0, max_steps: int = None):
+        """
+        Poll the files until interrupted.
+
+        Parameters
+        ----------
+        interval: float
+            The time between two polls, in s
+        max_steps: int
+            The number of polls, unlimited by default
+        """
+        step = 0
+        while max_steps is None or step < max_steps:
+            if self.step():
+                print(
+                    f"Rebuilt {len(self.spartacus.rows)} rows, reused {self.spartacus.nb_reused_rows} rows "
+                    f"(version {self.version})"
+                )
+            step += 1
+            time.sleep(interval)
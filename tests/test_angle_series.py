@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from spartacus.src.angle_series import LONG_COLUMNS, WIDE_COLUMNS, from_long_format, to_long_format
+
+
+def wide_dataframe() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "article": ["A", "A", "A", "B", "B"],
+            "joint": ["glenohumeral"] * 3 + ["scapulothoracic"] * 2,
+            "humeral_motion": ["frontal elevation"] * 5,
+            "humerothoracic_angle": [10.0, 20.0, 30.0, 15.0, 25.0],
+            "value_dof1": [1.0, 2.0, 3.0, 4.0, 5.0],
+            "value_dof2": [11.0, 12.0, 13.0, 14.0, 15.0],
+            "value_dof3": [21.0, 22.0, 23.0, np.nan, 25.0],
+            "unit": ["rad"] * 5,
+            "confidence": [1.0] * 3 + [0.5] * 2,
+            "shoulder_id": [1] * 3 + [2] * 2,
+            "in_vivo": [True] * 5,
+            "xp_mean": ["biplanar x-ray"] * 5,
+            "biomechanical_dof1": ["y"] * 3 + ["z"] * 2,
+            "biomechanical_dof2": ["x"] * 5,
+            "biomechanical_dof3": ["y"] * 3 + ["z"] * 2,
+            "transform": ["identity"] * 3 + ["rotation_matrix"] * 2,
+            "row_id": [0, 0, 0, 1, 1],
+        }
+    )
+
+
+def test_to_long_format():
+    wide = wide_dataframe()
+    long = to_long_format(wide)
+
+    assert list(long.columns) == LONG_COLUMNS
+    assert long.shape[0] == 15
+    np.testing.assert_array_equal(long["degree_of_freedom"], [1, 1, 1, 2, 2, 2, 3, 3, 3, 1, 1, 2, 2, 3, 3])
+    np.testing.assert_array_equal(
+        long["value"], [1.0, 2.0, 3.0, 11.0, 12.0, 13.0, 21.0, 22.0, 23.0, 4.0, 5.0, 14.0, 15.0, np.nan, 25.0]
+    )
+    np.testing.assert_array_equal(long["humerothoracic_angle"], [10.0, 20.0, 30.0] * 3 + [15.0, 25.0] * 3)
+    assert list(long["biomechanical_dof"]) == ["y"] * 3 + ["x"] * 3 + ["y"] * 3 + ["z"] * 2 + ["x"] * 2 + ["z"] * 2
+    assert list(long["article"]) == ["A"] * 9 + ["B"] * 6
+    assert list(long["transform"]) == ["identity"] * 9 + ["rotation_matrix"] * 6
+
+
+def test_to_long_format_empty():
+    long = to_long_format(wide_dataframe().iloc[:0])
+    assert list(long.columns) == LONG_COLUMNS
+    assert long.shape[0] == 0
+
+
+def test_from_long_format():
+    wide = wide_dataframe()
+    long = to_long_format(wide)
+
+    back = from_long_format(long, lengths=[3, 2], row_ids=[0, 1])
+    assert list(back.columns) == WIDE_COLUMNS
+    pd.testing.assert_frame_equal(back, wide[WIDE_COLUMNS], check_dtype=False)
+
+    with pytest.raises(ValueError):
+        from_long_format(long, lengths=[3, 3], row_ids=[0, 1])
@@ -1,5 +1,6 @@
 import pytest
-from spartacus.src.biomech_system import BiomechCoordinateSystem
+from spartacus.src.biomech_system import BiomechCoordinateSystem, DEFAULT_RISK_COEFFICIENTS
+from spartacus.src.confidence import risk_coefficient_index
 
 from spartacus.src.enums import CartesianAxis, BiomechDirection, BiomechOrigin, Segment
 
@@ -56,3 +57,8 @@ def test_risk_routine():
     assert mislabeled_and_wrong_sens.is_mislabeled() == True
     assert mislabeled_and_wrong_sens.is_any_axis_wrong_sens() == True
     assert mislabeled_and_wrong_sens.get_segment_risk_quantification("proximal", "rotation") == 0.9 * 0.9
+
+    coefficients = DEFAULT_RISK_COEFFICIENTS.copy()
+    coefficients[risk_coefficient_index("proximal", "rotation", "label")] = 0.5
+    assert mislabeled_and_wrong_sens.get_segment_risk_quantification("proximal", "rotation", coefficients) == 0.5 * 0.9
+    assert mislabeled_and_wrong_sens.get_segment_risk_quantification("distal", "rotation", coefficients) == 0.9 * 0.9
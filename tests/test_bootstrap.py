@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from spartacus import load_subdataset
+from spartacus.src.bootstrap import BLOCK_SIZE, BOOTSTRAP_COLUMNS, NB_BINS, bootstrap_ci, bootstrap_means, sample_counts
+
+from .utils import TestUtils
+
+
+def test_sample_counts():
+    rng = np.random.default_rng(5)
+    study_sizes = np.array([3, 1, 5])
+
+    counts = sample_counts(rng, study_sizes, 200)
+
+    assert counts.shape == (200, 9)
+    # each drawn study contributes as many series as it has
+    drawn_per_study = np.stack([counts[:, :3].sum(axis=1) / 3, counts[:, 3], counts[:, 4:].sum(axis=1) / 5], axis=1)
+    np.testing.assert_almost_equal(drawn_per_study.sum(axis=1), 3)
+    np.testing.assert_almost_equal(drawn_per_study, np.round(drawn_per_study))
+
+
+def test_bootstrap_means():
+    rng = np.random.default_rng(6)
+    values = rng.normal(size=(12, 4, 3)) + np.arange(12)[:, np.newaxis, np.newaxis]
+    values[0, 0, 0] = np.nan
+    studies = np.repeat(["a", "b", "c", "d"], 3)
+    n_boot = 2 * BLOCK_SIZE + 10
+
+    statistics = bootstrap_means(values, studies, n_boot=n_boot, seed=1)
+
+    # the same replicates, stored
+    seeds = np.random.SeedSequence(1).spawn(3)
+    counts = np.concatenate(
+        [
+            sample_counts(np.random.default_rng(seed), np.array([3, 3, 3, 3]), size)
+            for seed, size in zip(seeds, [250, 250, 10])
+        ]
+    )
+    flat_values = values.reshape(12, -1)
+    is_valid = ~np.isnan(flat_values)
+    means = (counts @ np.where(is_valid, flat_values, 0)) / (counts @ is_valid)
+
+    bin_width = (np.nanmax(flat_values, axis=0) - np.nanmin(flat_values, axis=0)) / NB_BINS
+    np.testing.assert_array_less(
+        np.abs(statistics["ci_lower"].ravel() - np.percentile(means, 2.5, axis=0, method="inverted_cdf")),
+        bin_width + 1e-12,
+    )
+    np.testing.assert_array_less(
+        np.abs(statistics["ci_upper"].ravel() - np.percentile(means, 97.5, axis=0, method="inverted_cdf")),
+        bin_width + 1e-12,
+    )
+    np.testing.assert_almost_equal(statistics["se"].ravel(), np.std(means, axis=0))
+
+    # the workers do not change the replicates
+    for backend in ("threads", "processes"):
+        parallel = bootstrap_means(values, studies, n_boot=n_boot, seed=1, n_jobs=2, backend=backend)
+        np.testing.assert_almost_equal(parallel["ci_lower"], statistics["ci_lower"])
+
+    with pytest.raises(ValueError):
+        bootstrap_means(values, studies, backend="gpu")
+
+
+def test_bootstrap_ci():
+    grid = np.arange(0.0, 100.0, 10.0)
+    wide = pd.concat(
+        [TestUtils.wide_series("glenohumeral", 0, grid, np.full((10, 3), 2.0))],
+        ignore_index=True,
+    )
+
+    intervals = bootstrap_ci(wide, grid=grid, n_boot=100)
+
+    assert list(intervals.columns) == BOOTSTRAP_COLUMNS
+    assert intervals.shape[0] == 30
+    # a single series cannot vary
+    np.testing.assert_almost_equal(intervals[["mean", "ci_lower", "ci_upper"]].to_numpy(dtype=float), 2)
+    np.testing.assert_almost_equal(intervals["se"].to_numpy(dtype=float), 0)
+
+
+def test_bootstrap_ci_of_an_article():
+    sp = load_subdataset(name="Ludewig et al.", outputs=("corrected",))
+
+    intervals = sp.bootstrap_ci(joint="scapulothoracic", humeral_motion="frontal elevation", n_boot=500)
+
+    is_valid = intervals["mean"].notna()
+    assert is_valid.any()
+    assert (intervals["nb_studies"] == 1).all()
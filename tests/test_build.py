@@ -0,0 +1,65 @@
+import pandas as pd
+import pytest
+
+from spartacus import load_subdataset
+from spartacus.__main__ import main
+from spartacus.src.build import VALIDATION_COLUMNS, VALIDATION_FILENAME, build_exports, select_rows
+from spartacus.src.incremental import read_export, row_manifest_path
+from spartacus.src.synthetic import generate_synthetic_dataset, synthetic_author
+
+
+def test_select_rows():
+    dataframe = pd.DataFrame(
+        {
+            "dataset_authors": ["A et al.", "A et al.", "B et al."],
+            "folder": ["#1_A", "#1_A", "#2_B"],
+            "joint": ["glenohumeral", "scapulothoracic", "glenohumeral"],
+        }
+    )
+    assert select_rows(dataframe).shape[0] == 3
+    assert list(select_rows(dataframe, studies=["A et al."]).index) == [0, 1]
+    assert list(select_rows(dataframe, studies=["#2_B"], joints=["glenohumeral"]).index) == [2]
+
+    with pytest.raises(ValueError):
+        select_rows(dataframe, joints=["elbow"])
+
+
+def test_build_exports(tmp_path):
+    generate_synthetic_dataset(tmp_path / "root", nb_studies=2, rows_per_study=4, nb_samples=10, seed=4)
+
+    report = build_exports(
+        tmp_path / "root",
+        export_folder=tmp_path / "npz",
+        file_format="npz",
+        studies=[synthetic_author(1)],
+        skip_uncorrected=True,
+    )
+    assert list(report.columns) == VALIDATION_COLUMNS
+    assert not (report["severity"] == "error").any()
+    assert (tmp_path / "npz" / VALIDATION_FILENAME).is_file()
+    assert row_manifest_path(tmp_path / "npz", "npz").is_file()
+    assert not (tmp_path / "npz" / "confident_data.npz").is_file()
+
+    reference = load_subdataset(synthetic_author(1), dataset_root=tmp_path / "root")
+    pd.testing.assert_frame_equal(
+        read_export(tmp_path / "npz" / "corrected_confident_data.npz", "npz"),
+        reference.corrected_confident_data_values,
+        check_dtype=False,
+    )
+
+
+def test_build_command(tmp_path):
+    generate_synthetic_dataset(tmp_path / "root", nb_studies=2, rows_per_study=4, nb_samples=10, seed=5)
+    arguments = ["build", "--root", str(tmp_path / "root"), "--output", str(tmp_path / "out")]
+
+    assert main(arguments) == 0
+    assert main(arguments + ["--incremental", "--jobs", "2"]) == 0
+    assert main(arguments + ["--studies", "Nobody et al."]) == 2
+
+    # a missing csv file fails the validation, the other rows are still exported
+    study_folder = tmp_path / "root" / "data" / "#S1_Synthetic_et_al"
+    next(study_folder.glob("row_*_dof_1st_euler.csv")).unlink()
+    assert main(arguments) == 1
+    report = pd.read_csv(tmp_path / "out" / VALIDATION_FILENAME)
+    assert set(report.loc[report["severity"] == "error", "check"]) == {"missing_file", "manifest"}
+    assert (tmp_path / "out" / "corrected_confident_data.csv").is_file()
@@ -1,6 +1,11 @@
+import numpy as np
 from spartacus.src.corrections.angle_conversion_callbacks import (
+    apply_sign_factors,
+    from_euler_angles_to_rotation_matrices,
     get_angle_conversion_callback_from_sequence,
     get_angle_conversion_callback_from_tuple,
+    get_sign_factors_from_frame_matrices,
+    rotation_matrices_2_euler_angles,
     EulerSequence,
 )
 import pytest
@@ -31,3 +36,43 @@ def test_checks():
     assert tuple(callack(1, 2, 3)) == (-1.0268907336660056, -0.6499256902050641, -1.857115353462594)
     callack = get_angle_conversion_callback_from_sequence(EulerSequence.XYZ, EulerSequence.YXY)
     assert tuple(callack(1, 2, 3)) == (3.064847992801699, 2.2690392880128885, -2.045600530404556)
+
+
+@pytest.mark.parametrize(
+    "frame_matrix, previous_sequence, new_sequence, expected_factors",
+    [
+        (np.eye(3), "yxz", "yxz", (1, 1, 1)),
+        (np.diag([1, 1, -1]), "yxz", "yxz", (-1, -1, 1)),
+        (np.diag([1, 1, -1]), "yxy", "yxy", (-1, -1, -1)),
+        (np.array([[0, 1, 0], [0, 0, 1], [1, 0, 0]]), "zyx", "yxz", (1, 1, 1)),
+        (np.array([[0, 0, 1], [0, 1, 0], [-1, 0, 0]]), "yxy", "yzy", (1, -1, 1)),
+    ],
+)
+def test_sign_factors(frame_matrix, previous_sequence, new_sequence, expected_factors):
+    factors = get_sign_factors_from_frame_matrices(frame_matrix, frame_matrix, previous_sequence, new_sequence)
+    assert factors == expected_factors
+
+    # same angles as the rotation matrix round trip
+    angles = np.random.default_rng(0).uniform(-np.pi, np.pi, (50, 3))
+    angles[0, 1] = 0  # gimbal lock
+    angles[1, 2] = np.nan
+    rotation_matrices = (
+        frame_matrix @ from_euler_angles_to_rotation_matrices(previous_sequence, angles) @ frame_matrix.T
+    )
+    np.testing.assert_almost_equal(
+        apply_sign_factors(angles, factors, EulerSequence(new_sequence)),
+        rotation_matrices_2_euler_angles(rotation_matrices, EulerSequence(new_sequence)),
+    )
+
+
+def test_sign_factors_not_available():
+    # different parent and child matrices
+    assert get_sign_factors_from_frame_matrices(np.eye(3), np.diag([1, 1, -1]), "yxz", "yxz") is None
+    # not a signed permutation
+    kolz_like = from_euler_angles_to_rotation_matrices("xyz", np.array([[0.1, 0.2, 0.3]]))[0]
+    assert get_sign_factors_from_frame_matrices(kolz_like, kolz_like, "yxz", "yxz") is None
+    # the axes of the sequences don't match
+    assert get_sign_factors_from_frame_matrices(np.eye(3), np.eye(3), "zxy", "yxz") is None
+
+    with pytest.raises(ValueError, match="tuple_factors must be a tuple of 1 and -1"):
+        apply_sign_factors(np.zeros((1, 3)), (1, 2, 1), EulerSequence.YXZ)
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from spartacus import load_subdataset
+from spartacus.src.biomech_system import DEFAULT_RISK_COEFFICIENTS
+from spartacus.src.confidence import CONFIDENCE_COLUMNS, NON_ISB_SEQUENCE_COEFFICIENT, risk_flags, score_confidence
+from spartacus.src.deviation import Deviation
+
+
+@pytest.mark.parametrize("name", ["Ludewig et al.", "Begon et al.", "Matsuki et al."])
+def test_confidence_table(name):
+    sp = load_subdataset(name=name, outputs=("corrected",))
+
+    table = sp.confidence_table()
+
+    assert list(table.columns) == CONFIDENCE_COLUMNS
+    assert table.index.tolist() == sp.confident_dataframe.index.tolist()
+    for row_data in sp.rows:
+        flags = table.loc[row_data.row.name]
+        assert flags["proximal_mislabeled"] == row_data.parent_biomech_sys.is_mislabeled()
+        assert flags["distal_wrong_sens"] == row_data.child_biomech_sys.is_any_axis_wrong_sens()
+        assert flags["distal_not_isb_origin"] == (not row_data.child_biomech_sys.is_isb_origin())
+        np.testing.assert_almost_equal(
+            flags["displacement_confidence"], Deviation.confidence_segment(row_data, "displacement")
+        )
+        if row_data.has_rotation_data:
+            assert flags["is_euler_sequence_isb"] == row_data.is_joint_euler_angle_ISB_with_adaptation_from_segment()
+            np.testing.assert_almost_equal(
+                flags["rotation_confidence"], Deviation.confidence_total(row_data, "rotation")
+            )
+
+
+def test_score_confidence():
+    sp = load_subdataset(name="Begon et al.", outputs=("corrected",))
+    flags = risk_flags(sp.confident_dataframe)
+
+    confidence = score_confidence(flags, "rotation", coefficients=np.ones_like(DEFAULT_RISK_COEFFICIENTS))
+    expected = np.where(flags["is_euler_sequence_isb"], 1, NON_ISB_SEQUENCE_COEFFICIENT)
+    np.testing.assert_almost_equal(confidence, expected)
+
+    with pytest.raises(ValueError):
+        score_confidence(flags, "rotation", coefficients=np.ones((2, 2)))
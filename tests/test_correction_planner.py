@@ -0,0 +1,35 @@
+import numpy as np
+
+from spartacus.src.corrections.correction_planner import plan_rotation_correction, plan_translation_correction
+from spartacus.src.corrections.kolz_matrices import get_kolz_rotation_matrix
+from spartacus.src.enums import Correction, CorrectionPlan
+
+
+def test_plan_rotation_correction():
+    plan, sign_factors = plan_rotation_correction(np.eye(3), np.eye(3), "yxz", "yxz")
+    assert plan == CorrectionPlan.IDENTITY
+    assert sign_factors == (1, 1, 1)
+
+    mirror = np.diag([1, 1, -1])
+    plan, sign_factors = plan_rotation_correction(mirror, mirror, "yxy", "yxy")
+    assert plan == CorrectionPlan.MIRROR
+    assert sign_factors == (-1, -1, -1)
+
+    permutation = np.array([[0, 1, 0], [0, 0, 1], [1, 0, 0]])
+    plan, sign_factors = plan_rotation_correction(permutation, permutation, "zyx", "yxz")
+    assert plan == CorrectionPlan.SIGN_FACTORS
+    assert sign_factors == (1, 1, 1)
+
+    kolz = get_kolz_rotation_matrix(Correction.SCAPULA_KOLZ_AC_TO_PA_ROTATION)
+    plan, sign_factors = plan_rotation_correction(kolz, np.eye(3), "yxz", "yxz")
+    assert plan == CorrectionPlan.ROTATION_MATRIX
+    assert sign_factors is None
+
+
+def test_plan_translation_correction():
+    assert plan_translation_correction(np.eye(3)) == CorrectionPlan.IDENTITY
+    assert plan_translation_correction(np.diag([1.0, 1.0, -1.0])) == CorrectionPlan.MIRROR
+    assert plan_translation_correction(np.array([[0, 0, 1], [0, 1, 0], [-1, 0, 0]])) == CorrectionPlan.SIGN_FACTORS
+
+    kolz = get_kolz_rotation_matrix(Correction.SCAPULA_KOLZ_GLENOID_TO_PA_ROTATION)
+    assert plan_translation_correction(kolz) == CorrectionPlan.ROTATION_MATRIX
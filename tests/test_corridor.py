@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from spartacus import DataFrameInterface, DataPlanchePlotting, load_subdataset
+from spartacus.src.corridor import CORRIDOR_COLUMNS, compute_corridors, resample_on_grid, weighted_statistics
+
+from .utils import TestUtils
+
+
+def test_weighted_statistics():
+    rng = np.random.default_rng(4)
+    values = rng.normal(size=(17, 5, 3))
+    values[3, 1, 0] = np.nan
+    values[:, 4, 2] = np.nan
+
+    statistics = weighted_statistics(values, np.ones(17))
+    np.testing.assert_almost_equal(statistics["mean"], np.nanmean(values, axis=0))
+    np.testing.assert_almost_equal(statistics["sd"], np.nanstd(values, axis=0))
+    for percentile in (5, 25, 50, 75, 95):
+        np.testing.assert_almost_equal(
+            statistics[f"p{percentile}"], np.nanpercentile(values, percentile, axis=0, method="hazen")
+        )
+    assert statistics["nb_series"][1, 0] == 16
+    assert statistics["nb_series"][4, 2] == 0
+
+    # a null weight is the same as no series, a double weight the same as a duplicated series
+    weights = np.ones(17)
+    weights[:5] = 0
+    weights[5] = 2
+    statistics = weighted_statistics(values, weights)
+    expected = np.concatenate((values[5:], values[5:6]))
+    np.testing.assert_almost_equal(statistics["mean"], np.nanmean(expected, axis=0))
+    np.testing.assert_almost_equal(statistics["sd"], np.nanstd(expected, axis=0))
+
+
+def test_resample_on_grid():
+    wide = pd.concat(
+        [
+            TestUtils.wide_series("glenohumeral", 3, np.array([30.0, 10.0, 50.0]), np.arange(9.0).reshape(3, 3)),
+            TestUtils.wide_series("glenohumeral", 1, np.array([0.0, 100.0]), np.array([[0, 0, 0], [100, 50, 10]])),
+        ],
+        ignore_index=True,
+    )
+    grid = np.array([0.0, 20.0, 40.0, 60.0])
+
+    series, values = resample_on_grid(wide, grid)
+
+    assert series["row_id"].tolist() == [1, 3]
+    np.testing.assert_almost_equal(values[0], [[0, 0, 0], [20, 10, 2], [40, 20, 4], [60, 30, 6]])
+    np.testing.assert_almost_equal(values[1, 1:3], [[1.5, 2.5, 3.5], [3, 4, 5]])
+    assert np.isnan(values[1, [0, 3]]).all()
+
+
+def test_compute_corridors():
+    grid = np.arange(0.0, 100.0, 10.0)
+    wide = pd.concat(
+        [
+            TestUtils.wide_series("glenohumeral", row_id, grid, np.full((10, 3), float(row_id)), shoulder_id=row_id)
+            for row_id in range(4)
+        ],
+        ignore_index=True,
+    )
+    wide["confidence"] = wide["row_id"].astype(float)
+
+    corridors = compute_corridors(wide, grid=grid)
+    assert list(corridors.columns) == CORRIDOR_COLUMNS
+    assert corridors.shape[0] == 30
+    np.testing.assert_almost_equal(corridors["mean"].to_numpy(dtype=float), 1.5)
+    np.testing.assert_almost_equal(corridors["p50"].to_numpy(dtype=float), 1.5)
+    assert (corridors["nb_series"] == 4).all()
+
+    corridors = compute_corridors(wide, grid=grid, weighted=True)
+    np.testing.assert_almost_equal(corridors["mean"].to_numpy(dtype=float), 14 / 6)
+
+    corridors = compute_corridors(wide, grid=grid, min_series=5)
+    assert corridors["mean"].isna().all()
+
+
+def test_corridors():
+    sp = load_subdataset(name="Ludewig et al.", outputs=("corrected",))
+
+    corridors = sp.corridors(joint="glenohumeral", humeral_motion="frontal elevation")
+    assert sp.corridors(joint="glenohumeral", humeral_motion="frontal elevation") is corridors
+    assert sp.corridors(joint="glenohumeral", humeral_motion="frontal elevation", weighted=True) is not corridors
+    assert corridors["joint"].unique().tolist() == ["glenohumeral"]
+    assert corridors["nb_series"].max() == 1
+
+    dfi = DataFrameInterface(sp.corrected_confident_data_values)
+    plot = DataPlanchePlotting(dfi, restrict_to_joints=["glenohumeral"])
+    plot.plot_corridor(corridors, band="p25-p75")
+    assert len(plot.fig.data) == 3
+    assert plot.fig.data[0].fill == "toself"
+
+    with pytest.raises(ValueError):
+        plot.plot_corridor(corridors, band="p1-p99")
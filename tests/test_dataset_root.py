@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import pytest
+
+from spartacus import DatasetCSV, import_data, load
+from spartacus.src.dataset_root import DATASET_ROOT_ENVIRONMENT_VARIABLE, DatasetRoot
+from spartacus.src.synthetic import generate_synthetic_dataset, synthetic_author
+
+
+def test_default_dataset_root(monkeypatch):
+    monkeypatch.delenv(DATASET_ROOT_ENVIRONMENT_VARIABLE, raising=False)
+    root = DatasetRoot()
+
+    assert root.is_package
+    assert root.clean_csv == Path(DatasetCSV.CLEAN.value).absolute()
+    assert root.raw_csv == Path(DatasetCSV.RAW.value).absolute()
+    assert root.folder_path("#1_Begon_et_al").is_dir()
+
+    studies = root.discover_studies()
+    assert "#1_Begon_et_al" in studies and "#19_Teece_et_al" in studies
+
+
+def test_dataset_root_from_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv(DATASET_ROOT_ENVIRONMENT_VARIABLE, str(tmp_path))
+    root = DatasetRoot()
+
+    assert root == DatasetRoot(tmp_path)
+    assert not root.is_package
+    assert root.discover_studies() == {}
+    assert root.cache_folder == tmp_path / "cache" and root.cache_folder.is_dir()
+    with pytest.raises(ValueError):
+        root.folder_path("#1_Begon_et_al")
+    with pytest.raises(ValueError):
+        DatasetRoot(tmp_path / "missing")
+
+
+def test_load_and_export_dataset_root(tmp_path):
+    generate_synthetic_dataset(tmp_path, nb_studies=2, rows_per_study=4, nb_samples=10)
+    root = DatasetRoot(tmp_path)
+    assert list(root.discover_studies()) == ["#S1_Synthetic_et_al", "#S2_Synthetic_et_al"]
+
+    sp = load(outputs=("both",), dataset_root=root)
+    assert sp.dataset_root == root
+    assert set(sp.corrected_confident_data_wide["article"]) <= {synthetic_author(1), synthetic_author(2)}
+
+    sp.export()
+    assert (root.export_folder / "corrected_confident_data.csv").is_file()
+    assert (root.export_folder / "confident_translation_data.csv").is_file()
+
+
+def test_import_data_of_corrected_exports(tmp_path):
+    generate_synthetic_dataset(tmp_path, nb_studies=1, rows_per_study=4, nb_samples=10)
+    root = DatasetRoot(tmp_path)
+    load(outputs=("corrected",), dataset_root=root).export(outputs=("corrected",))
+
+    assert import_data(dataset_root=root).shape[0] > 0
+    assert set(import_data(translation=True, dataset_root=root)["unit"]) <= {"mm"}
+    with pytest.raises(ValueError, match="confident_data.csv file does not exist"):
+        import_data(correction=False, dataset_root=root)
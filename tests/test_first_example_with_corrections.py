@@ -1,6 +1,8 @@
 import numpy as np
 import pytest
 
+from spartacus.src.dataset_root import DATASET_ROOT_ENVIRONMENT_VARIABLE
+
 from .utils import TestUtils
 
 # Data for each article test
@@ -154,14 +156,24 @@ transformed_data_article = [[name] + list(values) for name, values in articles_d
 
 spartacus = TestUtils.spartacus_folder()
 module = TestUtils.load_module(spartacus + "/examples/first_example.py")
-confident_values = module.main()
+
+
+@pytest.fixture(scope="module")
+def confident_values(tmp_path_factory):
+    # the example exports next to the clean dataset, run it on a copy of the package root not to write in the sources
+    root = TestUtils.package_root_copy(tmp_path_factory.mktemp("root"))
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv(DATASET_ROOT_ENVIRONMENT_VARIABLE, str(root))
+        return module.main()
 
 
 # This line parameterizes the test function below
 @pytest.mark.parametrize(
     "article_name,expected_shape,humeral_motions,joints,dofs,total_value,random_checks", transformed_data_article
 )
-def test_article_data(article_name, expected_shape, humeral_motions, joints, dofs, total_value, random_checks):
+def test_article_data(
+    confident_values, article_name, expected_shape, humeral_motions, joints, dofs, total_value, random_checks
+):
     data = confident_values[confident_values["article"] == article_name]
 
     if article_name == "Kozono et al.":
@@ -189,7 +201,7 @@ def test_article_data(article_name, expected_shape, humeral_motions, joints, dof
     np.testing.assert_almost_equal(data["value"].sum(), total_value, decimal=10)
 
 
-def test_number_of_articles():
+def test_number_of_articles(confident_values):
     # Check number of unique articles after processing all
     articles = list(confident_values["article"].unique())
     experted_articles = [
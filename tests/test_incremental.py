@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from spartacus import load
+from spartacus.src import incremental
+from spartacus.src.dataset_root import DatasetRoot
+from spartacus.src.incremental import (
+    ROW_MANIFEST_COLUMNS,
+    ROW_MANIFEST_FILENAME,
+    UNCORRECTED_ROW_MANIFEST_FILENAME,
+    row_hash,
+)
+from spartacus.src.synthetic import generate_synthetic_dataset
+
+
+def assert_same_series(sp, reference):
+    for attribute in (
+        "corrected_confident_data_wide",
+        "confident_data_wide",
+        "corrected_confident_translation_data_wide",
+        "confident_translation_data_wide",
+    ):
+        pd.testing.assert_frame_equal(
+            getattr(sp, attribute).reset_index(drop=True),
+            getattr(reference, attribute).reset_index(drop=True),
+            check_dtype=False,
+        )
+
+
+def test_load_incremental(tmp_path):
+    dataset_csv = generate_synthetic_dataset(tmp_path, nb_studies=2, rows_per_study=4, nb_samples=10, seed=2)
+    export_folder = DatasetRoot(tmp_path).export_folder
+
+    # no previous export, all the rows are imported
+    sp = load(dataset_root=tmp_path, incremental=True)
+    assert sp.nb_reused_rows == 0
+    manifest = pd.read_csv(export_folder / ROW_MANIFEST_FILENAME)
+    assert list(manifest.columns) == ROW_MANIFEST_COLUMNS
+    assert manifest.shape[0] == sp.confident_dataframe.shape[0]
+
+    # nothing changed, no row is imported
+    full = load(dataset_root=tmp_path)
+    sp = load(dataset_root=tmp_path, incremental=True)
+    assert len(sp.rows) == 0
+    assert sp.nb_reused_rows == sp.confident_dataframe.shape[0]
+    assert_same_series(sp, full)
+
+    # a changed row only is imported
+    dataframe = pd.read_csv(dataset_csv)
+    dataframe.loc[0, "shoulder_id"] = 99
+    dataframe.to_csv(dataset_csv, index=False)
+    full = load(dataset_root=tmp_path)
+    sp = load(dataset_root=tmp_path, incremental=True)
+    assert len(sp.rows) == 1
+    assert_same_series(sp, full)
+    with pytest.raises(ValueError):
+        _ = sp.corrected_rotation_matrices
+
+    # a removed row is dropped from the exports
+    dataframe.drop(index=1).to_csv(dataset_csv, index=False)
+    full = load(dataset_root=tmp_path)
+    sp = load(dataset_root=tmp_path, incremental=True)
+    assert len(sp.rows) == 0
+    assert_same_series(sp, full)
+    exported = pd.read_csv(export_folder / "corrected_confident_data.csv")
+    pd.testing.assert_frame_equal(exported, full.corrected_confident_data_values, check_dtype=False)
+    assert np.all(pd.read_csv(export_folder / ROW_MANIFEST_FILENAME)["nb_samples"] <= 10)
+
+
+def test_load_incremental_partial_outputs(tmp_path):
+    dataset_csv = generate_synthetic_dataset(tmp_path, nb_studies=1, rows_per_study=4, nb_samples=10, seed=3)
+    root = DatasetRoot(tmp_path)
+    load(dataset_root=root).export()
+
+    # the corrected exports only are rewritten after a csv file changed
+    row = pd.read_csv(dataset_csv).iloc[0]
+    csv_file = root.folder_path(row["folder"]) / row["dof_1st_euler"]
+    series = pd.read_csv(csv_file)
+    series.iloc[:, 1] += 5.0
+    series.to_csv(csv_file, index=False)
+    previous_uncorrected_manifest = pd.read_csv(root.export_folder / UNCORRECTED_ROW_MANIFEST_FILENAME)
+    sp = load(outputs=("corrected",), dataset_root=root, incremental=True)
+    assert sp.nb_reused_rows == 3
+    pd.testing.assert_frame_equal(
+        pd.read_csv(root.export_folder / UNCORRECTED_ROW_MANIFEST_FILENAME), previous_uncorrected_manifest
+    )
+
+    # the uncorrected exports are still the ones before the change, their row is imported again
+    sp = load(outputs=("both",), dataset_root=root, incremental=True)
+    assert sp.nb_reused_rows == 3
+    assert_same_series(sp, load(dataset_root=root))
+
+
+def test_row_hash_of_code(monkeypatch, tmp_path):
+    dataset_csv = generate_synthetic_dataset(tmp_path, nb_studies=1, rows_per_study=1, nb_samples=10, seed=4)
+    row = pd.read_csv(dataset_csv).iloc[0]
+    root = DatasetRoot(tmp_path)
+    hash_ = row_hash(row, root)
+    assert row_hash(row, root) == hash_
+
+    # a change of the code invalidates the exports
+    monkeypatch.setattr(incremental, "code_hash", lambda: "another version")
+    assert row_hash(row, root) != hash_
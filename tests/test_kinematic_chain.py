@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from spartacus import load_subdataset
+from spartacus.src.corrections.angle_conversion_callbacks import (
+    from_euler_angles_to_rotation_matrices,
+    rotation_matrices_2_euler_angles,
+)
+from spartacus.src.enums import EulerSequence, JointType
+from spartacus.src.kinematic_chain import align_series, compose_series, derive_joint_series, pair_series
+
+from .utils import TestUtils
+
+
+def test_align_series():
+    proximal = TestUtils.wide_series(
+        "scapulothoracic", 0, np.array([10.0, 30.0, 50.0]), np.array([[0, 0, 0], [20, 0, 0], [40, 0, 0]])
+    )
+    distal = TestUtils.wide_series(
+        "glenohumeral", 1, np.array([40.0, 20.0, 60.0]), np.array([[3, 0, 0], [1, 0, 0], [5, 0, 0]])
+    )
+
+    grid, proximal_values, distal_values = align_series(proximal, distal)
+
+    np.testing.assert_almost_equal(grid, [20, 30, 40, 50])
+    np.testing.assert_almost_equal(proximal_values[:, 0], [10, 20, 30, 40])
+    np.testing.assert_almost_equal(distal_values[:, 0], [1, 2, 3, 4])
+
+
+def test_compose_series():
+    rng = np.random.default_rng(0)
+    proximal_values = rng.uniform(-60, 60, (20, 3))
+    distal_values = rng.uniform(10, 120, (20, 3))
+    distal_values[3] = np.nan
+
+    values = compose_series(proximal_values, distal_values, JointType.THORACO_HUMERAL)
+
+    expected_matrices = from_euler_angles_to_rotation_matrices(
+        "yxz", np.deg2rad(proximal_values)
+    ) @ from_euler_angles_to_rotation_matrices("yxy", np.deg2rad(distal_values))
+    matrices = from_euler_angles_to_rotation_matrices("yxy", np.deg2rad(values))
+    is_valid = ~np.isnan(values).any(axis=1)
+    np.testing.assert_almost_equal(matrices[is_valid], expected_matrices[is_valid])
+    assert np.isnan(values[3]).all()
+    assert is_valid.sum() == 19
+
+    # a neutral scapula gives back the glenohumeral rotation
+    values = compose_series(np.zeros((20, 3)), distal_values, JointType.THORACO_HUMERAL)
+    np.testing.assert_almost_equal(
+        values[is_valid],
+        np.rad2deg(
+            rotation_matrices_2_euler_angles(
+                from_euler_angles_to_rotation_matrices("yxy", np.deg2rad(distal_values[is_valid])), EulerSequence.YXY
+            )
+        ),
+    )
+
+
+def test_pair_series():
+    angle = np.array([10.0, 20.0])
+    values = np.zeros((2, 3))
+    wide = pd.concat(
+        [
+            TestUtils.wide_series("scapulothoracic", 0, angle, values),
+            TestUtils.wide_series("glenohumeral", 1, angle, values),
+            TestUtils.wide_series("scapulothoracic", 2, angle, values, shoulder_id=2.0),
+            TestUtils.wide_series("glenohumeral", 3, angle, values, shoulder_id=2.0),
+            TestUtils.wide_series("glenohumeral", 4, angle, values, shoulder_id=2.0),
+            TestUtils.wide_series("glenohumeral", 5, angle, values, shoulder_id=3.0),
+        ],
+        ignore_index=True,
+    )
+
+    assert pair_series(wide, JointType.THORACO_HUMERAL) == [(0, 1)]
+    assert pair_series(wide, JointType.SCAPULO_THORACIC) == []
+    with pytest.raises(ValueError):
+        pair_series(wide, JointType.GLENO_HUMERAL)
+
+    derived = derive_joint_series(wide, JointType.THORACO_HUMERAL)
+    assert derived.shape[0] == 2
+    assert (derived["joint"] == "thoracohumeral").all()
+    assert (derived["transform"] == "composition").all()
+    assert (derived["row_id"] == -1).all()
+    assert (derived["proximal_row_id"] == 0).all()
+    assert (derived["distal_row_id"] == 1).all()
+    np.testing.assert_almost_equal(derived["confidence"].to_numpy(dtype=float), 0.25)
+
+
+def test_derived_data():
+    sp = load_subdataset(name="Ludewig et al.", outputs=("corrected",))
+
+    derived = sp.derived_data_wide(JointType.THORACO_HUMERAL)
+    assert derived["row_id"].nunique() == 3
+    assert sp.derived_data_wide(JointType.THORACO_HUMERAL) is derived
+    assert sp.derived_data_values(JointType.THORACO_HUMERAL).shape[0] == 3 * derived.shape[0]
+
+    # the thoracohumeral elevation rebuilt from the scapula and the humerus follows the humerothoracic angle
+    elevation_error = np.abs(derived["value_dof2"] - derived["humerothoracic_angle"]).to_numpy(dtype=float)
+    assert np.nanmean(elevation_error) < 5
+
+    assert sp.derived_data_wide(JointType.SCAPULO_THORACIC)["row_id"].nunique() == 3
@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+
+from spartacus import DataFolder, DataFrameInterface, EulerSequence, JointType, load_subdataset
+from spartacus.src.corrections.angle_conversion_callbacks import (
+    from_euler_angles_to_rotation_matrices,
+    quaternions_to_rotation_matrices,
+)
+from spartacus.src.load import check_outputs
+
+
+def test_check_outputs():
+    check_outputs(("raw",))
+    check_outputs(("corrected",))
+    check_outputs(("both",))
+    check_outputs(("raw", "corrected"))
+
+    with pytest.raises(ValueError, match="outputs must be a tuple of values among"):
+        check_outputs(("uncorrected",))
+    with pytest.raises(ValueError, match="outputs must be a tuple of values among"):
+        check_outputs("corrected")
+
+
+def test_lazy_outputs():
+    sp = load_subdataset(name=DataFolder.CHU_2012, outputs=("corrected",))
+    assert sp._confident_data_wide is None
+    assert sp._corrected_confident_data_wide is not None
+    assert sp._corrected_confident_data_values is None
+
+    # the uncorrected series are computed on first access
+    raw = sp.confident_data_values
+    assert sp._confident_data_wide is not None
+    assert raw.shape == sp.corrected_confident_data_values.shape
+    assert raw.shape[0] == 3 * sp.confident_data_wide.shape[0]
+
+
+def test_import_confident_data_returns_long():
+    sp = load_subdataset(name=DataFolder.CHU_2012, outputs=("corrected",))
+    corrected = sp.import_confident_data(outputs=("corrected",))
+    assert corrected is sp.corrected_confident_data_values
+    assert "value" in corrected.columns
+
+    raw = sp.import_confident_data(outputs=("raw",))
+    assert raw is sp.confident_data_values
+    assert sp._corrected_confident_data_wide is None
+
+
+def test_translation_outputs():
+    sp = load_subdataset(name=DataFolder.KIJIMA_2015)
+
+    translations = sp.corrected_confident_translation_data_values
+    assert translations.shape[0] == 24
+    assert (translations["unit"] == "mm").all()
+    assert translations["biomechanical_dof"].unique().tolist() == [
+        "anterior(+)-posterior(-) translation",
+        "superior(+)-inferior(-) translation",
+        "lateral(+)-medial(-) translation",
+    ]
+
+    # only the superior translation is provided, the scapula y-axis is already infero-superior
+    raw = sp.confident_translation_data_wide
+    corrected = sp.corrected_confident_translation_data_wide
+    np.testing.assert_almost_equal(corrected["value_dof2"].to_numpy(dtype=float)[0], -0.99457)
+    np.testing.assert_almost_equal(
+        corrected["value_dof2"].to_numpy(dtype=float), raw["value_dof2"].to_numpy(dtype=float)
+    )
+    assert corrected["value_dof1"].isna().all()
+    assert corrected["value_dof3"].isna().all()
+
+    dfi = DataFrameInterface(translations)
+    assert dfi.has_only_translational_data
+    assert dfi.translational_interface.df.shape == translations.shape
+    assert DataFrameInterface(sp.corrected_confident_data_values).has_only_rotational_data
+
+
+def test_transform_column():
+    sp = load_subdataset(name=DataFolder.CHU_2012)
+
+    # the uncorrected series are never transformed
+    assert (sp.confident_data_values["transform"] == "identity").all()
+    transforms = sp.corrected_confident_data_wide.groupby("row_id")["transform"].unique()
+    for row_data in sp.rows:
+        assert transforms[row_data.row.name].tolist() == [row_data.rotation_correction_plan.value]
+
+
+def test_orientation_outputs():
+    sp = load_subdataset(name=DataFolder.CHU_2012, outputs=("corrected",))
+
+    wide = sp.corrected_confident_data_wide
+    rotation_matrices = sp.corrected_rotation_matrices
+    quaternions = sp.corrected_quaternions
+    assert rotation_matrices.shape == (wide.shape[0], 3, 3)
+    assert quaternions.shape == (wide.shape[0], 4)
+    assert rotation_matrices.flags["C_CONTIGUOUS"]
+
+    # the matrices are the ones of the corrected angles
+    for row_data in sp.rows:
+        assert row_data.corrected_rotation_matrices.shape[0] == row_data.data.shape[0]
+    sequence = EulerSequence.isb_from_joint_type(JointType.from_string(wide["joint"].iloc[0])).value
+    is_joint = (wide["joint"] == wide["joint"].iloc[0]).to_numpy()
+    np.testing.assert_almost_equal(
+        from_euler_angles_to_rotation_matrices(
+            sequence, np.deg2rad(wide.loc[is_joint, ["value_dof1", "value_dof2", "value_dof3"]].to_numpy(dtype=float))
+        ),
+        rotation_matrices[is_joint],
+    )
+    np.testing.assert_almost_equal(quaternions_to_rotation_matrices(quaternions), rotation_matrices)
+
+
+def test_import_confident_series():
+    sp = load_subdataset(name=DataFolder.CHU_2012, outputs=("corrected",))
+    sp.import_confident_series(outputs=("raw",))
+    assert sp._confident_data_wide is not None
+    assert sp._corrected_confident_data_wide is None
+
+    # the long layout is built on first access only
+    assert sp._confident_data_values is None
+    assert sp.confident_data_values.shape[0] == 3 * sp.confident_data_wide.shape[0]
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from spartacus.src.load_data import CsvCache
+
+
+def write_csv(path, nb_lines: int):
+    np.savetxt(path, np.stack([np.arange(nb_lines), np.arange(nb_lines) * 0.5], axis=1), delimiter=",")
+
+
+def test_csv_cache(tmp_path):
+    cache = CsvCache()
+    csv_filename = tmp_path / "GH_elevation.csv"
+    write_csv(csv_filename, 5)
+
+    array = cache.get(csv_filename)
+    assert array.shape == (5, 2)
+    assert cache.misses == 1 and cache.hits == 0
+
+    # the same buffer is shared and read-only
+    assert cache.get(str(csv_filename)) is array
+    assert cache.misses == 1 and cache.hits == 1
+    with pytest.raises(ValueError):
+        array[0, 0] = 1
+
+    # an edited file is read again
+    write_csv(csv_filename, 6)
+    assert cache.get(csv_filename).shape == (6, 2)
+    assert cache.misses == 2
+
+    cache.reset_stats()
+    assert cache.report().startswith("CSV cache: 0 hits, 0 misses")
+
+
+def test_csv_cache_eviction(tmp_path):
+    cache = CsvCache(max_bytes=2 * 10 * 2 * 8)
+    csv_filenames = [tmp_path / f"dof{i}.csv" for i in range(3)]
+    for csv_filename in csv_filenames:
+        write_csv(csv_filename, 10)
+
+    cache.get(csv_filenames[0])
+    cache.get(csv_filenames[1])
+    cache.get(csv_filenames[0])  # dof1 becomes the least recently used
+    cache.get(csv_filenames[2])
+    assert len(cache.arrays) == 2
+    assert cache.nbytes == 2 * 10 * 2 * 8
+
+    cache.get(csv_filenames[0])
+    assert cache.hits == 2
+    cache.get(csv_filenames[1])
+    assert cache.misses == 4
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from spartacus import load_subdataset
+from spartacus.src.angle_series import VALUE_COLUMNS
+from spartacus.src.monte_carlo import UNCERTAINTY_COLUMNS, perturb_rotation_matrix, random_small_rotations
+
+
+def test_random_small_rotations():
+    rotations = random_small_rotations(np.random.default_rng(0), 20000, angular_sd=3.0)
+
+    assert rotations.shape == (20000, 3, 3)
+    np.testing.assert_almost_equal(rotations @ np.swapaxes(rotations, 1, 2), np.tile(np.eye(3), (20000, 1, 1)))
+    np.testing.assert_almost_equal(np.linalg.det(rotations), np.ones(20000))
+
+    # the rotation vectors have three independent components
+    angles = np.arccos(np.clip((np.trace(rotations, axis1=1, axis2=2) - 1) / 2, -1, 1))
+    np.testing.assert_almost_equal(np.rad2deg(np.sqrt((angles**2).mean() / 3)), 3.0, decimal=1)
+
+    np.testing.assert_almost_equal(
+        random_small_rotations(np.random.default_rng(0), 5, 0.0), np.tile(np.eye(3), (5, 1, 1))
+    )
+
+
+def test_perturb_rotation_matrix():
+    matrix = random_small_rotations(np.random.default_rng(1), 1, 60.0)[0]
+    draws = perturb_rotation_matrix(matrix, np.random.default_rng(0), 1000, angular_sd=2.0)
+
+    np.testing.assert_almost_equal(draws @ np.swapaxes(draws, 1, 2), np.tile(np.eye(3), (1000, 1, 1)))
+    np.testing.assert_almost_equal(draws.mean(axis=0), matrix, decimal=2)
+
+
+def test_correction_uncertainty():
+    sp = load_subdataset(name="Ludewig et al.", outputs=("corrected",))
+    corrected = sp.corrected_confident_data_wide
+
+    uncertainty = sp.correction_uncertainty(nb_draws=100, angular_sd=2.0, seed=3)
+    assert uncertainty.shape[0] == corrected.shape[0]
+    np.testing.assert_equal(uncertainty[VALUE_COLUMNS].to_numpy(), corrected[VALUE_COLUMNS].to_numpy())
+
+    sd = uncertainty[UNCERTAINTY_COLUMNS[:3]].to_numpy()
+    lower = uncertainty[UNCERTAINTY_COLUMNS[3:6]].to_numpy()
+    upper = uncertainty[UNCERTAINTY_COLUMNS[6:]].to_numpy()
+    # only the rows corrected with a Kolz matrix are uncertain
+    is_kolz = np.concatenate(
+        [
+            np.full(
+                row_data.data.shape[0],
+                row_data.parent_corrections is not None or row_data.child_corrections is not None,
+            )
+            for row_data in sp.rows
+            if row_data.usable_rotation_data and row_data.data is not None
+        ]
+    )
+    assert is_kolz.any()
+    assert np.all(sd[is_kolz] > 0)
+    np.testing.assert_equal(sd[~is_kolz], 0)
+    assert np.all(lower <= upper)
+    np.testing.assert_almost_equal(np.median(sd[is_kolz], axis=0), [2, 2, 2], decimal=0)
+
+    again = sp.correction_uncertainty(nb_draws=100, angular_sd=2.0, seed=3)
+    np.testing.assert_equal(again[UNCERTAINTY_COLUMNS].to_numpy(), uncertainty[UNCERTAINTY_COLUMNS].to_numpy())
+
+    # without perturbation the bands collapse on the corrected angles
+    exact = sp.correction_uncertainty(nb_draws=10, angular_sd=0.0)
+    np.testing.assert_almost_equal(exact[UNCERTAINTY_COLUMNS[:3]].to_numpy(), 0)
+    np.testing.assert_almost_equal(exact[UNCERTAINTY_COLUMNS[3:6]].to_numpy(), corrected[VALUE_COLUMNS].to_numpy())
+
+    with pytest.raises(ValueError):
+        sp.correction_uncertainty(nb_draws=10, confidence_level=1.5)
+
+
+def test_correction_uncertainty_without_kolz_correction():
+    sp = load_subdataset(name="Begon et al.", outputs=("corrected",))
+    uncertainty = sp.correction_uncertainty(nb_draws=10)
+
+    np.testing.assert_equal(uncertainty[UNCERTAINTY_COLUMNS[:3]].to_numpy(), 0)
+    np.testing.assert_equal(uncertainty[UNCERTAINTY_COLUMNS[6:]].to_numpy(), uncertainty[VALUE_COLUMNS].to_numpy())
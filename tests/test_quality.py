@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from spartacus import load_subdataset
+from spartacus.src.corrections.angle_conversion_callbacks import from_euler_angles_to_rotation_matrices
+from spartacus.src.quality import QUALITY_COLUMNS, QUALITY_SUMMARY_COLUMNS, quality_summary, sample_quality
+
+from .utils import TestUtils
+
+
+def test_sample_quality():
+    elevation = np.linspace(1, 100, 12)
+    values = np.stack([np.full(12, 30.0), elevation, np.full(12, -20.0)], axis=1)
+    rotation_matrices = from_euler_angles_to_rotation_matrices("yxy", np.deg2rad(values))
+    # a half turn of the first angle only, as unwrapping with a period of 180 degrees would do
+    values[6, 0] += 180
+    values[8, :] = np.nan
+    rotation_matrices[8] = np.nan
+
+    translation = TestUtils.wide_series("glenohumeral", 1, elevation[:2], np.zeros((2, 3)))
+    translation["unit"] = "mm"
+    wide = pd.concat([TestUtils.wide_series("glenohumeral", 0, elevation, values), translation], ignore_index=True)
+    rotation_matrices = np.concatenate((rotation_matrices, np.tile(np.eye(3), (2, 1, 1))))
+
+    assessed = sample_quality(wide, rotation_matrices, singularity_tolerance=10)
+
+    assert list(assessed.columns[-2:]) == QUALITY_COLUMNS
+    np.testing.assert_almost_equal(assessed["conditioning"].to_numpy()[:3], np.sin(np.deg2rad(elevation[:3])))
+    assert (
+        assessed["quality"].tolist()
+        == ["near_singular"] + ["good"] * 5 + ["half_turn", "good", "missing"] + ["good"] * 3 + [None] * 2
+    )
+
+    # without the rotation matrices, the half turns go unnoticed
+    assert (sample_quality(wide)["quality"] == "half_turn").sum() == 0
+
+    summary = quality_summary(assessed)
+    assert list(summary.columns) == QUALITY_SUMMARY_COLUMNS
+    assert summary.shape[0] == 1
+    assert summary["euler_sequence"].iloc[0] == "yxy"
+    assert summary[["nb_samples", "nb_near_singular", "nb_half_turn", "nb_missing"]].iloc[0].tolist() == [12, 1, 1, 1]
+    np.testing.assert_almost_equal(summary["min_lock_distance"].iloc[0], elevation[0])
+    np.testing.assert_almost_equal(summary["flagged_fraction"].iloc[0], 3 / 12)
+
+    with pytest.raises(ValueError):
+        sample_quality(wide, rotation_matrices[1:])
+
+
+def test_quality():
+    sp = load_subdataset(name="Ludewig et al.", outputs=("corrected",))
+
+    assessed = sp.quality()
+
+    assert sp.quality() is assessed
+    assert assessed.shape[0] == sp.corrected_confident_data_wide.shape[0]
+    assert (assessed["quality"] != "half_turn").all()
+    summary = sp.quality_summary()
+    assert summary["row_id"].tolist() == list(pd.unique(sp.corrected_confident_data_wide["row_id"]))
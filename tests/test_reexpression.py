@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from spartacus import load_subdataset
+from spartacus.src.corrections.angle_conversion_callbacks import (
+    euler_conditioning,
+    from_euler_angles_to_rotation_matrices,
+)
+from spartacus.src.enums import EulerSequence, JointType
+from spartacus.src.reexpression import isb_rotation_series, reexpress_rotation_series
+
+from .utils import TestUtils
+
+
+def test_euler_conditioning():
+    angles = np.deg2rad([[10, 0, 10], [10, 90, 10], [10, 30, 10]])
+
+    np.testing.assert_almost_equal(euler_conditioning(angles, EulerSequence.YXY), [0, 1, 0.5])
+    np.testing.assert_almost_equal(euler_conditioning(angles, EulerSequence.YXZ), [1, 0, np.sqrt(3) / 2])
+
+
+def test_reexpress_rotation_series():
+    elevation = np.linspace(1, 120, 60)
+    values = np.stack([np.full(60, 30.0), elevation, np.linspace(-20, 40, 60)], axis=1)
+    wide = pd.concat(
+        [
+            TestUtils.wide_series("glenohumeral", 0, elevation, values),
+            TestUtils.wide_series("scapulothoracic", 1, elevation, values / 4),
+        ],
+        ignore_index=True,
+    )
+    rotation_matrices = np.concatenate(
+        (
+            from_euler_angles_to_rotation_matrices("yxy", np.deg2rad(values)),
+            from_euler_angles_to_rotation_matrices("yxz", np.deg2rad(values / 4)),
+        )
+    )
+
+    reexpressed = reexpress_rotation_series(wide, rotation_matrices, {JointType.GLENO_HUMERAL: EulerSequence.XZY})
+
+    glenohumeral = reexpressed[reexpressed["joint"] == "glenohumeral"]
+    angles = np.deg2rad(glenohumeral[["value_dof1", "value_dof2", "value_dof3"]].to_numpy(dtype=float))
+    np.testing.assert_almost_equal(from_euler_angles_to_rotation_matrices("xzy", angles), rotation_matrices[:60])
+    assert np.abs(np.diff(angles, axis=0)).max() < np.deg2rad(20)
+    assert (glenohumeral["euler_sequence"] == "xzy").all()
+    assert glenohumeral["biomechanical_dof1"].unique().tolist() == ["x"]
+
+    # the other joints are kept in their ISB sequence
+    scapulothoracic = reexpressed[reexpressed["joint"] == "scapulothoracic"]
+    np.testing.assert_almost_equal(scapulothoracic[["value_dof1", "value_dof2", "value_dof3"]].to_numpy(), values / 4)
+    assert (scapulothoracic["euler_sequence"] == "yxz").all()
+
+    # the low elevations are singular in yxy
+    reexpressed = reexpress_rotation_series(wide, rotation_matrices, {}, singularity_tolerance=5)
+    is_singular = reexpressed.loc[reexpressed["joint"] == "glenohumeral", "singular"].to_numpy()
+    np.testing.assert_equal(is_singular, elevation < 5)
+
+    with pytest.raises(ValueError):
+        reexpress_rotation_series(wide, rotation_matrices[1:], {})
+    with pytest.raises(ValueError):
+        reexpress_rotation_series(wide, rotation_matrices, {"elbow": "xzy"})
+
+
+def test_reexpress():
+    sp = load_subdataset(name="Ludewig et al.", outputs=("corrected",))
+
+    reexpressed = sp.reexpress({"glenohumeral": "zxy"})
+
+    assert sp.reexpress({"glenohumeral": "zxy"}) is reexpressed
+    assert reexpressed.shape[0] == sp.corrected_confident_data_wide.shape[0]
+    is_glenohumeral = (reexpressed["joint"] == "glenohumeral").to_numpy()
+    angles = np.deg2rad(reexpressed.loc[is_glenohumeral, ["value_dof1", "value_dof2", "value_dof3"]].to_numpy(float))
+    np.testing.assert_almost_equal(
+        from_euler_angles_to_rotation_matrices("zxy", angles), sp.corrected_rotation_matrices[is_glenohumeral]
+    )
+
+
+def test_isb_rotation_series():
+    sp = load_subdataset(name="Ludewig et al.", outputs=("corrected",))
+    derived = sp.derived_data_wide(JointType.THORACO_HUMERAL)
+    averages = sp.average_rotations(joint="scapulothoracic")
+
+    # a single angle of a series shifted by a half turn, as unwrapping with a 180 degree period may do
+    wide = sp.corrected_confident_data_wide.copy()
+    is_shifted = (wide["row_id"] == wide.loc[wide["joint"] == "scapulothoracic", "row_id"].iloc[0]).to_numpy()
+    wide.loc[is_shifted, "value_dof3"] += 180
+
+    rebuilt = isb_rotation_series(wide, sp.corrected_rotation_matrices)
+    assert rebuilt.shape[0] == wide.shape[0]
+    for joint in pd.unique(rebuilt["joint"]):
+        is_joint = (rebuilt["joint"] == joint).to_numpy()
+        sequence = EulerSequence.isb_from_joint_type(JointType.from_string(joint)).value
+        angles = np.deg2rad(rebuilt.loc[is_joint, ["value_dof1", "value_dof2", "value_dof3"]].to_numpy(dtype=float))
+        np.testing.assert_almost_equal(
+            from_euler_angles_to_rotation_matrices(sequence, angles), sp.corrected_rotation_matrices[is_joint]
+        )
+    with pytest.raises(ValueError):
+        isb_rotation_series(wide, sp.corrected_rotation_matrices[1:])
+
+    # the composed and averaged rotations are the ones of the corrected rotation matrices
+    sp._corrected_confident_data_wide = wide
+    sp._isb_rotation_data_wide = None
+    sp._derived_data_wide = {}
+    pd.testing.assert_frame_equal(sp.derived_data_wide(JointType.THORACO_HUMERAL), derived)
+    pd.testing.assert_frame_equal(sp.average_rotations(joint="scapulothoracic"), averages)
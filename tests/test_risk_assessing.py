@@ -0,0 +1,50 @@
+from itertools import product
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from spartacus.src.risk_assessing import (
+    CUMULATIVE_RISK_COLUMN,
+    RISK_CATEGORIES,
+    cumulative_risk_grid,
+    risk_combinations,
+    write_risk_combinations,
+)
+
+
+def test_risk_combinations():
+    combinations = risk_combinations()
+
+    expected = sorted(
+        ((comb, sum(option[1] for option in comb)) for comb in product(*(c["options"] for c in RISK_CATEGORIES))),
+        key=lambda x: x[1],
+    )
+    assert combinations.shape[0] == len(expected)
+    assert list(combinations.columns) == [c["name"] for c in RISK_CATEGORIES] + [CUMULATIVE_RISK_COLUMN]
+    assert combinations[CUMULATIVE_RISK_COLUMN].tolist() == [risk for _, risk in expected]
+    assert combinations.iloc[:, :-1].values.tolist() == [[option[0] for option in comb] for comb, _ in expected]
+
+    assert cumulative_risk_grid().shape == (2, 2, 3, 4, 4)
+    assert risk_combinations(sort=False)[CUMULATIVE_RISK_COLUMN].tolist() == cumulative_risk_grid().ravel().tolist()
+
+
+def test_write_risk_combinations(tmp_path):
+    categories = [{"name": f"category {i}", "options": [("a", 0), ("b", i), ("c", 2 * i)]} for i in range(6)]
+
+    file_path = write_risk_combinations(tmp_path / "risk_combinations.csv", categories=categories, chunk_size=50)
+
+    written = pd.read_csv(file_path)
+    pd.testing.assert_frame_equal(written, risk_combinations(categories), check_dtype=False)
+    assert np.all(np.diff(written[CUMULATIVE_RISK_COLUMN]) >= 0)
+
+    with pytest.raises(ValueError):
+        write_risk_combinations(tmp_path / "risk_combinations.txt")
+
+
+def test_write_risk_combinations_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    file_path = write_risk_combinations(tmp_path / "risk_combinations.parquet", chunk_size=10)
+
+    pd.testing.assert_frame_equal(pd.read_parquet(file_path), risk_combinations())
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from spartacus import load_subdataset
+from spartacus.src.corrections.angle_conversion_callbacks import (
+    from_euler_angles_to_rotation_matrices,
+    rotation_matrices_2_euler_angles,
+    rotation_matrices_to_quaternions,
+)
+from spartacus.src.enums import EulerSequence, JointType
+from spartacus.src.rotation_average import (
+    AVERAGE_COLUMNS,
+    average_rotation_series,
+    chordal_mean,
+    karcher_mean,
+)
+
+
+def test_means_of_a_symmetric_set():
+    # rotations of +/- 30 degrees about z around a common rotation
+    center = from_euler_angles_to_rotation_matrices("yxz", np.array([[0.3, 0.2, 0.1]]))
+    spread = from_euler_angles_to_rotation_matrices("zxy", np.array([[np.pi / 6, 0, 0], [-np.pi / 6, 0, 0]]))
+    quaternions = rotation_matrices_to_quaternions(center @ spread)[:, np.newaxis, :]
+    # the sign of a quaternion does not change the rotation
+    quaternions[1] *= -1
+
+    expected = rotation_matrices_to_quaternions(center)
+    for mean in (chordal_mean, karcher_mean):
+        np.testing.assert_almost_equal(mean(quaternions, np.ones(2)), expected)
+
+
+def test_karcher_mean():
+    rng = np.random.default_rng(8)
+    angles = rng.normal(0, 0.6, (40, 3))
+    quaternions = rotation_matrices_to_quaternions(from_euler_angles_to_rotation_matrices("yxy", angles))
+
+    mean = karcher_mean(quaternions[:, np.newaxis, :], np.ones(40))[0]
+
+    # the residual rotation vectors of the geodesic mean sum to zero
+    w, x, y, z = mean
+    conjugate = np.array([w, -x, -y, -z])
+    residuals = []
+    for quaternion in quaternions:
+        pw, px, py, pz = conjugate
+        qw, qx, qy, qz = quaternion
+        difference = np.array(
+            [
+                pw * qw - px * qx - py * qy - pz * qz,
+                pw * qx + px * qw + py * qz - pz * qy,
+                pw * qy - px * qz + py * qw + pz * qx,
+                pw * qz + px * qy - py * qx + pz * qw,
+            ]
+        )
+        difference *= np.sign(difference[0])
+        norm = np.linalg.norm(difference[1:])
+        residuals.append(2 * np.arctan2(norm, difference[0]) * difference[1:] / norm)
+    np.testing.assert_almost_equal(np.mean(residuals, axis=0), 0)
+
+
+def test_average_rotation_series():
+    rng = np.random.default_rng(9)
+    # glenohumeral rotations close to the gimbal lock, the first and third angles of the series disagree a lot
+    values = np.stack([rng.normal(0, 40, (30, 4)), rng.normal(5, 2, (30, 4)), rng.normal(0, 40, (30, 4))], axis=2)
+    values[2, 1] = np.nan
+
+    mean, geodesic_sd = average_rotation_series(values, JointType.GLENO_HUMERAL, method="chordal")
+
+    assert mean.shape == (4, 3)
+    assert geodesic_sd.shape == (4,)
+    # the elevation of the mean rotation stays close to the elevations
+    assert np.all(np.abs(mean[:, 1] - 5) < 5)
+    # the angles describe the mean quaternion
+    matrices = from_euler_angles_to_rotation_matrices("yxy", np.deg2rad(values.reshape(-1, 3))).reshape(30, 4, 3, 3)
+    quaternions = rotation_matrices_to_quaternions(matrices.reshape(-1, 3, 3)).reshape(30, 4, 4)
+    expected = chordal_mean(quaternions, np.ones(30))
+    np.testing.assert_almost_equal(
+        rotation_matrices_to_quaternions(from_euler_angles_to_rotation_matrices("yxy", np.deg2rad(mean))), expected
+    )
+    np.testing.assert_almost_equal(
+        rotation_matrices_2_euler_angles(
+            from_euler_angles_to_rotation_matrices("yxy", np.deg2rad(mean)), EulerSequence.YXY
+        ),
+        np.deg2rad(mean),
+    )
+
+    with pytest.raises(ValueError):
+        average_rotation_series(values, JointType.GLENO_HUMERAL, method="euclidean")
+
+
+def test_average_rotations():
+    sp = load_subdataset(name="Ludewig et al.", outputs=("corrected",))
+
+    averages = sp.average_rotations(joint="scapulothoracic", humeral_motion="frontal elevation")
+
+    assert list(averages.columns) == AVERAGE_COLUMNS
+    # a single series is its own mean
+    series = sp.corrected_confident_data_wide
+    series = series[(series["joint"] == "scapulothoracic") & (series["humeral_motion"] == "frontal elevation")]
+    on_grid = averages[averages["humerothoracic_angle"].isin(series["humerothoracic_angle"])]
+    expected = series.set_index("humerothoracic_angle").loc[on_grid["humerothoracic_angle"]]
+    np.testing.assert_almost_equal(
+        on_grid[["value_dof1", "value_dof2", "value_dof3"]].to_numpy(dtype=float),
+        expected[["value_dof1", "value_dof2", "value_dof3"]].to_numpy(dtype=float),
+    )
+    np.testing.assert_almost_equal(on_grid["geodesic_sd"].to_numpy(dtype=float), 0)
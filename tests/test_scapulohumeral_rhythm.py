@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+
+from spartacus import load_subdataset
+from spartacus.src.scapulohumeral_rhythm import RHYTHM_COLUMNS, scapulohumeral_rhythm
+
+from .utils import TestUtils
+
+
+def test_scapulohumeral_rhythm():
+    humerothoracic_angle = np.arange(20.0, 120.0, 10.0)
+    scapulothoracic_values = np.zeros((10, 3))
+    scapulothoracic_values[:, 1] = -humerothoracic_angle / 3
+    glenohumeral_values = np.zeros((10, 3))
+    glenohumeral_values[:, 1] = 2 * humerothoracic_angle / 3
+    wide = pd.concat(
+        [
+            TestUtils.wide_series("scapulothoracic", 0, humerothoracic_angle, scapulothoracic_values),
+            # the glenohumeral series is not sampled on every angle
+            TestUtils.wide_series("glenohumeral", 1, humerothoracic_angle[::2], glenohumeral_values[::2]),
+            TestUtils.wide_series("scapulothoracic", 2, humerothoracic_angle, scapulothoracic_values, shoulder_id=2.0),
+            TestUtils.wide_series("glenohumeral", 3, humerothoracic_angle, 2 * glenohumeral_values, shoulder_id=2.0),
+        ],
+        ignore_index=True,
+    )
+
+    rhythm = scapulohumeral_rhythm(wide)
+
+    assert list(rhythm.columns) == RHYTHM_COLUMNS
+    assert rhythm.shape[0] == 15
+    np.testing.assert_almost_equal(rhythm["humerothoracic_angle"].to_numpy()[:5], humerothoracic_angle[::2])
+    np.testing.assert_almost_equal(
+        rhythm["scapulothoracic_upward_rotation"].to_numpy()[:5], humerothoracic_angle[::2] / 3
+    )
+    np.testing.assert_almost_equal(rhythm["rhythm"].to_numpy(dtype=float), [2] * 5 + [4] * 10)
+    np.testing.assert_almost_equal(rhythm["instantaneous_rhythm"].to_numpy(dtype=float), [2] * 5 + [4] * 10)
+    np.testing.assert_almost_equal(
+        rhythm["glenohumeral_contribution"].to_numpy(dtype=float), [2 / 3] * 5 + [4 / 3] * 10
+    )
+    np.testing.assert_almost_equal(rhythm["scapulothoracic_contribution"].to_numpy(dtype=float), 1 / 3)
+    np.testing.assert_almost_equal(rhythm["confidence"].to_numpy(dtype=float), 0.25)
+    assert (rhythm["glenohumeral_row_id"].to_numpy()[:5] == 1).all()
+
+    assert scapulohumeral_rhythm(wide[wide["joint"] == "glenohumeral"]).shape == (0, len(RHYTHM_COLUMNS))
+
+
+def test_scapulohumeral_rhythm_of_an_article():
+    sp = load_subdataset(name="Ludewig et al.", outputs=("corrected",))
+
+    rhythm = sp.scapulohumeral_rhythm()
+
+    assert rhythm["scapulothoracic_row_id"].nunique() == 3
+    # the glenohumeral joint contributes more than the scapula to the humeral elevation
+    assert np.nanmedian(rhythm["rhythm"].to_numpy(dtype=float)) > 1
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from spartacus import load_subdataset
+from spartacus.src.confidence import risk_flags, score_confidence
+from spartacus.src.corridor import compute_corridors
+from spartacus.src.sensitivity import (
+    COEFFICIENT_NAMES,
+    DEFAULT_COEFFICIENT_VECTOR,
+    SWEEP_COLUMNS,
+    coefficient_grid,
+    risk_indicators,
+    sweep_confidence,
+    weighted_means,
+)
+
+
+def test_coefficient_grid():
+    grid = coefficient_grid({"proximal_rotation_label": (0.5, 0.7, 0.9), "non_isb_sequence": (0.25, 1.0)})
+
+    assert grid.shape == (6, len(COEFFICIENT_NAMES))
+    np.testing.assert_equal(grid[:, 0], [0.5, 0.5, 0.7, 0.7, 0.9, 0.9])
+    np.testing.assert_equal(grid[:, -1], [0.25, 1.0] * 3)
+    np.testing.assert_equal(grid[:, 1:-1], np.tile(DEFAULT_COEFFICIENT_VECTOR[1:-1], (6, 1)))
+
+    with pytest.raises(ValueError):
+        coefficient_grid({"elbow": (0.5,)})
+
+
+def test_sweep_confidence():
+    sp = load_subdataset(name="Begon et al.", outputs=("corrected",))
+    flags = risk_flags(sp.confident_dataframe)
+    coefficients = np.random.default_rng(0).uniform(0.1, 1, size=(4, len(COEFFICIENT_NAMES)))
+
+    for type_risk in ("rotation", "displacement"):
+        confidences = sweep_confidence(risk_indicators(flags, type_risk), coefficients)
+        assert confidences.shape == (flags.shape[0], 4)
+        for k in range(4):
+            expected = score_confidence(flags, type_risk, coefficients[k, :-1].reshape(2, 2, 3))
+            if type_risk == "rotation":
+                expected *= np.where(flags["is_euler_sequence_isb"], 1, coefficients[k, -1]) / np.where(
+                    flags["is_euler_sequence_isb"], 1, DEFAULT_COEFFICIENT_VECTOR[-1]
+                )
+            np.testing.assert_almost_equal(confidences[:, k], expected)
+
+    with pytest.raises(ValueError):
+        sweep_confidence(risk_indicators(flags), np.zeros((1, len(COEFFICIENT_NAMES))))
+
+
+def test_weighted_means():
+    values = np.array([[[1.0, 2, 3]], [[3.0, np.nan, 5]]])
+    weights = np.array([[1.0, 1.0], [1.0, 3.0]])
+
+    means = weighted_means(values, weights)
+
+    np.testing.assert_almost_equal(means, [[[2, 2, 4]], [[2.5, 2, 4.5]]])
+
+
+def test_sensitivity_sweep():
+    sp = load_subdataset(name="Begon et al.", outputs=("corrected",))
+    coefficients = coefficient_grid({"distal_rotation_origin": (0.2, 0.9), "non_isb_sequence": (0.2, 0.5)})
+
+    sweep = sp.sensitivity_sweep(coefficients, joint="glenohumeral", grid=np.arange(0, 181, 10.0))
+
+    assert list(sweep.columns) == SWEEP_COLUMNS
+    corridors = compute_corridors(
+        sp.corrected_confident_data_wide[sp.corrected_confident_data_wide["joint"] == "glenohumeral"],
+        grid=np.arange(0, 181, 10.0),
+        weighted=True,
+    )
+    np.testing.assert_almost_equal(sweep["mean"].to_numpy(float), corridors["mean"].to_numpy(float))
+    is_covered = sweep["nb_series"] > 0
+    assert (sweep.loc[is_covered, "sweep_min"] <= sweep.loc[is_covered, "sweep_max"]).all()
+    assert (sweep.loc[is_covered, "max_shift"] >= 0).all()
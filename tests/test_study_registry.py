@@ -0,0 +1,100 @@
+import json
+
+import numpy as np
+import pytest
+
+from spartacus.src.dataset_root import DatasetRoot
+from spartacus.src.study_registry import (
+    MANIFEST_FILENAME,
+    REGISTRY_CACHE_FILENAME,
+    STUDY_KEYS,
+    StudyRegistry,
+    write_manifest,
+)
+from spartacus.src.synthetic import generate_synthetic_dataset, synthetic_author
+
+
+def test_package_study_registry():
+    registry = DatasetRoot().registry
+
+    begon = registry.study("#1_Begon_et_al")
+    assert list(begon) == STUDY_KEYS
+    assert begon["author"] == "Begon et al."
+    assert begon["year"] == 2014
+    assert begon["millimeters_factor"] == 1000
+    assert not begon["has_manifest"]
+    assert registry.folder_from_author("Teece et al.") == "#19_Teece_et_al"
+    assert registry.folder_path("#19_Teece_et_al").is_dir()
+
+    with pytest.raises(ValueError):
+        registry.study("#99_Nobody_et_al")
+    with pytest.raises(ValueError):
+        registry.folder_from_author("Nobody et al.")
+
+
+def test_manifest_study_registry(tmp_path):
+    generate_synthetic_dataset(tmp_path, nb_studies=2, rows_per_study=2, nb_samples=5)
+    root = DatasetRoot(tmp_path)
+
+    study = root.registry.study("#S1_Synthetic_et_al")
+    assert study["has_manifest"]
+    assert study["author"] == synthetic_author(1)
+    assert root.millimeters_factor("#S1_Synthetic_et_al") == 1
+    assert len(study["files"]) > 0
+    assert root.registry.verify("#S1_Synthetic_et_al") == []
+
+    edited_file = sorted(study["files"])[0]
+    np.savetxt(tmp_path / "data" / "#S1_Synthetic_et_al" / edited_file, np.zeros((2, 2)), delimiter=",")
+    assert root.registry.verify("#S1_Synthetic_et_al") == [edited_file]
+
+
+def test_study_registry_cache(tmp_path, monkeypatch):
+    generate_synthetic_dataset(tmp_path, nb_studies=1, rows_per_study=2, nb_samples=5)
+    root = DatasetRoot(tmp_path)
+    registry = StudyRegistry(root)
+    assert (root.cache_folder / REGISTRY_CACHE_FILENAME).is_file()
+
+    def scan(self):
+        raise AssertionError("The index should be read from the cache.")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(StudyRegistry, "_scan", scan)
+        assert StudyRegistry(root).studies == registry.studies
+
+    # a new study invalidates the cache
+    new_study = tmp_path / "data" / "#S9_New_et_al"
+    new_study.mkdir()
+    np.savetxt(new_study / "series.csv", np.zeros((2, 2)), delimiter=",")
+    write_manifest(new_study, author="New et al.", year=2024, doi="10.0000/new", millimeters_factor=1000)
+
+    registry = StudyRegistry(root)
+    assert registry.folder_from_author("New et al.") == "#S9_New_et_al"
+    assert registry.study("#S9_New_et_al")["year"] == 2024
+    assert json.loads((new_study / MANIFEST_FILENAME).read_text())["millimeters_factor"] == 1000
+
+
+def test_unknown_millimeters_factor(tmp_path):
+    generate_synthetic_dataset(tmp_path, nb_studies=3, rows_per_study=2, nb_samples=5)
+    data_folder = tmp_path / "data"
+    # no manifest and unknown to DataFolder, a factor of 0 and a manifest without factor
+    (data_folder / "#S1_Synthetic_et_al" / MANIFEST_FILENAME).unlink()
+    write_manifest(data_folder / "#S2_Synthetic_et_al", author=synthetic_author(2), millimeters_factor=0)
+    manifest_path = data_folder / "#S3_Synthetic_et_al" / MANIFEST_FILENAME
+    manifest = json.loads(manifest_path.read_text())
+    del manifest["millimeters_factor"]
+    manifest_path.write_text(json.dumps(manifest))
+
+    root = DatasetRoot(tmp_path)
+    with pytest.raises(ValueError, match="is unknown"):
+        root.millimeters_factor("#S1_Synthetic_et_al")
+    with pytest.raises(ValueError, match="must be positive"):
+        root.millimeters_factor("#S2_Synthetic_et_al")
+    with pytest.raises(ValueError, match="is unknown"):
+        root.millimeters_factor("#S3_Synthetic_et_al")
+    with pytest.raises(ValueError, match="is unknown"):
+        root.millimeters_factor(str(data_folder / "#S1_Synthetic_et_al"))
+
+    write_manifest(data_folder / "#S2_Synthetic_et_al", author=synthetic_author(2), millimeters_factor=1000)
+    root = DatasetRoot(tmp_path)
+    assert root.millimeters_factor("#S2_Synthetic_et_al") == 1000
+    assert root.millimeters_factor(str(data_folder / "#S2_Synthetic_et_al")) == 1000
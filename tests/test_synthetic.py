@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from spartacus import load, load_subdataset
+from spartacus.src.synthetic import generate_synthetic_dataset, synthetic_author, template_rows, template_weights
+
+
+def test_template_weights():
+    templates = template_rows()
+    assert templates.shape[0] > 0
+
+    probabilities = template_weights(templates, {"euler_sequence": {"yxy": 3, "zxy": 1}})
+    np.testing.assert_almost_equal(probabilities.sum(), 1)
+    assert np.all(probabilities[~templates["euler_sequence"].isin(["yxy", "zxy"]).to_numpy()] == 0)
+
+    with pytest.raises(ValueError):
+        template_weights(templates, {"euler_sequence": {"abc": 1}})
+    with pytest.raises(ValueError):
+        template_weights(templates, {"elbow": {"yxy": 1}})
+
+
+def test_generate_synthetic_dataset(tmp_path):
+    dataset_csv = generate_synthetic_dataset(tmp_path, nb_studies=3, rows_per_study=8, nb_samples=20, seed=1)
+
+    dataframe = pd.read_csv(dataset_csv)
+    assert dataframe.shape[0] == 24
+    assert list(dataframe.columns) == list(template_rows().columns)
+    assert set(dataframe["dataset_authors"]) == {synthetic_author(study) for study in (1, 2, 3)}
+
+    sp = load(outputs=("corrected",), dataset_root=tmp_path)
+    assert len(sp.rows) > 0
+    wide = sp.corrected_confident_data_wide
+    assert set(wide["article"]) <= set(dataframe["dataset_authors"])
+    assert np.all(wide.groupby("row_id").size() == 20)
+
+    sp = load_subdataset(synthetic_author(2), outputs=("corrected",), dataset_root=tmp_path)
+    assert set(sp.corrected_confident_data_wide["article"]) == {synthetic_author(2)}
+
+
+def test_generate_synthetic_dataset_mix(tmp_path):
+    dataset_csv = generate_synthetic_dataset(
+        tmp_path, nb_studies=1, rows_per_study=10, nb_samples=5, mix={"euler_sequence": {"yxy": 1}}
+    )
+    assert set(pd.read_csv(dataset_csv)["euler_sequence"]) == {"yxy"}
+
+    with pytest.raises(ValueError):
+        generate_synthetic_dataset(tmp_path, mix={"euler_sequence": {"abc": 1}})
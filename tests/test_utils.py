@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+
+from spartacus.src.corrections.angle_conversion_callbacks import (
+    from_euler_angles_to_rotation_matrices,
+    from_euler_angles_to_rotation_matrix,
+    quaternions_to_rotation_matrices,
+    rotation_matrices_2_euler_angles,
+    rotation_matrix_2_euler_angles,
+    rotation_matrices_to_quaternions,
+)
+from spartacus.src.enums import EulerSequence
+from spartacus.src.utils import (
+    flip_rotations,
+    flip_rotations_batch,
+    continuous_rotations_batch,
+    gradient_batch,
+    unwrap_batch,
+    wrap_angles,
+)
+
+
+@pytest.mark.parametrize("seq", ["yxz", "yxy", "zxz", "xzy"])
+def test_flip_rotations_batch(seq):
+    angles = np.random.default_rng(0).uniform(-np.pi / 2, np.pi / 2, (20, 3))
+    flipped = flip_rotations_batch(angles, seq)
+
+    for angle, flipped_angle in zip(angles, flipped):
+        # same angles up to a full turn
+        np.testing.assert_almost_equal(flipped_angle, wrap_angles(flip_rotations(angle.copy(), seq)))
+
+    # same rotation matrices
+    np.testing.assert_almost_equal(
+        from_euler_angles_to_rotation_matrices(seq, flipped),
+        from_euler_angles_to_rotation_matrices(seq, angles),
+    )
+
+
+@pytest.mark.parametrize("seq", ["yxz", "yxy", "zxz", "xzy", "zyx"])
+def test_rotation_matrices_2_euler_angles(seq):
+    angles = np.random.default_rng(1).uniform(-np.pi / 2, np.pi / 2, (20, 3))
+    rotation_matrices = from_euler_angles_to_rotation_matrices(seq, angles)
+
+    for angle, rotation_matrix in zip(angles, rotation_matrices):
+        np.testing.assert_almost_equal(rotation_matrix, from_euler_angles_to_rotation_matrix(seq, *angle))
+
+    euler_angles = rotation_matrices_2_euler_angles(rotation_matrices, EulerSequence(seq))
+    for euler_angle, rotation_matrix in zip(euler_angles, rotation_matrices):
+        np.testing.assert_almost_equal(euler_angle, rotation_matrix_2_euler_angles(rotation_matrix, EulerSequence(seq)))
+
+
+def test_rotation_matrices_2_euler_angles_gimbal_lock():
+    angles = np.array([[0.3, 0, 0.5], [0.3, np.pi, 0.5]])
+    rotation_matrices = from_euler_angles_to_rotation_matrices("yxy", angles)
+    euler_angles = rotation_matrices_2_euler_angles(rotation_matrices, EulerSequence.YXY)
+
+    np.testing.assert_almost_equal(euler_angles[:, 2], 0)
+    np.testing.assert_almost_equal(from_euler_angles_to_rotation_matrices("yxy", euler_angles), rotation_matrices)
+
+
+def test_continuous_rotations_batch():
+    t = np.linspace(-0.5, 0.5, 41) + 0.013
+    angles = np.stack([2 * t + 0.5, t, 0.3 * t + 3.0], axis=1)
+    rotation_matrices = from_euler_angles_to_rotation_matrices("yxy", angles)
+    # the second angle goes through zero, the principal branch jumps
+    euler_angles = rotation_matrices_2_euler_angles(rotation_matrices, EulerSequence.YXY)
+    assert np.abs(np.diff(unwrap_batch(euler_angles), axis=0)).max() > 3
+
+    continuous_angles = continuous_rotations_batch(euler_angles, "yxy")
+    np.testing.assert_almost_equal(from_euler_angles_to_rotation_matrices("yxy", continuous_angles), rotation_matrices)
+    np.testing.assert_array_less(np.abs(np.diff(unwrap_batch(continuous_angles), axis=0)), 0.06)
+
+
+def test_unwrap_batch():
+    rng = np.random.default_rng(2)
+    angles = np.cumsum(rng.uniform(-100, 100, (30, 3)), axis=0) % 360 - 180
+    series_starts = np.array([0, 12, 25])
+
+    unwrapped = unwrap_batch(angles, period=360, series_starts=series_starts)
+    for start, end in zip(series_starts, [12, 25, 30]):
+        np.testing.assert_almost_equal(unwrapped[start:end], np.unwrap(angles[start:end], period=360, axis=0))
+
+    np.testing.assert_almost_equal(unwrap_batch(angles, period=360), np.unwrap(angles, period=360, axis=0))
+
+
+def test_gradient_batch():
+    rng = np.random.default_rng(3)
+    abscissa = np.concatenate((np.sort(rng.uniform(0, 90, 12)), np.sort(rng.uniform(0, 90, 13)), [45.0]))
+    values = rng.uniform(-50, 50, (26, 3))
+    series_starts = np.array([0, 12, 25])
+
+    gradient = gradient_batch(values, abscissa, series_starts=series_starts)
+    for start, end in zip(series_starts[:-1], [12, 25]):
+        expected = np.gradient(values[start:end], abscissa[start:end], axis=0, edge_order=1)
+        np.testing.assert_almost_equal(gradient[start:end], expected)
+    # a single sample cannot be differentiated
+    assert np.isnan(gradient[25]).all()
+
+    np.testing.assert_almost_equal(
+        gradient_batch(values[:12, 0], abscissa[:12]), np.gradient(values[:12, 0], abscissa[:12], edge_order=1)
+    )
+
+
+def test_rotation_matrices_to_quaternions():
+    rng = np.random.default_rng(7)
+    angles = rng.uniform(-np.pi, np.pi, (200, 3))
+    # half turns about each axis
+    angles[:3] = [[np.pi, 0, 0], [0, np.pi, 0], [0, 0, np.pi]]
+    angles[3] = np.nan
+    rotation_matrices = from_euler_angles_to_rotation_matrices("xyz", angles)
+
+    quaternions = rotation_matrices_to_quaternions(rotation_matrices)
+
+    assert np.isnan(quaternions[3]).all()
+    is_valid = ~np.isnan(angles).any(axis=1)
+    np.testing.assert_almost_equal(np.linalg.norm(quaternions[is_valid], axis=1), 1)
+    assert (quaternions[is_valid, 0] >= 0).all()
+    np.testing.assert_almost_equal(quaternions[:3, 1:], np.eye(3))
+    np.testing.assert_almost_equal(quaternions_to_rotation_matrices(quaternions[is_valid]), rotation_matrices[is_valid])
+
+    # a rotation of angle theta about z
+    quaternion = rotation_matrices_to_quaternions(
+        from_euler_angles_to_rotation_matrices("zxy", np.array([[0.5, 0, 0]]))
+    )
+    np.testing.assert_almost_equal(quaternion, [[np.cos(0.25), 0, 0, np.sin(0.25)]])
@@ -0,0 +1,97 @@
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from spartacus import load
+from spartacus.src.synthetic import generate_synthetic_dataset
+from spartacus.src.watch import DatasetWatcher
+
+
+def touch_later(file):
+    """Move the modification time of a file forward, the edits of a test being faster than the clock resolution"""
+    stat = os.stat(file)
+    os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_dataset_watcher(tmp_path):
+    dataset_csv = generate_synthetic_dataset(tmp_path, nb_studies=2, rows_per_study=4, nb_samples=10, seed=3)
+    watcher = DatasetWatcher(tmp_path)
+    assert watcher.version == 0
+    assert not watcher.step()
+
+    # a csv file changed, only the rows reading it are imported again
+    file, row_ids = next(iter(watcher.rows_of_file.items()))
+    values = np.loadtxt(file, delimiter=",")
+    values[:, 1] += 10
+    np.savetxt(file, values, delimiter=",")
+    touch_later(file)
+
+    assert watcher.step()
+    assert watcher.version == 1
+    assert len(watcher.spartacus.rows) == len(row_ids)
+    full = load(dataset_root=tmp_path)
+    pd.testing.assert_frame_equal(
+        watcher.spartacus.corrected_confident_data_wide, full.corrected_confident_data_wide, check_dtype=False
+    )
+    assert not watcher.step()
+
+    # the dataset table changed, the rows are checked again
+    pd.read_csv(dataset_csv).drop(index=0).to_csv(dataset_csv, index=False)
+    touch_later(dataset_csv)
+
+    assert watcher.step()
+    assert watcher.version == 2
+    assert len(watcher.spartacus.rows) == 0
+    full = load(dataset_root=tmp_path)
+    pd.testing.assert_frame_equal(
+        watcher.spartacus.corrected_confident_data_wide, full.corrected_confident_data_wide, check_dtype=False
+    )
+    pd.testing.assert_frame_equal(
+        pd.read_csv(watcher.dataset_root.export_folder / "corrected_confident_data.csv"),
+        full.corrected_confident_data_values,
+        check_dtype=False,
+    )
+
+
+def test_dataset_watcher_missing_file(tmp_path):
+    generate_synthetic_dataset(tmp_path, nb_studies=1, rows_per_study=4, nb_samples=10, seed=6)
+    watcher = DatasetWatcher(tmp_path)
+    series = watcher.spartacus.corrected_confident_data_wide.copy()
+
+    # a deleted csv file keeps the previous series and is retried on each step
+    file = next(file for file in watcher.rows_of_file if file.name.endswith("dof_1st_euler.csv"))
+    values = np.loadtxt(file, delimiter=",")
+    file.unlink()
+    assert not watcher.step()
+    assert not watcher.step()
+    assert watcher.version == 0
+    pd.testing.assert_frame_equal(watcher.spartacus.corrected_confident_data_wide, series)
+
+    # the file written again is rebuilt
+    np.savetxt(file, values + 1, delimiter=",")
+    assert watcher.step()
+    assert watcher.version == 1
+
+
+def test_dataset_watcher_concurrent_steps(tmp_path):
+    generate_synthetic_dataset(tmp_path, nb_studies=1, rows_per_study=4, nb_samples=10, seed=7)
+    watcher = DatasetWatcher(tmp_path)
+    file = next(iter(watcher.rows_of_file))
+    np.savetxt(file, np.loadtxt(file, delimiter=",") + 1, delimiter=",")
+    touch_later(file)
+
+    # a step running in another thread, the changes are left to it
+    with watcher._step_lock:
+        assert not watcher.step()
+    assert watcher.version == 0
+
+    # the steps of several threads rebuild the series once
+    threads = [threading.Thread(target=watcher.step) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert watcher.version == 1
+    assert not watcher.step()
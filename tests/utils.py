@@ -1,6 +1,13 @@
 from typing import Any
 from pathlib import Path
 import importlib.util
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from spartacus.src.angle_series import WIDE_COLUMNS
+from spartacus.src.dataset_root import PACKAGE_DATASET_ROOT, DatasetRoot
 
 
 class TestUtils:
@@ -8,6 +15,17 @@ class TestUtils:
     def spartacus_folder() -> str:
         return str(Path(__file__).parent / "..")
 
+    @staticmethod
+    def package_root_copy(path: Path) -> Path:
+        """A dataset root with copies of the dataset tables of the package and a link to its study folders"""
+        package_root = DatasetRoot(PACKAGE_DATASET_ROOT)
+        root = DatasetRoot(path)
+        root.dataset_folder.mkdir()
+        shutil.copy(package_root.clean_csv, root.clean_csv)
+        shutil.copy(package_root.raw_csv, root.raw_csv)
+        root.data_folder.symlink_to(package_root.data_folder, target_is_directory=True)
+        return path
+
     @staticmethod
     def load_module(path: str) -> Any:
         module_name = path.split("/")[-1].split(".")[0]
@@ -18,3 +36,25 @@ class TestUtils:
         module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(module)
         return module
+
+    @staticmethod
+    def wide_series(
+        joint: str, row_id: int, humerothoracic_angle: np.ndarray, values: np.ndarray, shoulder_id: float = 1.0
+    ) -> pd.DataFrame:
+        """A synthetic angle series in the wide layout"""
+        series = pd.DataFrame(columns=WIDE_COLUMNS)
+        series["humerothoracic_angle"] = humerothoracic_angle
+        series["value_dof1"] = values[:, 0]
+        series["value_dof2"] = values[:, 1]
+        series["value_dof3"] = values[:, 2]
+        series["article"] = "Doe et al."
+        series["joint"] = joint
+        series["humeral_motion"] = "frontal elevation"
+        series["unit"] = "rad"
+        series["confidence"] = 0.5
+        series["shoulder_id"] = shoulder_id
+        series["in_vivo"] = True
+        series["xp_mean"] = "mean"
+        series["transform"] = "identity"
+        series["row_id"] = row_id
+        return series